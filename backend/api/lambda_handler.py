@@ -1,5 +1,35 @@
-﻿from mangum import Mangum
+import json
+import time
 
-from main import app
+_init_started = time.perf_counter()
 
-handler = Mangum(app, lifespan="off")
+from mangum import Mangum  # noqa: E402
+
+from main import app  # noqa: E402
+
+_mangum = Mangum(app, lifespan="off")
+INIT_SECONDS = time.perf_counter() - _init_started
+_cold = True
+
+
+def handler(event, context):
+    global _cold
+    if not _cold:
+        return _mangum(event, context)
+
+    # One line per container: module init plus the first request (which builds boto3 clients lazily).
+    _cold = False
+    started = time.perf_counter()
+    response = _mangum(event, context)
+    print(
+        json.dumps(
+            {
+                "event": "api_cold_start",
+                "init_seconds": round(INIT_SECONDS, 4),
+                "first_request_seconds": round(time.perf_counter() - started, 4),
+                "first_request": f"{event.get('requestContext', {}).get('http', {}).get('method', '')} "
+                f"{event.get('rawPath', '')}".strip(),
+            }
+        )
+    )
+    return response
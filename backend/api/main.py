@@ -8,22 +8,46 @@ passing large files through the API.
 
 Primary responsibilities:
 - Health check endpoint for uptime probes.
-- Authenticated job creation (`POST /api/jobs`) with input validation.
+- Clerk JWT verification with cached signing keys (by `kid`) and cached
+  verified tokens, timed per request as an `auth_ms` metric.
+- Authenticated job creation (`POST /api/jobs`) with input validation, and
+  bulk creation (`POST /api/jobs:batch`) for many files in one call.
 - User bootstrap in DynamoDB (`users` table) on first authenticated activity.
-- Job read/list endpoints scoped by authenticated `clerk_user_id`.
+- Job read/list endpoints scoped by authenticated `clerk_user_id` (list is
+  newest first, cursor-paginated, optionally filtered by status; `?fields=`
+  trims items, and list rows are trimmed by default).
+- ETag / If-None-Match (304) on job status reads, backed by a short
+  in-process cache so tight polling loops rarely reach DynamoDB.
+- Long-poll status endpoint (`/api/jobs/{job_id}/wait`) that returns as soon
+  as the job changes.
+- Transcript download as text, JSON segments, SRT or WebVTT (`?format=`),
+  streamed with Range/gzip support or as a presigned S3 redirect.
 
 The actual transcription processing is asynchronous and handled by downstream
 queue/worker components after upload completes.
 """
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
 import os
 import re
+import threading
+import time
 import uuid
+import zlib
+from collections import OrderedDict
+from contextvars import ContextVar
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 from typing import Any
 
-import boto3
-from boto3.dynamodb.conditions import Key
-from fastapi import Depends, FastAPI, HTTPException, Response
+import jwt
+from botocore.exceptions import ClientError
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import RedirectResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_clerk_auth import ClerkConfig, ClerkHTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field
@@ -45,14 +69,30 @@ async def cors_preflight(rest_of_path: str) -> Response:  # noqa: ARG001
     # Explicit fallback for API Gateway/Lambda preflight path resolution.
     return Response(status_code=204)
 
-dynamodb = boto3.resource(
-    "dynamodb",
-    region_name=os.getenv("AWS_REGION", os.getenv("DEFAULT_AWS_REGION", "us-east-1")),
-)
-s3_client = boto3.client(
-    "s3",
-    region_name=os.getenv("AWS_REGION", os.getenv("DEFAULT_AWS_REGION", "us-east-1")),
-)
+AWS_REGION = os.getenv("AWS_REGION", os.getenv("DEFAULT_AWS_REGION", "us-east-1"))
+# boto3 is imported and its clients built on first use (about 0.4s), so /health and CORS
+# preflights on a fresh Lambda container never pay for it.
+dynamodb = None
+s3_client = None
+
+
+def _dynamodb() -> Any:
+    global dynamodb
+    if dynamodb is None:
+        import boto3
+
+        dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
+    return dynamodb
+
+
+def _s3() -> Any:
+    global s3_client
+    if s3_client is None:
+        import boto3
+
+        s3_client = boto3.client("s3", region_name=AWS_REGION)
+    return s3_client
+
 
 USERS_TABLE = os.getenv("USERS_TABLE_NAME", "")
 JOBS_TABLE = os.getenv("JOBS_TABLE_NAME", "")
@@ -60,6 +100,39 @@ AUDIO_BUCKET = os.getenv("AUDIO_BUCKET_NAME", "")
 TRANSCRIPT_BUCKET = os.getenv("TRANSCRIPT_BUCKET_NAME", "")
 PRESIGNED_EXPIRES_SECONDS = int(os.getenv("PRESIGNED_EXPIRES_SECONDS", "900"))
 MAX_FILE_SIZE_BYTES = int(os.getenv("MAX_FILE_SIZE_BYTES", str(100 * 1024 * 1024)))
+# Uploads up to this size go to the fast-lane queue (audio-fast/ prefix); 0 sends everything to bulk.
+# Off by default: only turn it on once the workers poll the fast queue, or small uploads are never processed.
+FAST_LANE_MAX_BYTES = int(os.getenv("FAST_LANE_MAX_BYTES", "0"))
+# Repeat polls of one job inside this window are answered from memory (per Lambda container); 0 disables.
+JOB_CACHE_TTL_SECONDS = float(os.getenv("JOB_CACHE_TTL_SECONDS", "2"))
+JOB_CACHE_MAX_ENTRIES = int(os.getenv("JOB_CACHE_MAX_ENTRIES", "1024"))
+# /wait re-reads the job after this delay, doubling it after each unchanged read up to the max.
+JOB_WAIT_POLL_SECONDS = float(os.getenv("JOB_WAIT_POLL_SECONDS", "1"))
+JOB_WAIT_POLL_MAX_SECONDS = float(os.getenv("JOB_WAIT_POLL_MAX_SECONDS", "4"))
+# API Gateway HTTP APIs give up on an integration after 30s, so a wait must end before that.
+JOB_WAIT_MAX_SECONDS = float(os.getenv("JOB_WAIT_MAX_SECONDS", "25"))
+# Users this container has already written, so create_job skips the users-table write.
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "300"))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "4096"))
+# POST /api/jobs:batch accepts up to this many files; 500 presigned forms are about 0.5 MB of response.
+JOB_BATCH_MAX_FILES = int(os.getenv("JOB_BATCH_MAX_FILES", "500"))
+# Presigned transcript links (?delivery=redirect) stay valid this long.
+TRANSCRIPT_URL_TTL_SECONDS = int(os.getenv("TRANSCRIPT_URL_TTL_SECONDS", "300"))
+# Lambda responses are capped at 6 MB, so larger transcript objects are always redirected to S3.
+TRANSCRIPT_INLINE_MAX_BYTES = int(os.getenv("TRANSCRIPT_INLINE_MAX_BYTES", str(4 * 1024 * 1024)))
+TRANSCRIPT_CHUNK_BYTES = 64 * 1024
+GZIP_MIN_BYTES = 1024
+# Clerk signing keys are reused this long before a background re-fetch; Clerk rotates them rarely.
+CLERK_JWKS_TTL_SECONDS = float(os.getenv("CLERK_JWKS_TTL_SECONDS", "3600"))
+# A token with an unknown `kid` triggers a JWKS fetch at most this often (forged kids cannot hammer Clerk).
+CLERK_JWKS_MIN_REFRESH_SECONDS = float(os.getenv("CLERK_JWKS_MIN_REFRESH_SECONDS", "30"))
+# Verified tokens are reused until their `exp`, so polling with one session token verifies it once; 0 disables.
+AUTH_TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_TOKEN_CACHE_MAX_ENTRIES", "1024"))
+# One api_auth log line per authenticated request, with auth_ms as a CloudWatch EMF metric.
+API_METRICS_EMF = os.getenv("API_METRICS_EMF", "true").strip().lower() in {"1", "true", "yes"}
+API_METRICS_NAMESPACE = os.getenv("API_METRICS_NAMESPACE", "AudioTranscription/Api").strip()
+# GSI on (clerk_user_id, created_at) from 01_database; empty falls back to the base table (job_id order).
+JOBS_CREATED_AT_INDEX = os.getenv("JOBS_CREATED_AT_INDEX_NAME", "")
 
 ALLOWED_FILE_TYPES = {
     ".mp3": "audio/mpeg",
@@ -69,8 +142,178 @@ ALLOWED_FILE_TYPES = {
     ".flac": "audio/flac",
 }
 
+JOB_STATUSES = {"PENDING_UPLOAD", "PROCESSING", "COMPLETED", "FAILED"}
+# Attributes a client may ask for with ?fields= (the partition key is never returned on request).
+JOB_FIELDS = {
+    "job_id",
+    "filename",
+    "file_size",
+    "content_type",
+    "language",
+    "size_class",
+    "status",
+    "error_message",
+    "s3_audio_key",
+    "s3_transcript_key",
+    "s3_transcript_json_key",
+    "timings",
+    "created_at",
+    "updated_at",
+    "completed_at",
+}
+# Default list row: what the dashboard history shows. ?fields=* returns whole items.
+LIST_DEFAULT_FIELDS = ("job_id", "filename", "status", "language", "created_at", "updated_at")
+# With a status filter, DynamoDB evaluates up to `limit` items per read; stop after this many reads.
+LIST_FILTER_MAX_READS = 5
+
+TRANSCRIPT_FORMATS = {
+    "txt": "text/plain; charset=utf-8",
+    "json": "application/json",
+    "srt": "application/x-subrip; charset=utf-8",
+    "vtt": "text/vtt; charset=utf-8",
+}
+
+# Always revalidated, even COMPLETED: a duplicate S3 event or a DLQ redrive re-runs the job and
+# rewrites its item and transcript. With If-None-Match the revalidation is an empty 304.
+JOB_CACHE_CONTROL = "private, no-cache"
+# Without an ETag from the client, /wait returns at once for these instead of waiting for a change.
+SETTLED_JOB_STATUSES = {"COMPLETED", "FAILED"}
+
+_job_cache: OrderedDict[tuple[str, str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+_known_users: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+
+
+def emit_auth_timing(path: str, source: str, auth_ms: float) -> None:
+    payload: dict[str, Any] = {"event": "api_auth", "path": path, "source": source, "auth_ms": round(auth_ms, 3)}
+    if API_METRICS_EMF:
+        payload["_aws"] = {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": API_METRICS_NAMESPACE,
+                    "Dimensions": [["source"]],
+                    "Metrics": [{"Name": "auth_ms", "Unit": "Milliseconds"}],
+                }
+            ],
+        }
+    print(json.dumps(payload))
+
+
+# How the current request's token was verified; per request (asyncio task), not per guard instance.
+_auth_source: ContextVar[str] = ContextVar("auth_source", default="rejected")
+
+
+class CachedClerkHTTPBearer(ClerkHTTPBearer):
+    """
+    ClerkHTTPBearer with container-lifetime caches for signing keys and verified tokens.
+
+    Keys are indexed by `kid`. Once CLERK_JWKS_TTL_SECONDS pass, the cached keys keep
+    serving while a background thread re-fetches the JWKS. A token signed with an unknown
+    `kid` (key rotation) fetches it inline, since the request cannot be verified without
+    it. Verified claims are kept until the token's `exp`.
+    """
+
+    def __init__(self, config: ClerkConfig) -> None:
+        super().__init__(config)
+        self._keys: dict[str, Any] = {}
+        self._keys_expire_at = 0.0
+        self._keys_fetched_at = float("-inf")
+        self._refresh_lock = threading.Lock()
+        self._tokens: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def _refresh_keys(self) -> None:
+        with self._refresh_lock:
+            self._keys_fetched_at = time.monotonic()
+            keys = {key.key_id: key for key in self.jwks_client.get_signing_keys(refresh=True) if key.key_id}
+            self._keys = keys
+            self._keys_expire_at = time.monotonic() + CLERK_JWKS_TTL_SECONDS
+
+    def _refresh_keys_in_background(self) -> None:
+        if self._refresh_lock.locked():
+            return
+
+        def refresh() -> None:
+            try:
+                self._refresh_keys()
+            except Exception as exc:
+                # Keep serving the cached keys; the next request past the TTL tries again.
+                print(json.dumps({"event": "jwks_refresh_failed", "error": str(exc)}))
+
+        self._keys_expire_at = time.monotonic() + CLERK_JWKS_MIN_REFRESH_SECONDS
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _signing_key(self, kid: str) -> Any:
+        key = self._keys.get(kid)
+        if key is not None:
+            if time.monotonic() >= self._keys_expire_at:
+                self._refresh_keys_in_background()
+            _auth_source.set("jwks_cache")
+            return key
+        if time.monotonic() - self._keys_fetched_at < CLERK_JWKS_MIN_REFRESH_SECONDS:
+            return None
+        self._refresh_keys()
+        _auth_source.set("jwks_fetch")
+        return self._keys.get(kid)
+
+    def _decode_token(self, token: str) -> dict | None:
+        _auth_source.set("rejected")
+        digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        cached = self._tokens.get(digest)
+        if cached is not None:
+            if cached[0] > time.time():
+                self._tokens.move_to_end(digest)
+                _auth_source.set("token_cache")
+                return cached[1]
+            self._tokens.pop(digest, None)
+
+        try:
+            key = self._signing_key(jwt.get_unverified_header(token).get("kid", ""))
+            if key is None:
+                _auth_source.set("rejected")
+                return None
+            claims = dict(
+                jsonable_encoder(
+                    jwt.decode(
+                        token,
+                        key=key.key,
+                        audience=self.audience,
+                        issuer=self.issuer,
+                        algorithms=["RS256"],
+                        options={
+                            "verify_exp": self.config.verify_exp,
+                            "verify_aud": self.config.verify_aud,
+                            "verify_iss": self.config.verify_iss,
+                            # Not on every fastapi-clerk-auth release; default like PyJWT does.
+                            "verify_iat": getattr(self.config, "verify_iat", True),
+                        },
+                        leeway=getattr(self.config, "leeway", 0),
+                    )
+                )
+            )
+        except jwt.PyJWTError:
+            _auth_source.set("rejected")
+            return None
+
+        exp = claims.get("exp")
+        if AUTH_TOKEN_CACHE_MAX_ENTRIES > 0 and isinstance(exp, (int, float)):
+            self._tokens[digest] = (float(exp), claims)
+            self._tokens.move_to_end(digest)
+            while len(self._tokens) > AUTH_TOKEN_CACHE_MAX_ENTRIES:
+                self._tokens.popitem(last=False)
+        return claims
+
+    async def __call__(self, request: Request) -> HTTPAuthorizationCredentials | None:
+        started = time.perf_counter()
+        _auth_source.set("rejected")
+        try:
+            return await super().__call__(request)
+        finally:
+            emit_auth_timing(request.url.path, _auth_source.get(), (time.perf_counter() - started) * 1000)
+
+
 clerk_config = ClerkConfig(jwks_url=os.getenv("CLERK_JWKS_URL", ""))
-clerk_guard = ClerkHTTPBearer(clerk_config)
+clerk_guard = CachedClerkHTTPBearer(clerk_config)
 
 
 class CreateJobRequest(BaseModel):
@@ -87,8 +330,28 @@ class CreateJobResponse(BaseModel):
     upload: dict[str, Any]
 
 
+class BatchJobFile(BaseModel):
+    filename: str = Field(min_length=1, max_length=255)
+    file_size: int = Field(gt=0)
+    content_type: str = Field(min_length=1, max_length=120)
+    # Defaults to the batch-level language.
+    language: str | None = Field(default=None, min_length=2, max_length=10)
+
+
+class CreateJobsBatchRequest(BaseModel):
+    files: list[BatchJobFile] = Field(min_length=1, max_length=JOB_BATCH_MAX_FILES)
+    language: str = Field(default="en", min_length=2, max_length=10)
+    email: str = Field(default="", max_length=320)
+
+
+class CreateJobsBatchResponse(BaseModel):
+    # Same order as the request's files.
+    jobs: list[CreateJobResponse]
+
+
 class JobListResponse(BaseModel):
     jobs: list[dict[str, Any]]
+    next_cursor: str | None = None
 
 
 def _now_iso() -> str:
@@ -102,10 +365,96 @@ def _extract_extension(filename: str) -> str:
     return filename[dot_idx:].lower()
 
 
+def _size_class(file_size: int) -> str:
+    return "fast" if 0 < file_size <= FAST_LANE_MAX_BYTES else "bulk"
+
+
 def _to_plain(item: dict[str, Any]) -> dict[str, Any]:
     return dict(item)
 
 
+def _encode_cursor(last_evaluated_key: dict[str, Any]) -> str:
+    raw = json.dumps(last_evaluated_key, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, clerk_user_id: str) -> dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+    # A cursor is a raw DynamoDB key; never let it start a read in another user's partition,
+    # and only accept the exact key attributes of the table (plus the index sort key when
+    # listing through the created_at GSI) so arbitrary attributes never reach the query.
+    expected = {"clerk_user_id", "job_id"} | ({"created_at"} if JOBS_CREATED_AT_INDEX else set())
+    if (
+        not isinstance(key, dict)
+        or set(key) != expected
+        or not all(isinstance(value, str) and value for value in key.values())
+        or key["clerk_user_id"] != clerk_user_id
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return key
+
+
+def _projection_kwargs(
+    fields: str,
+    default: tuple[str, ...] = (),
+    always: tuple[str, ...] = ("job_id",),
+) -> dict[str, Any]:
+    requested = [f.strip() for f in fields.split(",") if f.strip()] or list(default)
+    if not requested or requested == ["*"]:
+        return {}
+    unknown = sorted(set(requested) - JOB_FIELDS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    # job_id always comes back so rows stay addressable; placeholders dodge reserved words like "status".
+    names = {f"#f{i}": name for i, name in enumerate(dict.fromkeys([*always, *requested]))}
+    return {"ProjectionExpression": ", ".join(names), "ExpressionAttributeNames": names}
+
+
+def _cached_job(cache_key: tuple[str, str, str]) -> dict[str, Any] | None:
+    entry = _job_cache.get(cache_key)
+    if entry is None:
+        return None
+    expires_at, item = entry
+    if expires_at < time.monotonic():
+        _job_cache.pop(cache_key, None)
+        return None
+    return item
+
+
+def _cache_job(cache_key: tuple[str, str, str], item: dict[str, Any]) -> None:
+    if JOB_CACHE_TTL_SECONDS <= 0:
+        return
+    _job_cache[cache_key] = (time.monotonic() + JOB_CACHE_TTL_SECONDS, item)
+    _job_cache.move_to_end(cache_key)
+    while len(_job_cache) > JOB_CACHE_MAX_ENTRIES:
+        _job_cache.popitem(last=False)
+
+
+def _job_etag(item: dict[str, Any], fields: str) -> str:
+    # Every job write bumps updated_at, so it versions the item; fields keeps projections apart.
+    version = f"{item.get('job_id', '')}|{item.get('updated_at', '')}|{fields}"
+    return '"' + hashlib.sha256(version.encode("utf-8")).hexdigest()[:20] + '"'
+
+
+def _job_headers(item: dict[str, Any], fields: str) -> dict[str, str]:
+    return {
+        "ETag": _job_etag(item, fields),
+        "Cache-Control": JOB_CACHE_CONTROL,
+        "Vary": "Authorization",
+    }
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 def _normalize_email(value: str) -> str:
     return value.strip().lower()
 
@@ -159,48 +508,63 @@ async def get_current_user_id(
     return auth_ctx["clerk_user_id"]
 
 
+def _known_user_email(clerk_user_id: str) -> str | None:
+    entry = _known_users.get(clerk_user_id)
+    if entry is None:
+        return None
+    expires_at, email = entry
+    if expires_at < time.monotonic():
+        _known_users.pop(clerk_user_id, None)
+        return None
+    return email
+
+
+def _remember_user(clerk_user_id: str, email: str) -> None:
+    if USER_CACHE_TTL_SECONDS <= 0:
+        return
+    _known_users[clerk_user_id] = (time.monotonic() + USER_CACHE_TTL_SECONDS, email)
+    _known_users.move_to_end(clerk_user_id)
+    while len(_known_users) > USER_CACHE_MAX_ENTRIES:
+        _known_users.popitem(last=False)
+
+
 def ensure_user_exists(clerk_user_id: str, email: str = "") -> None:
     _assert_db_env_configured()
-    users_table = dynamodb.Table(USERS_TABLE)
-    now = _now_iso()
     normalized_email = _normalize_email(email)
     has_email = bool(normalized_email) and _is_valid_email(normalized_email)
+
+    # Seen recently by this container with the same (or no new) email: nothing to write.
+    known_email = _known_user_email(clerk_user_id)
+    if known_email is not None and (not has_email or known_email == normalized_email):
+        return
+
+    users_table = _dynamodb().Table(USERS_TABLE)
+    now = _now_iso()
+    names = {"#updated_at": "updated_at", "#created_at": "created_at"}
+    values = {":updated_at": now, ":created_at": now}
+    expression = "SET #updated_at = :updated_at, #created_at = if_not_exists(#created_at, :created_at)"
+    # The write only lands for a new user or a changed email. A rejected conditional write still
+    # consumes write capacity, so it only keeps updated_at meaningful; the _known_users check above
+    # is what saves the write on repeat requests.
+    condition = "attribute_not_exists(#created_at)"
     if has_email:
+        names["#email"] = "email"
+        values[":email"] = normalized_email
+        expression += ", #email = :email"
+        condition += " OR attribute_not_exists(#email) OR #email <> :email"
+
+    try:
         users_table.update_item(
             Key={"clerk_user_id": clerk_user_id},
-            UpdateExpression=(
-                "SET #updated_at = :updated_at, "
-                "#email = :email, "
-                "#created_at = if_not_exists(#created_at, :created_at)"
-            ),
-            ExpressionAttributeNames={
-                "#updated_at": "updated_at",
-                "#email": "email",
-                "#created_at": "created_at",
-            },
-            ExpressionAttributeValues={
-                ":updated_at": now,
-                ":email": normalized_email,
-                ":created_at": now,
-            },
+            UpdateExpression=expression,
+            ConditionExpression=condition,
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
         )
-        return
-
-    users_table.update_item(
-        Key={"clerk_user_id": clerk_user_id},
-        UpdateExpression=(
-            "SET #updated_at = :updated_at, "
-            "#created_at = if_not_exists(#created_at, :created_at)"
-        ),
-        ExpressionAttributeNames={
-            "#updated_at": "updated_at",
-            "#created_at": "created_at",
-        },
-        ExpressionAttributeValues={
-            ":updated_at": now,
-            ":created_at": now,
-        },
-    )
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+            raise
+    _remember_user(clerk_user_id, normalized_email if has_email else (known_email or ""))
 
 
 @app.get("/health")
@@ -208,70 +572,56 @@ async def health() -> dict[str, str]:
     return {"status": "healthy"}
 
 
-@app.post("/api/jobs", response_model=CreateJobResponse)
-async def create_job(
-    payload: CreateJobRequest,
-    auth_ctx: dict[str, Any] = Depends(get_current_auth_context),
-) -> CreateJobResponse:
-    _assert_db_env_configured()
-    if not AUDIO_BUCKET:
-        raise HTTPException(status_code=500, detail="AUDIO_BUCKET_NAME is not configured")
-
-    clerk_user_id = auth_ctx["clerk_user_id"]
-    provided_email = _normalize_email(payload.email)
-    token_email = _normalize_email(auth_ctx.get("email", ""))
-    # Trust token claim first; fallback to payload only if claim is missing.
-    effective_email = token_email or provided_email
-    ensure_user_exists(clerk_user_id, effective_email)
-
-    ext = _extract_extension(payload.filename)
+def _upload_error(filename: str, content_type: str, file_size: int) -> str | None:
+    ext = _extract_extension(filename)
     if ext not in ALLOWED_FILE_TYPES:
-        raise HTTPException(status_code=400, detail="Unsupported file extension")
+        return "Unsupported file extension"
+    if content_type.lower() != ALLOWED_FILE_TYPES[ext]:
+        return "Invalid content_type for file extension"
+    if file_size > MAX_FILE_SIZE_BYTES:
+        return f"File exceeds max size {MAX_FILE_SIZE_BYTES} bytes"
+    return None
 
-    expected_mime = ALLOWED_FILE_TYPES[ext]
-    if payload.content_type.lower() != expected_mime:
-        raise HTTPException(status_code=400, detail="Invalid content_type for file extension")
-
-    if payload.file_size > MAX_FILE_SIZE_BYTES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File exceeds max size {MAX_FILE_SIZE_BYTES} bytes",
-        )
 
+def _new_job_item(
+    clerk_user_id: str, filename: str, file_size: int, content_type: str, language: str, now: str
+) -> dict[str, Any]:
     job_id = str(uuid.uuid4())
-    now = _now_iso()
-    object_key = f"audio/{clerk_user_id}/{job_id}/original{ext}"
-
-    jobs_table = dynamodb.Table(JOBS_TABLE)
-    jobs_table.put_item(
-        Item={
-            "clerk_user_id": clerk_user_id,
-            "job_id": job_id,
-            "filename": payload.filename,
-            "file_size": payload.file_size,
-            "content_type": payload.content_type,
-            "language": payload.language,
-            "status": "PENDING_UPLOAD",
-            "s3_audio_key": object_key,
-            "created_at": now,
-            "updated_at": now,
-        }
-    )
+    # The key prefix picks the queue (S3 notification filter), so the lane is fixed at upload time.
+    size_class = _size_class(file_size)
+    key_prefix = "audio-fast" if size_class == "fast" else "audio"
+    return {
+        "clerk_user_id": clerk_user_id,
+        "job_id": job_id,
+        "filename": filename,
+        "file_size": file_size,
+        "content_type": content_type,
+        "language": language,
+        "size_class": size_class,
+        "status": "PENDING_UPLOAD",
+        "s3_audio_key": f"{key_prefix}/{clerk_user_id}/{job_id}/original{_extract_extension(filename)}",
+        "created_at": now,
+        "updated_at": now,
+    }
+
 
-    presigned_post = s3_client.generate_presigned_post(
+def _upload_response(item: dict[str, Any]) -> CreateJobResponse:
+    object_key = item["s3_audio_key"]
+    max_upload_bytes = FAST_LANE_MAX_BYTES if item["size_class"] == "fast" else MAX_FILE_SIZE_BYTES
+    presigned_post = _s3().generate_presigned_post(
         Bucket=AUDIO_BUCKET,
         Key=object_key,
-        Fields={"Content-Type": payload.content_type},
+        Fields={"Content-Type": item["content_type"]},
         Conditions=[
-            {"Content-Type": payload.content_type},
-            ["content-length-range", 1, MAX_FILE_SIZE_BYTES],
+            {"Content-Type": item["content_type"]},
+            # A fast-lane form cannot be used to push a large file past the bulk queue.
+            ["content-length-range", 1, max_upload_bytes],
             ["eq", "$key", object_key],
         ],
         ExpiresIn=PRESIGNED_EXPIRES_SECONDS,
     )
-
     return CreateJobResponse(
-        job_id=job_id,
+        job_id=item["job_id"],
         status="PENDING_UPLOAD",
         upload={
             "type": "presigned_post",
@@ -283,31 +633,319 @@ async def create_job(
     )
 
 
+def _bootstrap_user(auth_ctx: dict[str, Any], payload_email: str) -> str:
+    clerk_user_id = auth_ctx["clerk_user_id"]
+    provided_email = _normalize_email(payload_email)
+    token_email = _normalize_email(auth_ctx.get("email", ""))
+    # Trust token claim first; fallback to payload only if claim is missing.
+    effective_email = token_email or provided_email
+    ensure_user_exists(clerk_user_id, effective_email)
+    return clerk_user_id
+
+
+@app.post("/api/jobs", response_model=CreateJobResponse)
+async def create_job(
+    payload: CreateJobRequest,
+    auth_ctx: dict[str, Any] = Depends(get_current_auth_context),
+) -> CreateJobResponse:
+    _assert_db_env_configured()
+    if not AUDIO_BUCKET:
+        raise HTTPException(status_code=500, detail="AUDIO_BUCKET_NAME is not configured")
+
+    clerk_user_id = _bootstrap_user(auth_ctx, payload.email)
+
+    error = _upload_error(payload.filename, payload.content_type, payload.file_size)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+
+    item = _new_job_item(
+        clerk_user_id, payload.filename, payload.file_size, payload.content_type, payload.language, _now_iso()
+    )
+    _dynamodb().Table(JOBS_TABLE).put_item(Item=item)
+    return _upload_response(item)
+
+
+@app.post("/api/jobs:batch", response_model=CreateJobsBatchResponse)
+async def create_jobs_batch(
+    payload: CreateJobsBatchRequest,
+    auth_ctx: dict[str, Any] = Depends(get_current_auth_context),
+) -> CreateJobsBatchResponse:
+    """Create one job per file with a single user bootstrap, batched row writes and all upload forms."""
+    _assert_db_env_configured()
+    if not AUDIO_BUCKET:
+        raise HTTPException(status_code=500, detail="AUDIO_BUCKET_NAME is not configured")
+
+    # All or nothing: one bad file rejects the batch before any row is written.
+    errors = []
+    for index, file in enumerate(payload.files):
+        error = _upload_error(file.filename, file.content_type, file.file_size)
+        if error:
+            errors.append({"index": index, "filename": file.filename, "error": error})
+    if errors:
+        raise HTTPException(status_code=400, detail={"message": "Invalid files in batch", "errors": errors})
+
+    clerk_user_id = _bootstrap_user(auth_ctx, payload.email)
+    now = _now_iso()
+    items = [
+        _new_job_item(
+            clerk_user_id, file.filename, file.file_size, file.content_type, file.language or payload.language, now
+        )
+        for file in payload.files
+    ]
+    # batch_writer sends BatchWriteItem calls of 25 and resends unprocessed items.
+    with _dynamodb().Table(JOBS_TABLE).batch_writer() as writer:
+        for item in items:
+            writer.put_item(Item=item)
+
+    return CreateJobsBatchResponse(jobs=[_upload_response(item) for item in items])
+
+
 @app.get("/api/jobs/{job_id}")
 async def get_job_status(
     job_id: str,
+    response: Response,
+    fields: str = "",
+    if_none_match: str | None = Header(default=None),
     clerk_user_id: str = Depends(get_current_user_id),
-) -> dict[str, Any]:
+) -> Any:
     _assert_db_env_configured()
-    jobs_table = dynamodb.Table(JOBS_TABLE)
-    response = jobs_table.get_item(Key={"clerk_user_id": clerk_user_id, "job_id": job_id})
-    item = response.get("Item")
-    if not item:
-        raise HTTPException(status_code=404, detail="Job not found")
-    return _to_plain(item)
+    fields = fields.strip()
+    cache_key = (clerk_user_id, job_id, fields)
+    item = _cached_job(cache_key)
+    if item is None:
+        jobs_table = _dynamodb().Table(JOBS_TABLE)
+        result = jobs_table.get_item(
+            Key={"clerk_user_id": clerk_user_id, "job_id": job_id},
+            # updated_at is needed for the ETag even when the caller did not ask for it.
+            **_projection_kwargs(fields, always=("job_id", "updated_at")),
+        )
+        if not result.get("Item"):
+            raise HTTPException(status_code=404, detail="Job not found")
+        item = _to_plain(result["Item"])
+        _cache_job(cache_key, item)
+
+    headers = _job_headers(item, fields)
+    if _etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return item
+
+
+@app.get("/api/jobs/{job_id}/wait")
+async def wait_for_job_change(
+    job_id: str,
+    response: Response,
+    timeout: float = 20.0,
+    fields: str = "",
+    if_none_match: str | None = Header(default=None),
+    clerk_user_id: str = Depends(get_current_user_id),
+) -> Any:
+    _assert_db_env_configured()
+    # Long-poll: answer once the job no longer matches the client's ETag, or 304 at the timeout.
+    # Without If-None-Match, a settled job returns at once and others return when the status moves on.
+    fields = fields.strip()
+    projection = _projection_kwargs(fields, always=("job_id", "updated_at"))
+    jobs_table = _dynamodb().Table(JOBS_TABLE)
+    key = {"clerk_user_id": clerk_user_id, "job_id": job_id}
+    # The watch loop reads three small attributes; the full item is read once at the end.
+    # Watch reads are eventually consistent (half the RCU of a strong read) and back off from
+    # JOB_WAIT_POLL_SECONDS to JOB_WAIT_POLL_MAX_SECONDS, so a 25s hold costs ~9 half-unit reads
+    # instead of 25 full ones, at the price of seeing a change up to a few seconds late.
+    watch = {
+        "ProjectionExpression": "#job_id, #updated_at, #status",
+        "ExpressionAttributeNames": {"#job_id": "job_id", "#updated_at": "updated_at", "#status": "status"},
+    }
+    deadline = time.monotonic() + max(0.0, min(timeout, JOB_WAIT_MAX_SECONDS))
+
+    # A copy cached by a recent GET or wait stands in for the first read; if it already differs
+    # from the client's view it is the answer and DynamoDB is not read at all.
+    cache_key = (clerk_user_id, job_id, fields)
+    current = _cached_job(cache_key)
+    if current is not None and not if_none_match and "status" not in current:
+        current = None
+    from_cache = current is not None
+    first_status = None
+    delay = JOB_WAIT_POLL_SECONDS
+    while True:
+        if current is None:
+            current = jobs_table.get_item(Key=key, **watch).get("Item")
+            if not current:
+                raise HTTPException(status_code=404, detail="Job not found")
+        status = str(current.get("status", ""))
+        if if_none_match:
+            changed = not _etag_matches(if_none_match, _job_etag(current, fields))
+        else:
+            changed = status in SETTLED_JOB_STATUSES or (first_status is not None and status != first_status)
+        first_status = first_status or status
+        if changed and from_cache:
+            response.headers.update(_job_headers(current, fields))
+            return current
+        remaining = deadline - time.monotonic()
+        if changed or remaining <= 0:
+            break
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, JOB_WAIT_POLL_MAX_SECONDS)
+        current, from_cache = None, False
+
+    if not changed and if_none_match:
+        return Response(status_code=304, headers=_job_headers(current, fields))
+
+    item = _to_plain(jobs_table.get_item(Key=key, ConsistentRead=True, **projection).get("Item") or current)
+    _cache_job((clerk_user_id, job_id, fields), item)
+    response.headers.update(_job_headers(item, fields))
+    return item
+
+
+def _format_cue_time(seconds: float, decimal_separator: str) -> str:
+    millis = int(round(max(seconds, 0.0) * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{decimal_separator}{millis:03d}"
+
+
+def _render_srt(segments: list[dict[str, Any]]) -> str:
+    cues = []
+    for index, segment in enumerate(segments, start=1):
+        start = _format_cue_time(float(segment["start"]), ",")
+        end = _format_cue_time(float(segment["end"]), ",")
+        cues.append(f"{index}\n{start} --> {end}\n{segment['text']}\n")
+    return "\n".join(cues)
+
+
+def _render_vtt(segments: list[dict[str, Any]]) -> str:
+    cues = ["WEBVTT\n"]
+    for segment in segments:
+        start = _format_cue_time(float(segment["start"]), ".")
+        end = _format_cue_time(float(segment["end"]), ".")
+        cues.append(f"{start} --> {end}\n{segment['text']}\n")
+    return "\n".join(cues)
+
+
+def _read_transcript_object(key: str, too_large_detail: str) -> str:
+    try:
+        transcript_obj = _s3().get_object(Bucket=TRANSCRIPT_BUCKET, Key=key)
+    except Exception as exc:
+        raise HTTPException(status_code=404, detail="Transcript object not found") from exc
+    # Read whole into Lambda memory (and the response), so the same cap as streaming applies.
+    if int(transcript_obj.get("ContentLength", 0)) > TRANSCRIPT_INLINE_MAX_BYTES:
+        transcript_obj["Body"].close()
+        raise HTTPException(status_code=413, detail=too_large_detail)
+    return transcript_obj["Body"].read().decode("utf-8", errors="replace")
+
+
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip().lower() == "gzip":
+            return params.replace(" ", "") not in {"q=0", "q=0.0"}
+    return False
+
+
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _transcript_redirect(key: str, media_type: str, filename: str) -> RedirectResponse:
+    url = _s3().generate_presigned_url(
+        ClientMethod="get_object",
+        Params={
+            "Bucket": TRANSCRIPT_BUCKET,
+            "Key": key,
+            "ResponseContentType": media_type,
+            "ResponseContentDisposition": f'attachment; filename="{filename}"',
+        },
+        ExpiresIn=TRANSCRIPT_URL_TTL_SECONDS,
+    )
+    return RedirectResponse(url, status_code=307, headers={"Cache-Control": "no-store"})
+
+
+def _stream_transcript_object(
+    key: str,
+    media_type: str,
+    filename: str,
+    range_header: str | None,
+    accept_encoding: str | None,
+    if_none_match: str | None = None,
+) -> Response:
+    params = {"Bucket": TRANSCRIPT_BUCKET, "Key": key}
+    if range_header:
+        # S3 applies the Range itself, so only the requested bytes ever reach the Lambda.
+        params["Range"] = range_header
+    if if_none_match:
+        # S3 compares against the object's own ETag (the one sent below) and skips the body on a match.
+        params["IfNoneMatch"] = if_none_match
+    try:
+        transcript_obj = _s3().get_object(**params)
+    except ClientError as exc:
+        code = exc.response.get("Error", {}).get("Code")
+        if code in {"304", "NotModified"}:
+            return Response(status_code=304, headers={"ETag": if_none_match or "", "Cache-Control": JOB_CACHE_CONTROL})
+        if code == "InvalidRange":
+            raise HTTPException(status_code=416, detail="Requested range not satisfiable") from exc
+        raise HTTPException(status_code=404, detail="Transcript object not found") from exc
+
+    length = int(transcript_obj.get("ContentLength", 0))
+    if length > TRANSCRIPT_INLINE_MAX_BYTES:
+        transcript_obj["Body"].close()
+        return _transcript_redirect(key, media_type, filename)
+
+    # A re-run job rewrites its transcript under the same key, so clients revalidate with the S3 ETag.
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Cache-Control": JOB_CACHE_CONTROL,
+        "ETag": transcript_obj.get("ETag", ""),
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Vary": "Accept-Encoding",
+    }
+    status_code = 200
+    if transcript_obj.get("ContentRange"):
+        status_code = 206
+        headers["Content-Range"] = transcript_obj["ContentRange"]
+
+    chunks = transcript_obj["Body"].iter_chunks(TRANSCRIPT_CHUNK_BYTES)
+    if status_code == 200 and length >= GZIP_MIN_BYTES and _accepts_gzip(accept_encoding):
+        headers["Content-Encoding"] = "gzip"
+        chunks = _gzip_chunks(chunks)
+    else:
+        headers["Content-Length"] = str(length)
+    return StreamingResponse(chunks, status_code=status_code, media_type=media_type, headers=headers)
 
 
 @app.get("/api/jobs/{job_id}/transcript")
 async def get_job_transcript(
     job_id: str,
+    format: str = "",
+    delivery: str = "",
+    range_header: str | None = Header(default=None, alias="Range"),
+    accept_encoding: str | None = Header(default=None),
+    if_none_match: str | None = Header(default=None),
     clerk_user_id: str = Depends(get_current_user_id),
-) -> dict[str, str]:
+) -> Any:
     _assert_db_env_configured()
     if not TRANSCRIPT_BUCKET:
         raise HTTPException(status_code=500, detail="TRANSCRIPT_BUCKET_NAME is not configured")
 
-    jobs_table = dynamodb.Table(JOBS_TABLE)
-    response = jobs_table.get_item(Key={"clerk_user_id": clerk_user_id, "job_id": job_id})
+    transcript_format = format.strip().lower()
+    if transcript_format and transcript_format not in TRANSCRIPT_FORMATS:
+        allowed = ", ".join(sorted(TRANSCRIPT_FORMATS))
+        raise HTTPException(status_code=400, detail=f"Unsupported format. Allowed: {allowed}")
+    delivery = delivery.strip().lower()
+    if delivery not in {"", "redirect"}:
+        raise HTTPException(status_code=400, detail="Unsupported delivery. Allowed: redirect")
+    if delivery and transcript_format not in {"txt", "json"}:
+        raise HTTPException(status_code=400, detail="delivery=redirect needs format=txt or format=json")
+
+    jobs_table = _dynamodb().Table(JOBS_TABLE)
+    response = jobs_table.get_item(
+        Key={"clerk_user_id": clerk_user_id, "job_id": job_id},
+        **_projection_kwargs("status,s3_transcript_key,s3_transcript_json_key"),
+    )
     item = response.get("Item")
     if not item:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -315,34 +953,90 @@ async def get_job_transcript(
     if item.get("status") != "COMPLETED":
         raise HTTPException(status_code=409, detail="Transcript is not ready yet")
 
-    transcript_key = str(item.get("s3_transcript_key", "")).strip()
-    if not transcript_key:
-        raise HTTPException(status_code=404, detail="Transcript key not found for this job")
-
-    try:
-        transcript_obj = s3_client.get_object(Bucket=TRANSCRIPT_BUCKET, Key=transcript_key)
-    except Exception as exc:
-        raise HTTPException(status_code=404, detail="Transcript object not found") from exc
+    # Without ?format= the original {"job_id", "transcript"} response is kept.
+    if transcript_format in {"", "txt"}:
+        transcript_key = str(item.get("s3_transcript_key", "")).strip()
+        if not transcript_key:
+            raise HTTPException(status_code=404, detail="Transcript key not found for this job")
+        if not transcript_format:
+            transcript = _read_transcript_object(
+                transcript_key, "Transcript is too large to return inline; use ?format=txt (redirects to S3)"
+            )
+            return {"job_id": job_id, "transcript": transcript}
+        if delivery:
+            return _transcript_redirect(transcript_key, TRANSCRIPT_FORMATS["txt"], f"{job_id}.txt")
+        return _stream_transcript_object(
+            transcript_key, TRANSCRIPT_FORMATS["txt"], f"{job_id}.txt", range_header, accept_encoding, if_none_match
+        )
 
-    body = transcript_obj["Body"].read().decode("utf-8", errors="replace")
-    return {"job_id": job_id, "transcript": body}
+    # json/srt/vtt are all rendered from the one structured artifact the worker writes.
+    artifact_key = str(item.get("s3_transcript_json_key", "")).strip()
+    if not artifact_key:
+        raise HTTPException(status_code=404, detail="Structured transcript not available for this job")
+
+    if transcript_format == "json":
+        # The artifact is already JSON; pass its bytes through instead of parsing and re-encoding.
+        if delivery:
+            return _transcript_redirect(artifact_key, TRANSCRIPT_FORMATS["json"], f"{job_id}.json")
+        return _stream_transcript_object(
+            artifact_key, TRANSCRIPT_FORMATS["json"], f"{job_id}.json", range_header, accept_encoding, if_none_match
+        )
+    artifact = _read_transcript_object(
+        artifact_key, f"Transcript is too large to render as {transcript_format}; use ?format=json&delivery=redirect"
+    )
+    segments = json.loads(artifact).get("segments", [])
+    rendered = (_render_srt(segments) if transcript_format == "srt" else _render_vtt(segments)).encode("utf-8")
+    headers = {
+        "Content-Disposition": f'attachment; filename="{job_id}.{transcript_format}"',
+        "Vary": "Accept-Encoding",
+    }
+    if len(rendered) >= GZIP_MIN_BYTES and _accepts_gzip(accept_encoding):
+        headers["Content-Encoding"] = "gzip"
+        rendered = b"".join(_gzip_chunks([rendered]))
+    return Response(rendered, media_type=TRANSCRIPT_FORMATS[transcript_format], headers=headers)
 
 
 @app.get("/api/jobs", response_model=JobListResponse)
 async def list_jobs(
     clerk_user_id: str = Depends(get_current_user_id),
     limit: int = 20,
+    cursor: str = "",
+    status: str = "",
+    fields: str = "",
 ) -> JobListResponse:
     _assert_db_env_configured()
-    jobs_table = dynamodb.Table(JOBS_TABLE)
-    query_limit = max(1, min(limit, 100))
+    from boto3.dynamodb.conditions import Attr, Key
 
-    response = jobs_table.query(
-        KeyConditionExpression=Key("clerk_user_id").eq(clerk_user_id),
-        Limit=query_limit,
-    )
-    jobs = [_to_plain(i) for i in response.get("Items", [])]
-    jobs.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+    jobs_table = _dynamodb().Table(JOBS_TABLE)
+    query_limit = max(1, min(limit, 100))
 
-    return JobListResponse(jobs=jobs)
+    status_filter = status.strip().upper()
+    if status_filter and status_filter not in JOB_STATUSES:
+        allowed = ", ".join(sorted(JOB_STATUSES))
+        raise HTTPException(status_code=400, detail=f"Unsupported status. Allowed: {allowed}")
 
+    query_kwargs: dict[str, Any] = {
+        "KeyConditionExpression": Key("clerk_user_id").eq(clerk_user_id),
+        **_projection_kwargs(fields, LIST_DEFAULT_FIELDS),
+    }
+    if JOBS_CREATED_AT_INDEX:
+        # Newest first straight from the index, so every page is a contiguous slice.
+        query_kwargs.update(IndexName=JOBS_CREATED_AT_INDEX, ScanIndexForward=False)
+    if status_filter:
+        query_kwargs["FilterExpression"] = Attr("status").eq(status_filter)
+    start_key = _decode_cursor(cursor, clerk_user_id) if cursor else None
+
+    # Limit caps items evaluated, not items returned, so a filtered read can come back short.
+    jobs: list[dict[str, Any]] = []
+    for _ in range(LIST_FILTER_MAX_READS):
+        if start_key:
+            query_kwargs["ExclusiveStartKey"] = start_key
+        response = jobs_table.query(Limit=query_limit - len(jobs), **query_kwargs)
+        jobs.extend(_to_plain(i) for i in response.get("Items", []))
+        start_key = response.get("LastEvaluatedKey")
+        if not start_key or len(jobs) >= query_limit:
+            break
+    if not JOBS_CREATED_AT_INDEX:
+        jobs.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+
+    return JobListResponse(jobs=jobs, next_cursor=_encode_cursor(start_key) if start_key else None)
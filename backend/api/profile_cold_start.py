@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Measure API Lambda cold-start cost outside AWS.
+
+Each repeat runs a fresh interpreter with `-X importtime` that imports
+`lambda_handler` (module init) and sends the first request through the Mangum
+handler, the way a new Lambda container does. Targets are source directories
+(`--app-dir`, run with an empty bytecode cache, like a zip without .pyc files)
+or built zips (`--zip`, extracted once and run read-only, so bundled
+`__pycache__` is used if present). Reports median/p90 init and first-request
+time per target and the slowest packages and modules by self import time.
+
+Before/after: profile the old and new zip side by side, e.g.
+`python profile_cold_start.py --zip old_api_lambda.zip --zip api_lambda.zip`.
+On AWS, the same numbers come from the `api_cold_start` log line and the
+Lambda REPORT "Init Duration"; set PYTHONPROFILEIMPORTTIME=1 on the function
+for the per-module breakdown in CloudWatch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parent
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+CHILD_SNIPPET = """
+import json, sys, time
+started = time.perf_counter()
+import lambda_handler
+init_seconds = time.perf_counter() - started
+event = {
+    "version": "2.0",
+    "routeKey": "$default",
+    "rawPath": sys.argv[1],
+    "rawQueryString": "",
+    "headers": {"host": "localhost", "origin": "http://localhost:3000", "access-control-request-method": "POST"},
+    "requestContext": {"http": {"method": sys.argv[2], "path": sys.argv[1], "sourceIp": "127.0.0.1", "protocol": "HTTP/1.1"}},
+    "isBase64Encoded": False,
+}
+class Context:
+    aws_request_id = "profile"
+    function_name = "profile"
+started = time.perf_counter()
+response = lambda_handler.handler(event, Context())
+first_request_seconds = time.perf_counter() - started
+print(json.dumps({"init_seconds": init_seconds, "first_request_seconds": first_request_seconds, "status": response["statusCode"]}))
+"""
+
+
+def profile_once(app_dir: Path, env: dict[str, str], path: str, method: str) -> tuple[dict, list[tuple[int, int, int, str]]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD_SNIPPET, path, method],
+        cwd=app_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if line.strip() and not IMPORT_LINE.match(line)]
+        raise RuntimeError(errors[-1] if errors else f"child exited with {result.returncode}")
+    imports = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            imports.append((int(self_us), int(cumulative_us), len(indent) // 2, name))
+    return json.loads(result.stdout.strip().splitlines()[-1]), imports
+
+
+def child_env(app_dir: Path, pycache_prefix: str | None) -> dict[str, str]:
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(app_dir),
+        # Lambda's /var/task is read-only, so nothing compiled during a run may be reused by the next one.
+        "PYTHONDONTWRITEBYTECODE": "1",
+        "CLERK_JWKS_URL": os.getenv("CLERK_JWKS_URL", "https://clerk.profile.local/.well-known/jwks.json"),
+        "AWS_REGION": os.getenv("AWS_REGION", "us-east-1"),
+    }
+    env.pop("PYTHONPYCACHEPREFIX", None)
+    if pycache_prefix:
+        env["PYTHONPYCACHEPREFIX"] = pycache_prefix
+    return env
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def profile_target(label: str, app_dir: Path, pycache_prefix: str | None, args: argparse.Namespace) -> dict:
+    runs = []
+    self_by_module: dict[str, list[int]] = {}
+    for _ in range(args.repeats):
+        prefix = tempfile.mkdtemp(prefix="pycache-") if pycache_prefix == "fresh" else pycache_prefix
+        timing, imports = profile_once(app_dir, child_env(app_dir, prefix), args.path, args.method)
+        runs.append(timing)
+        for self_us, _, _, name in imports:
+            self_by_module.setdefault(name, []).append(self_us)
+
+    modules = {name: sorted(values)[len(values) // 2] for name, values in self_by_module.items()}
+    packages: dict[str, int] = {}
+    for name, self_us in modules.items():
+        top = name.split(".")[0]
+        packages[top] = packages.get(top, 0) + self_us
+    init = [run["init_seconds"] for run in runs]
+    first = [run["first_request_seconds"] for run in runs]
+    return {
+        "label": label,
+        "init_p50": percentile(init, 0.5),
+        "init_p90": percentile(init, 0.9),
+        "first_request_p50": percentile(first, 0.5),
+        "first_request_p90": percentile(first, 0.9),
+        "status": runs[-1]["status"],
+        "packages_ms": {k: v / 1000 for k, v in sorted(packages.items(), key=lambda kv: -kv[1])[: args.top]},
+        "modules_ms": {k: v / 1000 for k, v in sorted(modules.items(), key=lambda kv: -kv[1])[: args.top]},
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Profile API Lambda cold starts (import time + first request).")
+    parser.add_argument("--app-dir", action="append", default=[], help="Source directory with lambda_handler.py.")
+    parser.add_argument("--zip", action="append", default=[], help="Built Lambda zip (for example api_lambda.zip).")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--path", default="/health", help="First request path.")
+    parser.add_argument("--method", default="GET", help="First request method (OPTIONS for a CORS preflight).")
+    parser.add_argument("--top", type=int, default=15, help="Packages/modules to list by self import time.")
+    parser.add_argument("--json-out", default="", help="Write the results as JSON to this path.")
+    args = parser.parse_args()
+
+    targets: list[tuple[str, Path, str | None]] = [(app_dir, Path(app_dir).resolve(), "fresh") for app_dir in args.app_dir]
+    with tempfile.TemporaryDirectory(prefix="api-cold-start-") as work_dir:
+        for zip_file in args.zip:
+            extract_dir = Path(work_dir) / f"{len(targets)}-{Path(zip_file).stem}"
+            with zipfile.ZipFile(zip_file) as zf:
+                zf.extractall(extract_dir)
+            targets.append((f"{zip_file} ({Path(zip_file).stat().st_size / (1024 * 1024):.1f} MB)", extract_dir, None))
+        if not targets:
+            targets.append((str(API_DIR), API_DIR, "fresh"))
+
+        results = []
+        for label, app_dir, prefix in targets:
+            print(f"Profiling {label} x{args.repeats}...")
+            try:
+                results.append(profile_target(label, app_dir, prefix, args))
+            except RuntimeError as exc:
+                print(f"SKIP: {label}: {exc}")
+
+    if not results:
+        print("FAIL: no target could be profiled")
+        return 1
+
+    print("")
+    print(f"{'target':<48}{'init p50':>10}{'init p90':>10}{'first p50':>11}{'first p90':>11}{'status':>8}")
+    for result in results:
+        print(
+            f"{result['label'][-48:]:<48}{result['init_p50']:>10.3f}{result['init_p90']:>10.3f}"
+            f"{result['first_request_p50']:>11.3f}{result['first_request_p90']:>11.3f}{result['status']:>8}"
+        )
+    for result in results:
+        print("")
+        print(f"[{result['label']}] self import ms by package / module (median)")
+        packages = list(result["packages_ms"].items())
+        modules = list(result["modules_ms"].items())
+        for i in range(max(len(packages), len(modules))):
+            package = f"{packages[i][0]:<28}{packages[i][1]:>8.1f}" if i < len(packages) else " " * 36
+            module = f"{modules[i][0]:<40}{modules[i][1]:>8.1f}" if i < len(modules) else ""
+            print(f"  {package}    {module}")
+
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nWrote {args.json_out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Check that a stopped JobScheduler releases the jobs it has not started.
+
+Jobs are created through the API against the fakes in fakes.py (as in
+run_bench.py). The stub model blocks inside the first batch until the scheduler
+has prefetched the rest, then the scheduler is stopped. Only that first batch
+may complete. Every other message must be visible on the queue again, not
+transcribed, not left in flight, and not counted against the scheduler's
+capacity. Exits 1 on failure; ffmpeg must be on PATH.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import shutil
+import sys
+import threading
+import time
+from typing import Any
+
+import run_bench
+
+
+class BlockingTranscriber(run_bench.StubTranscriber):
+    """Holds the first batch in the model until `proceed` is set."""
+
+    def __init__(self, worker, rtf: float) -> None:
+        super().__init__(worker, rtf)
+        self.started = threading.Event()
+        self.proceed = threading.Event()
+        self.batches = 0
+
+    def __call__(self, inputs: Any, **options: Any) -> Any:
+        self.batches += 1
+        self.started.set()
+        self.proceed.wait()
+        return super().__call__(inputs, **options)
+
+
+def wait_for(condition, timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return condition()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check that a stopped scheduler releases unstarted jobs.")
+    parser.add_argument("--jobs", type=int, default=6)
+    parser.add_argument("--receive-max-messages", type=int, default=2)
+    parser.add_argument("--verbose", action="store_true", help="Show worker log lines.")
+    args = parser.parse_args()
+
+    if shutil.which("ffmpeg") is None:
+        print("FAIL: ffmpeg not found on PATH (the worker decodes audio with it)")
+        return 1
+
+    run_bench.configure_env(
+        argparse.Namespace(model="stub", ingest_mode="stream", receive_max_messages=args.receive_max_messages)
+    )
+    from fastapi.testclient import TestClient
+
+    import main as api
+    import worker
+    from fakes import FakeS3, FakeSQS
+
+    sqs = FakeSQS()
+    for url in (run_bench.BULK_QUEUE_URL, run_bench.FAST_QUEUE_URL, run_bench.NOTIFICATION_QUEUE_URL):
+        sqs.create_queue(url)
+    s3 = FakeS3(
+        sqs,
+        [
+            (run_bench.AUDIO_BUCKET, "audio/", run_bench.BULK_QUEUE_URL),
+            (run_bench.AUDIO_BUCKET, "audio-fast/", run_bench.FAST_QUEUE_URL),
+        ],
+    )
+    dynamodb = run_bench.bench_dynamodb()
+    api.dynamodb, api.s3_client = dynamodb, s3
+    worker.sqs, worker.s3, worker.dynamodb = sqs, s3, dynamodb
+    jobs_table = dynamodb.Table(run_bench.JOBS_TABLE)
+    worker.jobs_table = jobs_table
+    auth_context = {"clerk_user_id": run_bench.BENCH_USER_ID, "email": "bench@example.com"}
+    api.app.dependency_overrides[api.get_current_auth_context] = lambda: auth_context
+    api.app.dependency_overrides[api.get_current_user_id] = lambda: run_bench.BENCH_USER_ID
+
+    job_ids, _ = run_bench.submit_jobs(TestClient(api.app), s3, [5.0], args.jobs)
+    transcriber = BlockingTranscriber(worker, rtf=0.0)
+    scheduler = worker.JobScheduler(run_bench.StubModelPool(transcriber))
+    runner = threading.Thread(target=scheduler.run, name="scheduler", daemon=True)
+
+    log_sink = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    with log_sink:
+        runner.start()
+        # Every message received and at least one decoded job waiting behind the blocked batch.
+        ready = transcriber.started.wait(timeout=60) and wait_for(
+            lambda: scheduler.in_flight == args.jobs and scheduler.ready_jobs.qsize() > 0,
+            timeout=60,
+        )
+        held = scheduler.ready_jobs.qsize()
+        scheduler.stop()
+        transcriber.proceed.set()
+        runner.join(timeout=60)
+
+    statuses = [
+        jobs_table.get_item(Key={"clerk_user_id": run_bench.BENCH_USER_ID, "job_id": job_id}).get("Item", {}).get("status")
+        for job_id in job_ids
+    ]
+    completed = statuses.count("COMPLETED")
+    # Released means another worker can receive it right now (FakeSQS requeues expired leases on receive).
+    visible = sum(
+        len(sqs.receive_message(QueueUrl=url, MaxNumberOfMessages=args.jobs).get("Messages", []))
+        for url in (run_bench.BULK_QUEUE_URL, run_bench.FAST_QUEUE_URL)
+    )
+    in_flight = sum(sqs.depth(url)[1] for url in (run_bench.BULK_QUEUE_URL, run_bench.FAST_QUEUE_URL)) - visible
+    print(
+        f"held_when_stopped={held} model_batches={transcriber.batches} completed={completed} "
+        f"visible={visible} sqs_in_flight={in_flight} scheduler_in_flight={scheduler.in_flight} "
+        f"scheduler_audio_bytes={scheduler.audio_bytes}"
+    )
+
+    failures = []
+    if not ready:
+        failures.append("scheduler never prefetched jobs behind the first batch")
+    if runner.is_alive():
+        failures.append("scheduler did not exit after stop()")
+    if transcriber.batches != 1:
+        failures.append(f"{transcriber.batches} model batches ran; only the one in progress may finish")
+    if completed + visible != args.jobs or in_flight:
+        failures.append(f"{args.jobs - completed} unfinished job(s) but {visible} visible / {in_flight} in flight")
+    if scheduler.in_flight or scheduler.audio_bytes:
+        failures.append("scheduler capacity was not released")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        return 1
+    print(f"PASS: {completed} job(s) finished, {visible} released on shutdown")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
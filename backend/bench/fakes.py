@@ -0,0 +1,473 @@
+"""
+In-process stand-ins for the S3, SQS and DynamoDB calls the API and worker make.
+
+State lives in dicts guarded by locks, so a benchmark measures our own code
+instead of network or emulator overhead. Only the operations and expression
+shapes used in this repository are implemented; anything else raises
+NotImplementedError so a new call site is noticed rather than silently faked.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any
+from urllib.parse import quote_plus
+
+from botocore.exceptions import ClientError
+
+
+def client_error(code: str, operation: str, message: str = "") -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": message or code}}, operation)
+
+
+class FakeBody:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self._offset = 0
+
+    def read(self, amount: int | None = None) -> bytes:
+        end = len(self._data) if amount is None else min(len(self._data), self._offset + amount)
+        chunk = self._data[self._offset : end]
+        self._offset = end
+        return chunk
+
+    def iter_chunks(self, chunk_size: int = 1024 * 1024):
+        while chunk := self.read(chunk_size):
+            yield chunk
+
+    def close(self) -> None:
+        pass
+
+
+class FakeSQS:
+    """Standard-queue semantics: visibility timeouts, receipt handles, long polling."""
+
+    def __init__(self) -> None:
+        self.queues: dict[str, deque[dict[str, Any]]] = {}
+        self.in_flight: dict[str, tuple[str, dict[str, Any], float]] = {}
+        self.changed = threading.Condition()
+
+    def create_queue(self, url: str) -> str:
+        with self.changed:
+            self.queues.setdefault(url, deque())
+        return url
+
+    def _queue(self, url: str) -> deque[dict[str, Any]]:
+        if url not in self.queues:
+            raise client_error("AWS.SimpleQueueService.NonExistentQueue", "ReceiveMessage", url)
+        return self.queues[url]
+
+    def _requeue_expired(self) -> None:
+        now = time.monotonic()
+        for handle, (url, message, visible_at) in list(self.in_flight.items()):
+            if visible_at <= now:
+                del self.in_flight[handle]
+                self.queues[url].append(message)
+
+    def send_message(self, QueueUrl: str, MessageBody: str, **_: Any) -> dict[str, Any]:
+        message = {
+            "MessageId": str(uuid.uuid4()),
+            "Body": MessageBody,
+            "Attributes": {"SentTimestamp": str(int(time.time() * 1000)), "ApproximateReceiveCount": "0"},
+        }
+        with self.changed:
+            self._queue(QueueUrl).append(message)
+            self.changed.notify_all()
+        return {"MessageId": message["MessageId"]}
+
+    def receive_message(
+        self,
+        QueueUrl: str,
+        MaxNumberOfMessages: int = 1,
+        WaitTimeSeconds: int = 0,
+        VisibilityTimeout: int = 30,
+        AttributeNames: list[str] | None = None,
+        **_: Any,
+    ) -> dict[str, Any]:
+        deadline = time.monotonic() + WaitTimeSeconds
+        with self.changed:
+            while True:
+                self._requeue_expired()
+                queue = self._queue(QueueUrl)
+                if queue or time.monotonic() >= deadline:
+                    break
+                self.changed.wait(timeout=min(0.1, max(deadline - time.monotonic(), 0.0)))
+
+            messages = []
+            while queue and len(messages) < MaxNumberOfMessages:
+                message = queue.popleft()
+                receive_count = int(message["Attributes"]["ApproximateReceiveCount"]) + 1
+                message["Attributes"]["ApproximateReceiveCount"] = str(receive_count)
+                handle = str(uuid.uuid4())
+                self.in_flight[handle] = (QueueUrl, message, time.monotonic() + VisibilityTimeout)
+                delivered = {"MessageId": message["MessageId"], "ReceiptHandle": handle, "Body": message["Body"]}
+                if AttributeNames:
+                    delivered["Attributes"] = dict(message["Attributes"])
+                messages.append(delivered)
+        return {"Messages": messages} if messages else {}
+
+    def delete_message(self, QueueUrl: str, ReceiptHandle: str, **_: Any) -> dict[str, Any]:
+        with self.changed:
+            self.in_flight.pop(ReceiptHandle, None)
+        return {}
+
+    def change_message_visibility(self, QueueUrl: str, ReceiptHandle: str, VisibilityTimeout: int) -> dict[str, Any]:
+        with self.changed:
+            if ReceiptHandle not in self.in_flight:
+                raise client_error("ReceiptHandleIsInvalid", "ChangeMessageVisibility")
+            url, message, _ = self.in_flight[ReceiptHandle]
+            self.in_flight[ReceiptHandle] = (url, message, time.monotonic() + VisibilityTimeout)
+            self.changed.notify_all()
+        return {}
+
+    def change_message_visibility_batch(self, QueueUrl: str, Entries: list[dict[str, Any]]) -> dict[str, Any]:
+        successful, failed = [], []
+        for entry in Entries:
+            try:
+                self.change_message_visibility(QueueUrl, entry["ReceiptHandle"], entry["VisibilityTimeout"])
+                successful.append({"Id": entry["Id"]})
+            except ClientError as exc:
+                failed.append({"Id": entry["Id"], "Code": exc.response["Error"]["Code"], "SenderFault": True})
+        return {"Successful": successful, "Failed": failed}
+
+    def depth(self, url: str) -> tuple[int, int]:
+        """(visible, in flight) message counts for a queue."""
+        with self.changed:
+            in_flight = sum(1 for queue_url, _, _ in self.in_flight.values() if queue_url == url)
+            return len(self.queues.get(url, ())), in_flight
+
+
+class FakeS3:
+    """Object store with ObjectCreated notifications to FakeSQS by key prefix."""
+
+    def __init__(
+        self,
+        sqs: FakeSQS | None = None,
+        notifications: list[tuple[str, str, str]] | None = None,
+        post_endpoint: str = "",
+    ) -> None:
+        self.sqs = sqs
+        # (bucket, key prefix, queue url)
+        self.notifications = notifications or []
+        # Presigned POST forms point here (as `<post_endpoint>/<bucket>`) when set.
+        self.post_endpoint = post_endpoint.rstrip("/")
+        self.objects: dict[tuple[str, str], dict[str, Any]] = {}
+        self.lock = threading.Lock()
+
+    def _get(self, bucket: str, key: str, operation: str) -> dict[str, Any]:
+        with self.lock:
+            stored = self.objects.get((bucket, key))
+        if stored is None:
+            raise client_error("NoSuchKey" if operation == "GetObject" else "404", operation)
+        return stored
+
+    def put_object(
+        self,
+        Bucket: str,
+        Key: str,
+        Body: bytes | str = b"",
+        ContentType: str = "binary/octet-stream",
+        Metadata: dict[str, str] | None = None,
+        **_: Any,
+    ) -> dict[str, Any]:
+        data = Body.encode("utf-8") if isinstance(Body, str) else bytes(Body)
+        stored = {
+            "Body": data,
+            "ContentType": ContentType,
+            "Metadata": dict(Metadata or {}),
+            "LastModified": datetime.now(timezone.utc),
+            "ETag": f'"{uuid.uuid4().hex}"',
+        }
+        with self.lock:
+            self.objects[(Bucket, Key)] = stored
+        self._notify(Bucket, Key, len(data))
+        return {"ETag": stored["ETag"]}
+
+    def _notify(self, bucket: str, key: str, size: int) -> None:
+        for notify_bucket, prefix, queue_url in self.notifications:
+            if notify_bucket != bucket or not key.startswith(prefix) or self.sqs is None:
+                continue
+            event = {
+                "Records": [
+                    {
+                        "eventSource": "aws:s3",
+                        "eventName": "ObjectCreated:Put",
+                        "s3": {"bucket": {"name": bucket}, "object": {"key": quote_plus(key, safe="/"), "size": size}},
+                    }
+                ]
+            }
+            self.sqs.send_message(QueueUrl=queue_url, MessageBody=json.dumps(event))
+
+    def get_object(
+        self,
+        Bucket: str,
+        Key: str,
+        Range: str | None = None,
+        IfNoneMatch: str | None = None,
+        **_: Any,
+    ) -> dict[str, Any]:
+        stored = self._get(Bucket, Key, "GetObject")
+        if IfNoneMatch is not None and stored["ETag"] in {tag.strip() for tag in IfNoneMatch.split(",")}:
+            # botocore surfaces S3's bodiless 304 as a ClientError with code "304".
+            raise client_error("304", "GetObject", "Not Modified")
+        data = stored["Body"]
+        response: dict[str, Any] = {}
+        if Range:
+            match = re.fullmatch(r"bytes=(\d*)-(\d*)", Range)
+            if not match:
+                raise client_error("InvalidRange", "GetObject")
+            start_text, end_text = match.groups()
+            if start_text:
+                start, end = int(start_text), int(end_text) if end_text else len(data) - 1
+            else:
+                start, end = max(len(data) - int(end_text), 0), len(data) - 1
+            end = min(end, len(data) - 1)
+            if start > end:
+                raise client_error("InvalidRange", "GetObject")
+            response["ContentRange"] = f"bytes {start}-{end}/{len(data)}"
+            data = data[start : end + 1]
+        response.update(
+            {
+                "Body": FakeBody(data),
+                "ContentLength": len(data),
+                "ContentType": stored["ContentType"],
+                "Metadata": dict(stored["Metadata"]),
+                "LastModified": stored["LastModified"],
+                "ETag": stored["ETag"],
+            }
+        )
+        return response
+
+    def head_object(self, Bucket: str, Key: str, **_: Any) -> dict[str, Any]:
+        stored = self._get(Bucket, Key, "HeadObject")
+        return {
+            "ContentLength": len(stored["Body"]),
+            "ContentType": stored["ContentType"],
+            "Metadata": dict(stored["Metadata"]),
+            "ETag": stored["ETag"],
+        }
+
+    def copy_object(self, Bucket: str, Key: str, CopySource: dict[str, str], **kwargs: Any) -> dict[str, Any]:
+        source = self._get(CopySource["Bucket"], CopySource["Key"], "CopyObject")
+        return self.put_object(
+            Bucket=Bucket,
+            Key=Key,
+            Body=source["Body"],
+            ContentType=kwargs.get("ContentType", source["ContentType"]),
+            Metadata=kwargs.get("Metadata", source["Metadata"]),
+        )
+
+    def download_file(self, Bucket: str, Key: str, Filename: str, **_: Any) -> None:
+        stored = self._get(Bucket, Key, "HeadObject")
+        with open(Filename, "wb") as f:
+            f.write(stored["Body"])
+
+    def generate_presigned_post(
+        self,
+        Bucket: str,
+        Key: str,
+        Fields: dict[str, str] | None = None,
+        Conditions: list[Any] | None = None,  # noqa: ARG002
+        ExpiresIn: int = 3600,  # noqa: ARG002
+    ) -> dict[str, Any]:
+        url = f"{self.post_endpoint}/{Bucket}" if self.post_endpoint else f"https://{Bucket}.s3.fake.local/"
+        return {"url": url, "fields": {**(Fields or {}), "key": Key}}
+
+    def generate_presigned_url(self, ClientMethod: str, Params: dict[str, Any], ExpiresIn: int = 3600) -> str:
+        return f"https://{Params['Bucket']}.s3.fake.local/{Params['Key']}?method={ClientMethod}&expires={ExpiresIn}"
+
+
+_CONDITION_TERM = re.compile(r"attribute_not_exists\(\s*(#\w+)\s*\)|(#\w+)\s*<>\s*(:\w+)")
+
+
+def _condition_holds(item: dict[str, Any], expression: str, names: dict[str, str], values: dict[str, Any]) -> bool:
+    # Only `term OR term ...` with attribute_not_exists(#a) and #a <> :v terms.
+    terms = [term.strip() for term in re.split(r"\s+OR\s+", expression)]
+    results = []
+    for term in terms:
+        match = _CONDITION_TERM.fullmatch(term)
+        if not match:
+            raise NotImplementedError(f"Unsupported ConditionExpression term: {term}")
+        missing, compared, value = match.groups()
+        if missing:
+            results.append(names[missing] not in item)
+        else:
+            results.append(names[compared] in item and item[names[compared]] != values[value])
+    return any(results)
+
+
+_SET_ASSIGNMENT = re.compile(r"(#\w+)\s*=\s*(if_not_exists\(\s*(#\w+)\s*,\s*(:\w+)\s*\)|:\w+)")
+
+
+class FakeTable:
+    def __init__(
+        self,
+        name: str,
+        key_names: tuple[str, ...],
+        indexes: dict[str, tuple[str, str]] | None = None,
+    ) -> None:
+        self.name = name
+        self.key_names = key_names
+        # GSI name -> (partition key, sort key); projection is always ALL.
+        self.indexes = indexes or {}
+        self.items: dict[tuple[Any, ...], dict[str, Any]] = {}
+        self.lock = threading.Lock()
+
+    def _key(self, key: dict[str, Any]) -> tuple[Any, ...]:
+        return tuple(key[name] for name in self.key_names)
+
+    def put_item(self, Item: dict[str, Any], ConditionExpression: Any = None, **_: Any) -> dict[str, Any]:
+        if ConditionExpression is not None:
+            raise NotImplementedError("FakeTable.put_item does not evaluate ConditionExpression")
+        with self.lock:
+            self.items[self._key(Item)] = copy.deepcopy(Item)
+        return {}
+
+    def batch_writer(self, **_: Any) -> FakeBatchWriter:
+        return FakeBatchWriter(self)
+
+    def get_item(self, Key: dict[str, Any], ProjectionExpression: str | None = None, **kwargs: Any) -> dict[str, Any]:
+        with self.lock:
+            item = copy.deepcopy(self.items.get(self._key(Key)))
+        if item is None:
+            return {}
+        if ProjectionExpression:
+            item = _project(item, ProjectionExpression, kwargs.get("ExpressionAttributeNames", {}))
+        return {"Item": item}
+
+    def update_item(
+        self,
+        Key: dict[str, Any],
+        UpdateExpression: str,
+        ExpressionAttributeNames: dict[str, str],
+        ExpressionAttributeValues: dict[str, Any],
+        ReturnValues: str = "NONE",
+        ConditionExpression: Any = None,
+        **_: Any,
+    ) -> dict[str, Any]:
+        if ConditionExpression is not None and not isinstance(ConditionExpression, str):
+            raise NotImplementedError("FakeTable.update_item evaluates string ConditionExpressions only")
+        if not UpdateExpression.strip().upper().startswith("SET "):
+            raise NotImplementedError(f"Unsupported UpdateExpression: {UpdateExpression}")
+        with self.lock:
+            existing = self.items.get(self._key(Key), {})
+            if ConditionExpression and not _condition_holds(
+                existing, ConditionExpression, ExpressionAttributeNames, ExpressionAttributeValues
+            ):
+                raise client_error("ConditionalCheckFailedException", "UpdateItem")
+            item = self.items.setdefault(self._key(Key), copy.deepcopy(Key))
+            for name_token, value_token, existing_token, default_token in _SET_ASSIGNMENT.findall(UpdateExpression):
+                if existing_token:
+                    item.setdefault(ExpressionAttributeNames[existing_token], ExpressionAttributeValues[default_token])
+                    continue
+                item[ExpressionAttributeNames[name_token]] = copy.deepcopy(ExpressionAttributeValues[value_token])
+            updated = copy.deepcopy(item)
+        return {"Attributes": updated} if ReturnValues == "ALL_NEW" else {}
+
+    def query(
+        self,
+        KeyConditionExpression: Any,
+        ScanIndexForward: bool = True,
+        Limit: int | None = None,
+        ExclusiveStartKey: dict[str, Any] | None = None,
+        IndexName: str | None = None,
+        FilterExpression: Any = None,
+        ProjectionExpression: str | None = None,
+        ExpressionAttributeNames: dict[str, str] | None = None,
+        **_: Any,
+    ) -> dict[str, Any]:
+        expression = KeyConditionExpression.get_expression()
+        if expression["operator"] != "=":
+            raise NotImplementedError("FakeTable.query supports Key(...).eq(...) only")
+        attribute, value = expression["values"][0].name, expression["values"][1]
+        sort_name = self.indexes[IndexName][1] if IndexName else self.key_names[-1]
+        with self.lock:
+            matches = [copy.deepcopy(item) for item in self.items.values() if item.get(attribute) == value]
+        if IndexName:
+            # Items without the index sort key are not in a GSI.
+            matches = [item for item in matches if sort_name in item]
+        matches.sort(key=lambda item: (item.get(sort_name), self._key(item)), reverse=not ScanIndexForward)
+        if ExclusiveStartKey:
+            start = self._key(ExclusiveStartKey)
+            positions = [i for i, item in enumerate(matches) if self._key(item) == start]
+            matches = matches[positions[0] + 1 :] if positions else matches
+
+        # Like DynamoDB, Limit caps the items evaluated and the filter runs afterwards.
+        evaluated = matches[:Limit] if Limit else matches
+        response: dict[str, Any] = {"Items": [item for item in evaluated if _matches_filter(item, FilterExpression)]}
+        if Limit and len(matches) > Limit:
+            last = evaluated[-1]
+            key_names = {*self.key_names, *(self.indexes[IndexName] if IndexName else ())}
+            response["LastEvaluatedKey"] = {name: last[name] for name in key_names}
+        if ProjectionExpression:
+            names = ExpressionAttributeNames or {}
+            response["Items"] = [_project(item, ProjectionExpression, names) for item in response["Items"]]
+        response["Count"] = len(response["Items"])
+        response["ScannedCount"] = len(evaluated)
+        return response
+
+
+class FakeBatchWriter:
+    """Table.batch_writer() stand-in: buffers puts and flushes them in BatchWriteItem-sized groups."""
+
+    BATCH_SIZE = 25
+
+    def __init__(self, table: FakeTable) -> None:
+        self.table = table
+        self.pending: list[dict[str, Any]] = []
+        self.flushes = 0
+
+    def put_item(self, Item: dict[str, Any]) -> None:
+        self.pending.append(Item)
+        if len(self.pending) >= self.BATCH_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        for item in self.pending:
+            self.table.put_item(Item=item)
+        self.pending = []
+        self.flushes += 1
+
+    def __enter__(self) -> FakeBatchWriter:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self.pending:
+            self._flush()
+
+
+def _project(item: dict[str, Any], projection: str, names: dict[str, str]) -> dict[str, Any]:
+    fields = [names.get(part.strip(), part.strip()) for part in projection.split(",")]
+    return {name: item[name] for name in fields if name in item}
+
+
+def _matches_filter(item: dict[str, Any], condition: Any) -> bool:
+    if condition is None:
+        return True
+    expression = condition.get_expression()
+    if expression["operator"] != "=":
+        raise NotImplementedError("FakeTable.query supports Attr(...).eq(...) filters only")
+    attribute, value = expression["values"][0].name, expression["values"][1]
+    return item.get(attribute) == value
+
+
+class FakeDynamoDB:
+    """Stands in for `boto3.resource("dynamodb")`; tables are declared with their key names."""
+
+    def __init__(
+        self,
+        key_schema: dict[str, tuple[str, ...]],
+        indexes: dict[str, dict[str, tuple[str, str]]] | None = None,
+    ) -> None:
+        indexes = indexes or {}
+        self.tables = {name: FakeTable(name, keys, indexes.get(name)) for name, keys in key_schema.items()}
+
+    def Table(self, name: str) -> FakeTable:  # noqa: N802 - mirrors the boto3 resource API
+        return self.tables[name]
@@ -0,0 +1,586 @@
+#!/usr/bin/env python3
+"""
+Load generator for the API control plane.
+
+Every virtual-user session follows the frontend flow: `POST /api/jobs`, the
+presigned S3 upload, `--polls` rounds of `GET /api/jobs/{id}` and finally
+`GET /api/jobs`. Requests go out over async httpx, so one process can keep
+hundreds of sessions in flight.
+
+Load shapes:
+- closed loop (default): `--users` sessions run back to back for `--duration`
+  seconds, with an optional exponential `--think-time` between them;
+- open loop: `--rates 5,10,20` starts sessions as a Poisson process at each
+  rate for `--duration` seconds per step. `--users` caps the sessions in
+  flight and arrivals beyond the cap are counted as dropped, so the step where
+  achieved rate, p95 or errors fall away is where the API saturates.
+
+Targets and auth:
+- `--local` starts `main.app` under uvicorn in a child process with the
+  in-memory DynamoDB/S3 stand-ins from fakes.py (uploads go to a dummy route on
+  the same server) and signs tokens locally;
+- `--base-url` drives a running API. `--auth local` signs RS256 tokens with a
+  throwaway key and serves its JWKS on `--jwks-port`; point the API's
+  `CLERK_JWKS_URL` at the printed URL. `--auth clerk` uses real Clerk session
+  tokens (as in test_deployed_api_with_clerk.py), refreshed before they expire.
+
+Per-endpoint latency is kept in log-scale histograms; `--json-out` saves the
+result.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import secrets
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+BENCH_DIR = Path(__file__).resolve().parent
+API_DIR = BENCH_DIR.parent / "api"
+LOCAL_ISSUER = "https://clerk.load-test.local"
+# Clerk session tokens live 60s; refresh well before that.
+CLERK_TOKEN_REFRESH_SECONDS = 45
+ENDPOINTS = ("create_job", "s3_upload", "get_job", "list_jobs")
+
+
+class LatencyHistogram:
+    """Latencies in geometric buckets (4% wide) plus a count per status code."""
+
+    FLOOR_SECONDS = 0.0005
+    GROWTH = 1.04
+    # Coarse bounds for the printed bar chart.
+    DISPLAY_BOUNDS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, math.inf)
+
+    def __init__(self) -> None:
+        self.buckets: dict[int, int] = {}
+        self.statuses: dict[str, int] = {}
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float, status: str) -> None:
+        index = 0 if seconds <= self.FLOOR_SECONDS else int(math.log(seconds / self.FLOOR_SECONDS, self.GROWTH)) + 1
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def _upper(self, index: int) -> float:
+        return self.FLOOR_SECONDS * self.GROWTH**index
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                return min(self._upper(index), self.max_seconds)
+        return self.max_seconds
+
+    @property
+    def errors(self) -> int:
+        # 4xx/5xx and transport errors (timeouts, resets) all count.
+        return sum(n for status, n in self.statuses.items() if not status.isdigit() or int(status) >= 400)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean": self.total_seconds / self.count if self.count else 0.0,
+            "p50": self.percentile(0.50),
+            "p90": self.percentile(0.90),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": self.max_seconds,
+            "statuses": dict(sorted(self.statuses.items())),
+        }
+
+    def render(self, width: int = 40) -> list[str]:
+        counts = [0] * len(self.DISPLAY_BOUNDS)
+        for index, n in self.buckets.items():
+            upper = self._upper(index)
+            slot = next(i for i, bound in enumerate(self.DISPLAY_BOUNDS) if upper <= bound or bound == math.inf)
+            counts[slot] += n
+        peak = max(counts) or 1
+        lines = []
+        for bound, n in zip(self.DISPLAY_BOUNDS, counts):
+            label = "> 10s" if bound == math.inf else f"<= {bound * 1000:g}ms"
+            lines.append(f"  {label:>11} {n:>7} {'#' * round(width * n / peak)}")
+        return lines
+
+
+class LocalSigner:
+    """RS256 token signer with its JWKS served over HTTP, standing in for Clerk."""
+
+    def __init__(self, port: int) -> None:
+        import jwt
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        self._jwt = jwt
+        self.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.kid = f"load-test-{secrets.token_hex(4)}"
+        public_jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(self.private_key.public_key()))
+        jwks = json.dumps({"keys": [{**public_jwk, "kid": self.kid, "use": "sig", "alg": "RS256"}]}).encode("utf-8")
+
+        class JwksHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                self.send_response(200)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(jwks)))
+                self.end_headers()
+                self.wfile.write(jwks)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002, ARG002
+                return
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), JwksHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    @property
+    def jwks_url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_port}/.well-known/jwks.json"
+
+    def token(self, user_id: str, email: str, ttl_seconds: int) -> str:
+        now = int(time.time())
+        claims = {"sub": user_id, "email": email, "iss": LOCAL_ISSUER, "iat": now, "nbf": now, "exp": now + ttl_seconds}
+        return self._jwt.encode(claims, self.private_key, algorithm="RS256", headers={"kid": self.kid})
+
+    def close(self) -> None:
+        self.server.shutdown()
+
+
+class LocalTokens:
+    """One signed identity per virtual user, so per-user queries stay small."""
+
+    def __init__(self, signer: LocalSigner, identities: int, ttl_seconds: int) -> None:
+        self.tokens = [
+            signer.token(f"user_load_{i:04d}", f"load+{i}@example.com", ttl_seconds) for i in range(identities)
+        ]
+
+    def token(self, user_index: int) -> str:
+        return self.tokens[user_index % len(self.tokens)]
+
+    async def close(self) -> None:
+        return
+
+
+class ClerkTokens:
+    """Real Clerk session tokens for `--clerk-users` test users, refreshed in the background."""
+
+    def __init__(self, identities: int) -> None:
+        sys.path.insert(0, str(API_DIR))
+        import test_deployed_api_with_clerk as e2e
+
+        self.e2e = e2e
+        self.secret_key = e2e.require_env("CLERK_SECRET_KEY")
+        self.api_base_url = os.getenv("CLERK_API_BASE_URL", "https://api.clerk.com").strip()
+        password = os.getenv("CLERK_TEST_USER_PASSWORD", "P@ssw0rd!test123")
+        self.sessions: list[str] = []
+        for i in range(identities):
+            user_id, _ = e2e.find_or_create_clerk_user(
+                self.secret_key, f"api-load-test-{i}@example.com", password, self.api_base_url
+            )
+            self.sessions.append(e2e.create_clerk_session(self.secret_key, user_id, self.api_base_url))
+        self.tokens = [self._mint(session_id) for session_id in self.sessions]
+        self._refresher: asyncio.Task | None = None
+
+    def _mint(self, session_id: str) -> str:
+        return self.e2e.create_session_token(self.secret_key, session_id, self.api_base_url)
+
+    async def _refresh_forever(self) -> None:
+        while True:
+            await asyncio.sleep(CLERK_TOKEN_REFRESH_SECONDS)
+            for i, session_id in enumerate(self.sessions):
+                self.tokens[i] = await asyncio.to_thread(self._mint, session_id)
+
+    def token(self, user_index: int) -> str:
+        if self._refresher is None:
+            self._refresher = asyncio.get_running_loop().create_task(self._refresh_forever())
+        return self.tokens[user_index % len(self.tokens)]
+
+    async def close(self) -> None:
+        if self._refresher is not None:
+            self._refresher.cancel()
+
+
+class LoadContext:
+    def __init__(self, client: httpx.AsyncClient, base_url: str, tokens: Any, args: argparse.Namespace) -> None:
+        self.client = client
+        self.base_url = base_url.rstrip("/")
+        self.tokens = tokens
+        self.upload = not args.no_upload
+        self.polls = args.polls
+        self.poll_interval = args.poll_interval
+        self.audio = upload_body(args.clip_seconds)
+
+
+class StageResult:
+    def __init__(self, label: str, offered_rate: float | None) -> None:
+        self.label = label
+        self.offered_rate = offered_rate
+        self.endpoints = {name: LatencyHistogram() for name in ENDPOINTS}
+        self.sessions = 0
+        self.failed_sessions = 0
+        self.dropped = 0
+        self.wall_seconds = 0.0
+
+    def summary(self) -> dict[str, Any]:
+        requests = sum(h.count for h in self.endpoints.values())
+        errors = sum(h.errors for h in self.endpoints.values())
+        wall = self.wall_seconds or 1.0
+        return {
+            "label": self.label,
+            "offered_rate": self.offered_rate,
+            "wall_s": self.wall_seconds,
+            "sessions": self.sessions,
+            "failed_sessions": self.failed_sessions,
+            "dropped": self.dropped,
+            "achieved_rate": (self.sessions - self.failed_sessions) / wall,
+            "requests_per_s": requests / wall,
+            "error_ratio": errors / requests if requests else 0.0,
+            "endpoints": {name: h.summary() for name, h in self.endpoints.items() if h.count},
+        }
+
+
+def upload_body(clip_seconds: float) -> bytes:
+    from run_bench import synthetic_speech, wav_bytes
+
+    return wav_bytes(synthetic_speech(clip_seconds, seed=0))
+
+
+async def timed(stage: StageResult, name: str, request) -> httpx.Response | None:
+    started = time.perf_counter()
+    try:
+        response = await request
+        status = str(response.status_code)
+    except httpx.HTTPError as exc:
+        response, status = None, type(exc).__name__
+    stage.endpoints[name].record(time.perf_counter() - started, status)
+    return response
+
+
+async def run_session(ctx: LoadContext, stage: StageResult, user_index: int) -> bool:
+    headers = {"authorization": f"Bearer {ctx.tokens.token(user_index)}"}
+    response = await timed(
+        stage,
+        "create_job",
+        ctx.client.post(
+            f"{ctx.base_url}/api/jobs",
+            json={
+                "filename": "load-test.wav",
+                "file_size": len(ctx.audio),
+                "content_type": "audio/wav",
+                "language": "en",
+            },
+            headers=headers,
+        ),
+    )
+    if response is None or response.status_code != 200:
+        return False
+    payload = response.json()
+    job_id = payload["job_id"]
+
+    if ctx.upload:
+        upload = payload["upload"]
+        response = await timed(
+            stage,
+            "s3_upload",
+            ctx.client.post(
+                upload["url"],
+                data={str(k): str(v) for k, v in upload["fields"].items()},
+                files={"file": ("load-test.wav", ctx.audio, "audio/wav")},
+            ),
+        )
+        if response is None or response.status_code >= 300:
+            return False
+
+    for _ in range(ctx.polls):
+        await asyncio.sleep(ctx.poll_interval)
+        response = await timed(stage, "get_job", ctx.client.get(f"{ctx.base_url}/api/jobs/{job_id}", headers=headers))
+        if response is None or response.status_code != 200:
+            return False
+
+    response = await timed(stage, "list_jobs", ctx.client.get(f"{ctx.base_url}/api/jobs", headers=headers))
+    return response is not None and response.status_code == 200
+
+
+async def tracked_session(ctx: LoadContext, stage: StageResult, user_index: int) -> None:
+    stage.sessions += 1
+    if not await run_session(ctx, stage, user_index):
+        stage.failed_sessions += 1
+
+
+async def closed_loop(ctx: LoadContext, users: int, duration: float, think_time: float) -> StageResult:
+    stage = StageResult(f"closed x{users}", None)
+    rng = random.Random(0)
+    started = time.monotonic()
+    deadline = started + duration
+
+    async def virtual_user(user_index: int) -> None:
+        while time.monotonic() < deadline:
+            await tracked_session(ctx, stage, user_index)
+            if think_time > 0:
+                await asyncio.sleep(rng.expovariate(1.0 / think_time))
+
+    await asyncio.gather(*(virtual_user(i) for i in range(users)))
+    stage.wall_seconds = time.monotonic() - started
+    return stage
+
+
+async def open_loop(ctx: LoadContext, rate: float, duration: float, max_in_flight: int) -> StageResult:
+    stage = StageResult(f"{rate:g}/s", rate)
+    rng = random.Random(int(rate * 1000))
+    in_flight: set[asyncio.Task] = set()
+    started = time.monotonic()
+    next_arrival = started
+    arrivals = 0
+    while True:
+        next_arrival += rng.expovariate(rate)
+        if next_arrival >= started + duration:
+            break
+        await asyncio.sleep(max(0.0, next_arrival - time.monotonic()))
+        if len(in_flight) >= max_in_flight:
+            stage.dropped += 1
+            continue
+        task = asyncio.create_task(tracked_session(ctx, stage, arrivals))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+        arrivals += 1
+    if in_flight:
+        await asyncio.gather(*in_flight)
+    stage.wall_seconds = time.monotonic() - started
+    return stage
+
+
+def saturation_note(stages: list[dict[str, Any]]) -> str:
+    if not stages or stages[0]["offered_rate"] is None:
+        return ""
+    # Poisson arrivals make short steps noisy, so the signals are drops, errors and a p95 knee.
+    base_p95 = stages[0]["endpoints"].get("create_job", {}).get("p95", 0.0)
+    for previous, stage in zip([None, *stages], stages):
+        reasons = []
+        if stage["dropped"]:
+            reasons.append(f"{stage['dropped']} arrivals dropped at the in-flight cap")
+        if stage["error_ratio"] > 0.01:
+            reasons.append(f"errors {stage['error_ratio']:.1%}")
+        p95 = stage["endpoints"].get("create_job", {}).get("p95", 0.0)
+        if previous and base_p95 and p95 > 3 * base_p95:
+            reasons.append(f"create p95 {p95:.3f}s vs {base_p95:.3f}s at {stages[0]['label']}")
+        if reasons:
+            last_good = f"; last healthy step {previous['label']}" if previous else ""
+            return f"Saturated at {stage['label']} ({', '.join(reasons)}){last_good}"
+    return "No saturation up to the highest rate step"
+
+
+def print_report(stages: list[dict[str, Any]], histograms: list[StageResult], show_histograms: bool) -> None:
+    print("")
+    print(
+        f"{'step':<14}{'sessions':>9}{'failed':>8}{'dropped':>9}{'ok/s':>8}{'req/s':>8}{'err':>7}"
+        f"{'create p95':>12}{'get p95':>10}{'list p95':>10}"
+    )
+    for stage in stages:
+        p95 = {name: stats["p95"] for name, stats in stage["endpoints"].items()}
+        print(
+            f"{stage['label']:<14}{stage['sessions']:>9}{stage['failed_sessions']:>8}{stage['dropped']:>9}"
+            f"{stage['achieved_rate']:>8.2f}{stage['requests_per_s']:>8.1f}{stage['error_ratio']:>7.1%}"
+            f"{p95.get('create_job', 0.0):>12.3f}{p95.get('get_job', 0.0):>10.3f}{p95.get('list_jobs', 0.0):>10.3f}"
+        )
+
+    for stage, result in zip(stages, histograms):
+        print("")
+        print(f"[{stage['label']}]")
+        print(f"  {'endpoint':<12}{'count':>8}{'p50':>9}{'p90':>9}{'p95':>9}{'p99':>9}{'max':>9}  statuses")
+        for name, stats in stage["endpoints"].items():
+            print(
+                f"  {name:<12}{stats['count']:>8}{stats['p50']:>9.3f}{stats['p90']:>9.3f}{stats['p95']:>9.3f}"
+                f"{stats['p99']:>9.3f}{stats['max']:>9.3f}  {stats['statuses']}"
+            )
+        if show_histograms:
+            for name, histogram in result.endpoints.items():
+                if histogram.count:
+                    print(f"  {name} latency:")
+                    print("\n".join(histogram.render()))
+
+
+def serve_local_app(port: int, jwks_url: str) -> int:
+    from run_bench import (
+        AUDIO_BUCKET,
+        JOBS_CREATED_AT_INDEX,
+        JOBS_TABLE,
+        TRANSCRIPT_BUCKET,
+        USERS_TABLE,
+        bench_dynamodb,
+    )
+
+    # main.py reads its configuration at import time.
+    os.environ.update(
+        {
+            "AWS_REGION": "us-east-1",
+            "AWS_ACCESS_KEY_ID": "load-test",
+            "AWS_SECRET_ACCESS_KEY": "load-test",
+            "USERS_TABLE_NAME": USERS_TABLE,
+            "JOBS_TABLE_NAME": JOBS_TABLE,
+            "JOBS_CREATED_AT_INDEX_NAME": JOBS_CREATED_AT_INDEX,
+            "AUDIO_BUCKET_NAME": AUDIO_BUCKET,
+            "TRANSCRIPT_BUCKET_NAME": TRANSCRIPT_BUCKET,
+            "CLERK_JWKS_URL": jwks_url,
+        }
+    )
+    sys.path.insert(0, str(API_DIR))
+    import uvicorn
+    from fastapi import Response
+
+    import main as api
+    from fakes import FakeS3
+
+    api.dynamodb = bench_dynamodb()
+    api.s3_client = FakeS3(post_endpoint=f"http://127.0.0.1:{port}/_fake_s3")
+
+    async def fake_s3_upload(request) -> Response:
+        # Accepts the presigned form without storing it; S3 answers 204 by default.
+        await request.body()
+        return Response(status_code=204)
+
+    api.app.add_route("/_fake_s3/{bucket}", fake_s3_upload, methods=["POST"], include_in_schema=False)
+
+    uvicorn.run(api.app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+    return 0
+
+
+def start_local_app(port: int, jwks_url: str) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, __file__, "--serve-app", "--port", str(port), "--jwks-url", jwks_url],
+        cwd=BENCH_DIR,
+        # The app logs an api_auth line per request; tracebacks still reach stderr.
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Local API exited with code {process.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("Local API did not become healthy within 30s")
+
+
+async def run_load(args: argparse.Namespace, base_url: str, tokens: Any) -> list[StageResult]:
+    limits = httpx.Limits(max_connections=args.users * 2, max_keepalive_connections=args.users * 2)
+    async with httpx.AsyncClient(limits=limits, timeout=args.timeout) as client:
+        ctx = LoadContext(client, base_url, tokens, args)
+        try:
+            rates = [float(r) for r in args.rates.split(",") if r.strip()]
+            if not rates:
+                print(f"Closed loop: {args.users} users for {args.duration:g}s against {base_url}")
+                return [await closed_loop(ctx, args.users, args.duration, args.think_time)]
+            results = []
+            for rate in rates:
+                print(f"Open loop: {rate:g} sessions/s for {args.duration:g}s (max {args.users} in flight)")
+                results.append(await open_loop(ctx, rate, args.duration, args.users))
+            return results
+        finally:
+            await tokens.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Concurrent load generator for the transcription API.")
+    parser.add_argument("--base-url", default="", help="API to drive. Defaults to API_BASE_URL unless --local.")
+    parser.add_argument("--local", action="store_true", help="Start main.app locally with in-memory AWS stand-ins.")
+    parser.add_argument("--port", type=int, default=8787, help="Port for --local.")
+    parser.add_argument("--auth", choices=["local", "clerk"], default="local")
+    parser.add_argument("--jwks-port", type=int, default=8765, help="Port for the local signer's JWKS.")
+    parser.add_argument("--clerk-users", type=int, default=1, help="Clerk test users to spread sessions over.")
+    parser.add_argument("--users", type=int, default=20, help="Virtual users (closed loop) or in-flight cap (open loop).")
+    parser.add_argument("--rates", default="", help="Comma-separated session arrival rates per second (open loop).")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds per run or per rate step.")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean pause between sessions (closed loop).")
+    parser.add_argument("--polls", type=int, default=3, help="GET /api/jobs/{id} calls per session.")
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--clip-seconds", type=float, default=2.0, help="Length of the uploaded WAV.")
+    parser.add_argument("--no-upload", action="store_true", help="Skip the presigned S3 upload (no worker load).")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds.")
+    parser.add_argument("--histogram", action="store_true", help="Print latency bar charts per endpoint.")
+    parser.add_argument("--json-out", default="", help="Write the result as JSON to this path.")
+    parser.add_argument("--serve-app", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--jwks-url", default="", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve_app:
+        return serve_local_app(args.port, args.jwks_url)
+
+    sys.path.insert(0, str(API_DIR))
+    from test_deployed_api_with_clerk import load_dotenv
+
+    load_dotenv(None)
+    if args.local and args.auth != "local":
+        print("FAIL: --local only works with --auth local")
+        return 1
+
+    signer = None
+    app_process = None
+    if args.auth == "local":
+        signer = LocalSigner(args.jwks_port)
+        # Tokens outlive the whole run, including every rate step.
+        steps = max(1, len([r for r in args.rates.split(",") if r.strip()]))
+        tokens: Any = LocalTokens(signer, args.users, int(args.duration * steps) + 600)
+        print(f"Local signer JWKS: {signer.jwks_url}")
+    else:
+        tokens = ClerkTokens(args.clerk_users)
+
+    try:
+        if args.local:
+            app_process = start_local_app(args.port, signer.jwks_url)
+            base_url = f"http://127.0.0.1:{args.port}"
+        else:
+            base_url = args.base_url.strip() or os.getenv("API_BASE_URL", "").strip()
+            if not base_url:
+                print("FAIL: pass --base-url, set API_BASE_URL or use --local")
+                return 1
+        results = asyncio.run(run_load(args, base_url, tokens))
+    finally:
+        if app_process is not None:
+            app_process.terminate()
+            app_process.wait(timeout=10)
+        if signer is not None:
+            signer.close()
+
+    stages = [result.summary() for result in results]
+    print_report(stages, results, args.histogram)
+    note = saturation_note(stages)
+    if note:
+        print("")
+        print(note)
+
+    if args.json_out:
+        Path(args.json_out).write_text(
+            json.dumps({"base_url": base_url, "auth": args.auth, "stages": stages}, indent=2), encoding="utf-8"
+        )
+        print(f"\nWrote {args.json_out}")
+
+    if not any(stage["sessions"] - stage["failed_sessions"] for stage in stages):
+        print("FAIL: no session completed")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
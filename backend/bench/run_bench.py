@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Offline end-to-end throughput benchmark: API -> S3 -> SQS -> worker -> DynamoDB.
+
+The FastAPI app (through TestClient) and worker.py run in this process against
+the in-memory stand-ins in fakes.py, so a run needs no AWS account, Clerk tenant
+or network. Jobs are created through `POST /api/jobs`, their synthetic audio is
+"uploaded" to the fake audio bucket (which raises the S3 event), and the worker
+drains the queues either one batch at a time through `process_messages` or with
+the threaded `JobScheduler`.
+
+Inference is a stub that sleeps `--stub-rtf` seconds per second of audio unless
+`--model real` loads the worker's Whisper pipeline. Decoding still goes through
+ffmpeg, so ffmpeg must be on PATH. Per-stage numbers come from the `timings`
+map the worker writes onto each job item.
+
+Use `--json-out` to keep a result and `--baseline` to fail (exit 1) when
+jobs/sec drops or a stage p95 grows by more than `--max-regression`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import shutil
+import sys
+import threading
+import time
+import wave
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+BENCH_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = BENCH_DIR.parent
+SAMPLING_RATE = 16000
+
+AUDIO_BUCKET = "bench-audio"
+TRANSCRIPT_BUCKET = "bench-transcripts"
+USERS_TABLE = "bench-users"
+JOBS_TABLE = "bench-jobs"
+JOBS_CREATED_AT_INDEX = "clerk_user_id-created_at-index"
+BULK_QUEUE_URL = "https://sqs.local/bench/transcription"
+FAST_QUEUE_URL = "https://sqs.local/bench/transcription-fast"
+NOTIFICATION_QUEUE_URL = "https://sqs.local/bench/notification"
+BENCH_USER_ID = "user_bench"
+
+
+def configure_env(args: argparse.Namespace) -> None:
+    # worker.py and main.py read their configuration at import time.
+    os.environ.update(
+        {
+            "AWS_REGION": "us-east-1",
+            "AWS_ACCESS_KEY_ID": "bench",
+            "AWS_SECRET_ACCESS_KEY": "bench",
+            "USERS_TABLE_NAME": USERS_TABLE,
+            "JOBS_TABLE_NAME": JOBS_TABLE,
+            "JOBS_CREATED_AT_INDEX_NAME": JOBS_CREATED_AT_INDEX,
+            "AUDIO_BUCKET_NAME": AUDIO_BUCKET,
+            "TRANSCRIPT_BUCKET_NAME": TRANSCRIPT_BUCKET,
+            "TRANSCRIPTION_QUEUE_URL": BULK_QUEUE_URL,
+            "FAST_TRANSCRIPTION_QUEUE_URL": FAST_QUEUE_URL,
+            "FAST_LANE_MAX_BYTES": str(10 * 1024 * 1024),
+            "NOTIFICATION_QUEUE_URL": NOTIFICATION_QUEUE_URL,
+            "CLERK_JWKS_URL": "https://clerk.bench.local/.well-known/jwks.json",
+            "POLL_WAIT_SECONDS": "1",
+            # A failed job is reported once instead of being retried for the rest of the run.
+            "FAILED_JOB_RETRY_DELAY_SECONDS": "3600",
+            "RECEIVE_MAX_MESSAGES": str(args.receive_max_messages),
+            "WORKER_INGEST_MODE": args.ingest_mode,
+            "WORKER_METRICS_EMF": "false",
+            "WORKER_WARMUP_SECONDS": "0" if args.model == "stub" else os.getenv("WORKER_WARMUP_SECONDS", "1"),
+        }
+    )
+    if args.model == "stub":
+        # Forcing a decoder language needs the transformers tokenizer tables.
+        os.environ["WHISPER_FORCE_LANGUAGE"] = "false"
+    for path in (BENCH_DIR, BACKEND_DIR / "worker", BACKEND_DIR / "api"):
+        sys.path.insert(0, str(path))
+
+
+def bench_dynamodb():
+    from fakes import FakeDynamoDB
+
+    return FakeDynamoDB(
+        {USERS_TABLE: ("clerk_user_id",), JOBS_TABLE: ("clerk_user_id", "job_id")},
+        {JOBS_TABLE: {JOBS_CREATED_AT_INDEX: ("clerk_user_id", "created_at")}},
+    )
+
+
+def synthetic_speech(seconds: float, seed: int) -> np.ndarray:
+    """Voiced bursts of 0.5-3s separated by 0.2-1.5s of low noise, roughly like dictation."""
+    rng = np.random.default_rng(seed)
+    total = int(seconds * SAMPLING_RATE)
+    audio = rng.normal(0.0, 0.002, total).astype(np.float32)
+    position = 0
+    while position < total:
+        burst = int(rng.uniform(0.5, 3.0) * SAMPLING_RATE)
+        end = min(position + burst, total)
+        t = np.arange(end - position) / SAMPLING_RATE
+        pitch = rng.uniform(110, 260)
+        voiced = sum(np.sin(2 * np.pi * pitch * h * t) / h for h in range(1, 6))
+        envelope = 0.5 * (1 + np.sin(2 * np.pi * rng.uniform(2, 6) * t))
+        audio[position:end] += (0.2 * voiced * envelope).astype(np.float32)
+        position = end + int(rng.uniform(0.2, 1.5) * SAMPLING_RATE)
+    return np.clip(audio, -1.0, 1.0)
+
+
+def wav_bytes(audio: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLING_RATE)
+        wav.writeframes((audio * 32767).astype("<i2").tobytes())
+    return buffer.getvalue()
+
+
+class StubTranscriber:
+    """Pipeline-shaped stand-in whose cost scales with audio length."""
+
+    def __init__(self, worker, rtf: float) -> None:
+        self.worker = worker
+        self.rtf = rtf
+
+    def _one(self, item: Any) -> dict[str, Any]:
+        audio = item["raw"] if isinstance(item, dict) else self.worker.decode_audio_file(item)
+        seconds = len(audio) / SAMPLING_RATE
+        time.sleep(seconds * self.rtf)
+        text = " ".join(["bench"] * max(1, int(seconds * 2.5)))
+        return {"text": text, "chunks": [{"timestamp": (0.0, round(seconds, 2)), "text": text}]}
+
+    def __call__(self, inputs: Any, **options: Any) -> Any:  # noqa: ARG002
+        if isinstance(inputs, list):
+            return [self._one(item) for item in inputs]
+        return self._one(inputs)
+
+
+class StubModelPool:
+    def __init__(self, transcriber: StubTranscriber) -> None:
+        self.transcriber = transcriber
+
+    def get(self, model_id: str) -> StubTranscriber:  # noqa: ARG002
+        return self.transcriber
+
+    def resolve(self, model_id: str) -> tuple[str, StubTranscriber]:
+        return model_id, self.transcriber
+
+
+def peak_rss_mb(who: int = resource.RUSAGE_SELF) -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(who).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {"p50": float(p50), "p95": float(p95), "p99": float(p99), "count": len(values)}
+
+
+def submit_jobs(client, s3, durations: list[float], job_count: int) -> tuple[list[str], dict[str, list[float]]]:
+    job_ids: list[str] = []
+    api_seconds: dict[str, list[float]] = {"api_create_s": [], "audio_put_s": []}
+    for index in range(job_count):
+        # A distinct seed per job keeps the worker's content-hash cache from short-circuiting.
+        body = wav_bytes(synthetic_speech(durations[index % len(durations)], seed=index))
+        started = time.perf_counter()
+        response = client.post(
+            "/api/jobs",
+            json={
+                "filename": f"bench-{index}.wav",
+                "file_size": len(body),
+                "content_type": "audio/wav",
+                "language": "en",
+            },
+        )
+        api_seconds["api_create_s"].append(time.perf_counter() - started)
+        if response.status_code != 200:
+            raise RuntimeError(f"POST /api/jobs failed: {response.status_code} {response.text}")
+        payload = response.json()
+
+        started = time.perf_counter()
+        s3.put_object(Bucket=AUDIO_BUCKET, Key=payload["upload"]["object_key"], Body=body, ContentType="audio/wav")
+        api_seconds["audio_put_s"].append(time.perf_counter() - started)
+        job_ids.append(payload["job_id"])
+    return job_ids, api_seconds
+
+
+def all_jobs_finished(jobs_table, job_ids: list[str]) -> bool:
+    # Failed messages stay on the queue for retry, so completion is read from the job items.
+    for job_id in job_ids:
+        item = jobs_table.get_item(Key={"clerk_user_id": BENCH_USER_ID, "job_id": job_id}).get("Item", {})
+        if item.get("status") not in {"COMPLETED", "FAILED"}:
+            return False
+    return True
+
+
+def drain_sequential(worker, models, jobs_table, job_ids: list[str]) -> None:
+    receiver = worker.LaneReceiver()
+    while not all_jobs_finished(jobs_table, job_ids):
+        messages = receiver.receive(worker.RECEIVE_MAX_MESSAGES)
+        if messages:
+            worker.process_messages(messages, models)
+
+
+def drain_scheduler(worker, models, jobs_table, job_ids: list[str]) -> None:
+    scheduler = worker.JobScheduler(models)
+
+    def stop_when_idle() -> None:
+        while not all_jobs_finished(jobs_table, job_ids):
+            time.sleep(0.05)
+        scheduler.stop()
+
+    watcher = threading.Thread(target=stop_when_idle, daemon=True)
+    watcher.start()
+    scheduler.run()
+    watcher.join()
+
+
+def collect_results(client, jobs_table, job_ids: list[str]) -> tuple[dict[str, int], dict[str, list[float]]]:
+    statuses: dict[str, int] = {}
+    stages: dict[str, list[float]] = {"api_get_s": []}
+    for job_id in job_ids:
+        started = time.perf_counter()
+        response = client.get(f"/api/jobs/{job_id}")
+        stages["api_get_s"].append(time.perf_counter() - started)
+        status = response.json().get("status", "UNKNOWN") if response.status_code == 200 else "MISSING"
+        statuses[status] = statuses.get(status, 0) + 1
+
+        item = jobs_table.get_item(Key={"clerk_user_id": BENCH_USER_ID, "job_id": job_id}).get("Item", {})
+        for name, value in item.get("timings", {}).items():
+            if name.endswith("_s") or name in {"rtf", "download_bytes_per_s"}:
+                stages.setdefault(name, []).append(float(value))
+    return statuses, stages
+
+
+def compare_to_baseline(result: dict[str, Any], baseline: dict[str, Any], max_regression: float) -> list[str]:
+    failures = []
+    if result["jobs_per_sec"] < baseline["jobs_per_sec"] * (1 - max_regression):
+        failures.append(f"jobs_per_sec {result['jobs_per_sec']:.2f} < baseline {baseline['jobs_per_sec']:.2f}")
+    for stage, stats in result["stages"].items():
+        base = baseline.get("stages", {}).get(stage)
+        # Rates improve upwards and sub-millisecond stages are noise; neither is a latency regression.
+        if not base or stage in {"download_bytes_per_s"} or base["p95"] < 0.001:
+            continue
+        if stats["p95"] > base["p95"] * (1 + max_regression):
+            failures.append(f"{stage} p95 {stats['p95']:.4f} > baseline {base['p95']:.4f}")
+    return failures
+
+
+def print_report(result: dict[str, Any]) -> None:
+    print("")
+    print(
+        f"jobs={result['jobs']} mode={result['mode']} model={result['model']} "
+        f"wall_s={result['worker_wall_s']:.2f} jobs_per_sec={result['jobs_per_sec']:.2f} "
+        f"audio_hours_per_hour={result['audio_hours_per_hour']:.1f}"
+    )
+    print(f"statuses={result['statuses']}")
+    print(f"peak_rss_mb={result['peak_rss_mb']:.1f} peak_child_rss_mb={result['peak_child_rss_mb']:.1f}")
+    print("")
+    print(f"{'stage':<24}{'count':>7}{'p50':>11}{'p95':>11}{'p99':>11}")
+    for stage, stats in sorted(result["stages"].items()):
+        print(f"{stage:<24}{stats['count']:>7}{stats['p50']:>11.4g}{stats['p95']:>11.4g}{stats['p99']:>11.4g}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline API + worker throughput benchmark with local AWS stand-ins.")
+    parser.add_argument("--jobs", type=int, default=40)
+    parser.add_argument("--durations", default="5,30,120", help="Comma-separated clip lengths in seconds, cycled.")
+    parser.add_argument("--mode", choices=["sequential", "scheduler"], default="scheduler")
+    parser.add_argument("--model", choices=["stub", "real"], default="stub")
+    parser.add_argument("--stub-rtf", type=float, default=0.02, help="Stub inference seconds per audio second.")
+    parser.add_argument("--ingest-mode", choices=["stream", "tempfile"], default="stream")
+    parser.add_argument("--receive-max-messages", type=int, default=4)
+    parser.add_argument("--json-out", default="", help="Write the result as JSON to this path.")
+    parser.add_argument("--baseline", default="", help="Earlier --json-out result to compare against.")
+    parser.add_argument("--max-regression", type=float, default=0.15)
+    parser.add_argument("--verbose", action="store_true", help="Show worker log lines.")
+    args = parser.parse_args()
+
+    if shutil.which("ffmpeg") is None:
+        print("FAIL: ffmpeg not found on PATH (the worker decodes audio with it)")
+        return 1
+
+    configure_env(args)
+    from fastapi.testclient import TestClient
+
+    import main as api
+    import worker
+    from fakes import FakeS3, FakeSQS
+
+    sqs = FakeSQS()
+    for url in (BULK_QUEUE_URL, FAST_QUEUE_URL, NOTIFICATION_QUEUE_URL):
+        sqs.create_queue(url)
+    s3 = FakeS3(sqs, [(AUDIO_BUCKET, "audio/", BULK_QUEUE_URL), (AUDIO_BUCKET, "audio-fast/", FAST_QUEUE_URL)])
+    dynamodb = bench_dynamodb()
+
+    api.dynamodb, api.s3_client = dynamodb, s3
+    worker.sqs, worker.s3, worker.dynamodb = sqs, s3, dynamodb
+    worker.jobs_table = dynamodb.Table(JOBS_TABLE)
+    auth_context = {"clerk_user_id": BENCH_USER_ID, "email": "bench@example.com"}
+    api.app.dependency_overrides[api.get_current_auth_context] = lambda: auth_context
+    api.app.dependency_overrides[api.get_current_user_id] = lambda: BENCH_USER_ID
+    client = TestClient(api.app)
+
+    if args.model == "stub":
+        models = StubModelPool(StubTranscriber(worker, args.stub_rtf))
+    else:
+        models = worker.load_model_pool(worker.WORKER_THREADS_PER_PROCESS)
+
+    durations = [float(d) for d in args.durations.split(",") if d.strip()]
+    print(f"Submitting {args.jobs} jobs ({args.durations}s clips) through the API...")
+    job_ids, api_seconds = submit_jobs(client, s3, durations, args.jobs)
+
+    print(f"Draining queues with mode={args.mode} model={args.model}...")
+    log_sink = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    started = time.perf_counter()
+    with log_sink:
+        drain = drain_sequential if args.mode == "sequential" else drain_scheduler
+        drain(worker, models, dynamodb.Table(JOBS_TABLE), job_ids)
+    wall_seconds = time.perf_counter() - started
+
+    statuses, stages = collect_results(client, dynamodb.Table(JOBS_TABLE), job_ids)
+    stages.update(api_seconds)
+    audio_seconds = sum(durations[i % len(durations)] for i in range(args.jobs))
+    result = {
+        "jobs": args.jobs,
+        "mode": args.mode,
+        "model": args.model,
+        "ingest_mode": args.ingest_mode,
+        "worker_wall_s": wall_seconds,
+        "jobs_per_sec": args.jobs / wall_seconds if wall_seconds else 0.0,
+        "audio_hours_per_hour": audio_seconds / wall_seconds if wall_seconds else 0.0,
+        "statuses": statuses,
+        "peak_rss_mb": peak_rss_mb(),
+        "peak_child_rss_mb": peak_rss_mb(resource.RUSAGE_CHILDREN),
+        "stages": {name: percentiles(values) for name, values in stages.items() if values},
+    }
+    print_report(result)
+
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"\nWrote {args.json_out}")
+
+    if statuses.get("COMPLETED", 0) != args.jobs:
+        print(f"FAIL: only {statuses.get('COMPLETED', 0)}/{args.jobs} jobs completed")
+        return 1
+
+    if args.baseline:
+        failures = compare_to_baseline(result, json.loads(Path(args.baseline).read_text()), args.max_regression)
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        if failures:
+            return 1
+        print(f"PASS: within {args.max_regression:.0%} of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
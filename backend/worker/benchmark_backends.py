@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Compare Whisper CPU backends on a reference clip.
+
+Each backend (WHISPER_BACKEND=torch|torch-int8|onnx) is loaded in its own
+child process, warmed up once, then timed over `--repeats` runs. Accuracy is
+reported as word error rate against `--reference-text` if given, otherwise
+against the plain torch transcript.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+DEFAULT_AUDIO = Path(__file__).resolve().parents[1] / "api" / "harvard.wav"
+
+
+def normalize_words(text: str) -> list[str]:
+    return re.sub(r"[^a-z0-9' ]+", " ", text.lower()).split()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    ref = normalize_words(reference)
+    hyp = normalize_words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, start=1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, start=1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word),
+            )
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def run_child(audio_path: Path, repeats: int) -> int:
+    started = time.perf_counter()
+    import worker
+
+    transcriber = worker.build_transcriber()
+    load_seconds = time.perf_counter() - started
+
+    audio_bytes = audio_path.read_bytes()
+    transcriber(audio_bytes)  # warm-up
+
+    timings = []
+    text = ""
+    for _ in range(repeats):
+        run_started = time.perf_counter()
+        result = transcriber(audio_bytes)
+        timings.append(time.perf_counter() - run_started)
+        text = result["text"].strip() if isinstance(result, dict) else str(result)
+
+    timings.sort()
+    print(
+        json.dumps(
+            {
+                "backend": worker.WHISPER_BACKEND,
+                "load_seconds": round(load_seconds, 3),
+                "median_seconds": round(timings[len(timings) // 2], 3),
+                "min_seconds": round(timings[0], 3),
+                "text": text,
+            }
+        )
+    )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare speed and accuracy of Whisper CPU backends.")
+    parser.add_argument("--audio-file", default=str(DEFAULT_AUDIO))
+    parser.add_argument("--backends", default="torch,torch-int8,onnx", help="Comma-separated backends to compare.")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--reference-text", default="", help="Ground-truth transcript. Defaults to torch output.")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    audio_path = Path(args.audio_file).resolve()
+    if not audio_path.is_file():
+        print(f"Audio file not found: {audio_path}")
+        return 1
+
+    if args.child:
+        return run_child(audio_path, max(1, args.repeats))
+
+    rows = []
+    for backend in [b.strip() for b in args.backends.split(",") if b.strip()]:
+        print(f"Running backend={backend}...")
+        result = subprocess.run(
+            [sys.executable, __file__, "--child", "--audio-file", str(audio_path), "--repeats", str(args.repeats)],
+            cwd=Path(__file__).resolve().parent,
+            env={**os.environ, "WHISPER_BACKEND": backend},
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            print(f"SKIP: backend={backend} failed")
+            print(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else result.stdout)
+            continue
+        rows.append(json.loads(result.stdout.strip().splitlines()[-1]))
+
+    if not rows:
+        print("FAIL: no backend completed")
+        return 1
+
+    reference = args.reference_text.strip()
+    if not reference:
+        torch_row = next((row for row in rows if row["backend"] == "torch"), rows[0])
+        reference = torch_row["text"]
+        print(f"Using backend={torch_row['backend']} transcript as WER reference")
+
+    baseline = next((row["median_seconds"] for row in rows if row["backend"] == "torch"), rows[0]["median_seconds"])
+    print("")
+    print(f"{'backend':<12}{'load_s':>9}{'median_s':>10}{'min_s':>9}{'speedup':>9}{'wer':>8}")
+    for row in rows:
+        speedup = baseline / row["median_seconds"] if row["median_seconds"] else 0.0
+        wer = word_error_rate(reference, row["text"])
+        print(
+            f"{row['backend']:<12}{row['load_seconds']:>9.2f}{row['median_seconds']:>10.3f}"
+            f"{row['min_seconds']:>9.3f}{speedup:>8.2f}x{wer:>8.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
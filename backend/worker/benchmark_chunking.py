@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Compare whole-file and chunked long-form transcription.
+
+Each mode runs in its own child process so peak RSS is measured per mode
+rather than accumulated across runs. The input clip is tiled up to
+`--duration-seconds` to approximate the ~10 minute files seen in production.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SAMPLING_RATE = 16000
+
+
+def load_tiled_audio(audio_path: Path, duration_seconds: float):
+    import numpy as np
+    from transformers.pipelines.audio_utils import ffmpeg_read
+
+    audio = ffmpeg_read(audio_path.read_bytes(), SAMPLING_RATE)
+    target_samples = int(duration_seconds * SAMPLING_RATE)
+    repeats = max(1, -(-target_samples // len(audio)))
+    return np.tile(audio, repeats)[:target_samples]
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_child(
+    mode: str,
+    audio_path: Path,
+    duration_seconds: float,
+    chunk_length_s: float,
+    stride_length_s: float,
+    batch_size: int,
+) -> int:
+    import worker
+
+    audio = load_tiled_audio(audio_path, duration_seconds)
+    transcriber = worker.build_transcriber()
+
+    options: dict = {}
+    if mode == "chunked":
+        options = {
+            "chunk_length_s": chunk_length_s,
+            "stride_length_s": stride_length_s,
+            "batch_size": batch_size,
+        }
+
+    started = time.perf_counter()
+    result = transcriber({"raw": audio, "sampling_rate": SAMPLING_RATE}, **options)
+    elapsed = time.perf_counter() - started
+
+    text = result["text"].strip() if isinstance(result, dict) else str(result)
+    print(
+        json.dumps(
+            {
+                "mode": mode,
+                "audio_seconds": round(len(audio) / SAMPLING_RATE, 2),
+                "wall_seconds": round(elapsed, 3),
+                "peak_rss_mb": round(peak_rss_mb(), 1),
+                "transcript_words": len(text.split()),
+            }
+        )
+    )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark whole-file vs chunked Whisper transcription.")
+    parser.add_argument("--audio-file", default=str(Path(__file__).resolve().parents[1] / "api" / "harvard.wav"))
+    parser.add_argument("--duration-seconds", type=float, default=600.0)
+    parser.add_argument("--chunk-length-s", type=float, default=30.0)
+    parser.add_argument("--stride-length-s", type=float, default=5.0)
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--child-mode", choices=["whole", "chunked"], default="", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    audio_path = Path(args.audio_file).resolve()
+    if not audio_path.is_file():
+        print(f"Audio file not found: {audio_path}")
+        return 1
+
+    if args.child_mode:
+        return run_child(
+            args.child_mode,
+            audio_path,
+            args.duration_seconds,
+            args.chunk_length_s,
+            args.stride_length_s,
+            args.batch_size,
+        )
+
+    rows = []
+    for mode in ["whole", "chunked"]:
+        print(f"Running mode={mode} on {args.duration_seconds:.0f}s of audio...")
+        result = subprocess.run(
+            [sys.executable, __file__, *sys.argv[1:], "--child-mode", mode],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            print(result.stdout)
+            print(result.stderr)
+            print(f"FAIL: mode={mode} exited with {result.returncode}")
+            return 1
+        rows.append(json.loads(result.stdout.strip().splitlines()[-1]))
+
+    print("")
+    print(f"{'mode':<10}{'audio_s':>10}{'wall_s':>10}{'rtf':>8}{'peak_rss_mb':>14}{'words':>8}")
+    for row in rows:
+        rtf = row["wall_seconds"] / row["audio_seconds"] if row["audio_seconds"] else 0.0
+        print(
+            f"{row['mode']:<10}{row['audio_seconds']:>10.1f}{row['wall_seconds']:>10.2f}"
+            f"{rtf:>8.3f}{row['peak_rss_mb']:>14.1f}{row['transcript_words']:>8}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Measure how much audio the VAD pre-pass removes and what it saves in inference.
+
+For every input file the script also builds a "padded" variant with silence
+(light noise) around and inside the clip, approximating hold time and long
+pauses in real uploads, and a "quiet" variant 30 dB down with its pauses
+removed, where the VAD must keep (nearly) everything. Each variant is transcribed whole and as VAD
+segments with the worker's own pipeline and options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+import worker
+from vad import detect_speech_segments, frame_features, speech_ratio
+
+DEFAULT_AUDIO = Path(__file__).resolve().parents[1] / "api" / "harvard.wav"
+
+
+def padded_variant(audio: np.ndarray, silence_seconds: float) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    gap = rng.normal(0.0, 0.0005, int(silence_seconds * worker.SAMPLING_RATE)).astype(np.float32)
+    middle = len(audio) // 2
+    return np.concatenate([gap, audio[:middle], gap, audio[middle:], gap])
+
+
+def quiet_continuous_variant(audio: np.ndarray, attenuation_db: float = 30.0) -> np.ndarray:
+    """The clip without its quietest 30% of frames (the pauses), attenuated: a low-gain speaker who never stops."""
+    energy_db, _, frame_length = frame_features(audio, worker.SAMPLING_RATE)
+    loud = np.repeat(energy_db > np.percentile(energy_db, 30), frame_length)
+    return audio[: len(loud)][loud] * np.float32(10 ** (-attenuation_db / 20))
+
+
+def timed_transcribe(transcriber, inputs: list[np.ndarray]) -> float:
+    options = worker.transcribe_options()
+    started = time.perf_counter()
+    worker.call_transcriber(
+        transcriber,
+        [{"raw": item, "sampling_rate": worker.SAMPLING_RATE} for item in inputs],
+        options,
+    )
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the VAD pre-pass on sample audio files.")
+    parser.add_argument("audio_files", nargs="*", default=[str(DEFAULT_AUDIO)])
+    parser.add_argument("--silence-seconds", type=float, default=20.0, help="Silence inserted in padded variants.")
+    args = parser.parse_args()
+
+    transcriber = worker.build_transcriber()
+    worker.warm_up_transcriber(transcriber, worker.StartupTimer())
+
+    print(f"{'sample':<32}{'audio_s':>9}{'vad_ms':>8}{'skipped':>9}{'full_s':>9}{'vad_s':>8}{'speedup':>9}")
+    for audio_file in args.audio_files:
+        path = Path(audio_file).resolve()
+        if not path.is_file():
+            print(f"Audio file not found: {path}")
+            return 1
+
+        original = worker.decode_audio_file(str(path))
+        variants = [
+            (path.name, original),
+            (f"{path.name}+silence", padded_variant(original, args.silence_seconds)),
+            (f"{path.name}-quiet", quiet_continuous_variant(original)),
+        ]
+        for label, audio in variants:
+            vad_started = time.perf_counter()
+            segments = detect_speech_segments(
+                audio,
+                worker.SAMPLING_RATE,
+                energy_margin_db=worker.VAD_ENERGY_MARGIN_DB,
+                pad_ms=worker.VAD_PAD_MS,
+                min_silence_ms=worker.VAD_MIN_SILENCE_MS,
+                speech_headroom_db=worker.VAD_SPEECH_HEADROOM_DB,
+            )
+            vad_ms = (time.perf_counter() - vad_started) * 1000
+
+            full_seconds = timed_transcribe(transcriber, [audio])
+            vad_seconds = timed_transcribe(transcriber, [audio[start:end] for start, end in segments])
+            skipped = 1.0 - speech_ratio(segments, len(audio))
+            speedup = full_seconds / vad_seconds if vad_seconds else float("inf")
+            print(
+                f"{label:<32}{len(audio) / worker.SAMPLING_RATE:>9.1f}{vad_ms:>8.1f}{skipped:>8.1%}"
+                f"{full_seconds:>9.2f}{vad_seconds:>8.2f}{speedup:>8.2f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -82,6 +82,13 @@ if ([string]::IsNullOrWhiteSpace($workerModelId)) {
     $workerModelId = "openai/whisper-tiny"
 }
 
+$workerBackend = [Environment]::GetEnvironmentVariable("WHISPER_BACKEND")
+if ([string]::IsNullOrWhiteSpace($workerBackend)) {
+    $workerBackend = "torch"
+}
+
+$workerModelRoutes = "$([Environment]::GetEnvironmentVariable("WHISPER_MODEL_ROUTES"))".Trim()
+
 if ([string]::IsNullOrWhiteSpace($RepositoryUrl)) {
     $RepositoryUrl = [Environment]::GetEnvironmentVariable("WORKER_ECR_REPOSITORY_URL")
 }
@@ -122,7 +129,7 @@ Run-Step "Login to ECR registry: $registry" {
 
 if (-not $PushOnly) {
     Run-Step "Build worker image: $localImageName" {
-        docker build --build-arg "WHISPER_MODEL_ID=$workerModelId" -t $localImageName $scriptDir
+        docker build --build-arg "WHISPER_MODEL_ID=$workerModelId" --build-arg "WHISPER_BACKEND=$workerBackend" --build-arg "WHISPER_MODEL_ROUTES=$workerModelRoutes" -t $localImageName $scriptDir
         if ($LASTEXITCODE -ne 0) { throw "Docker build failed." }
     }
 
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Bake Whisper weights into the worker image at build time.
+
+Downloads only what the PyTorch pipeline needs (no TF/Flax/ONNX weights) and
+guarantees a `model.safetensors` file, so the worker can memory-map weights
+at startup instead of unpickling a `.bin` checkpoint. Models named in
+WHISPER_MODEL_ROUTES are baked next to the default one under WHISPER_MODELS_DIR.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+from huggingface_hub import snapshot_download
+
+SKIP_PATTERNS = ["*.msgpack", "*.h5", "*.ot", "tf_model*", "flax_model*", "*.onnx", "onnx/*", "*.bin"]
+
+
+def bake(model_id: str, local_dir: Path) -> None:
+    snapshot_download(repo_id=model_id, local_dir=local_dir, ignore_patterns=SKIP_PATTERNS)
+    if any(local_dir.glob("*.safetensors")):
+        print(f"Baked safetensors weights for {model_id} into {local_dir}")
+        return
+
+    # Older checkpoints only ship pytorch_model.bin; convert once here.
+    print(f"No safetensors in {model_id}; converting pytorch_model.bin")
+    snapshot_download(repo_id=model_id, local_dir=local_dir, allow_patterns=["pytorch_model*.bin"])
+    from transformers import AutoModelForSpeechSeq2Seq
+
+    model = AutoModelForSpeechSeq2Seq.from_pretrained(local_dir)
+    model.save_pretrained(local_dir, safe_serialization=True)
+    for bin_path in local_dir.glob("pytorch_model*.bin"):
+        bin_path.unlink()
+    print(f"Converted {model_id} to safetensors in {local_dir}")
+
+
+def main() -> int:
+    model_id = os.environ["WHISPER_MODEL_ID"]
+    bake(model_id, Path(os.environ["WHISPER_MODEL_LOCAL_PATH"]))
+
+    # Same "language=model_id,..." format and directory layout as worker.model_paths().
+    models_dir = Path(os.getenv("WHISPER_MODELS_DIR", "/models/routes"))
+    routes = [entry.partition("=")[2].strip() for entry in os.getenv("WHISPER_MODEL_ROUTES", "").split(",")]
+    for route_model_id in sorted({route for route in routes if route and route != model_id}):
+        bake(route_model_id, models_dir / route_model_id.replace("/", "--"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+Energy / zero-crossing voice activity detection for the transcription worker.
+
+Audio is cut into fixed frames and classified with vectorized NumPy:
+a frame is speech when its energy is clearly above the clip's own noise
+floor, or slightly below that but with the high zero-crossing rate of
+unvoiced consonants. The noise floor is a percentile of the clip's frame
+energy, which lands inside the speech when a recording has no pauses, so the
+threshold is also capped relative to the clip's loud level: anything within
+`speech_headroom_db` of it is always kept, at any recording gain. The frame mask is then padded, short gaps are bridged
+and blips are dropped so Whisper receives whole phrases rather than shards.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+FRAME_MS = 30
+# Unvoiced fricatives ("s", "f") are quiet but cross zero often.
+FRICATIVE_ZCR = 0.25
+FRICATIVE_ENERGY_SLACK_DB = 6.0
+
+
+def frame_features(audio: np.ndarray, sampling_rate: int) -> tuple[np.ndarray, np.ndarray, int]:
+    """Return per-frame energy (dBFS), zero-crossing rate and the frame length in samples."""
+    frame_length = max(1, int(sampling_rate * FRAME_MS / 1000))
+    frame_count = len(audio) // frame_length
+    if frame_count == 0:
+        return np.empty(0, dtype=np.float32), np.empty(0, dtype=np.float32), frame_length
+
+    frames = audio[: frame_count * frame_length].reshape(frame_count, frame_length)
+    energy_db = 10.0 * np.log10(np.mean(frames.astype(np.float32) ** 2, axis=1) + 1e-10)
+    signs = np.signbit(frames)
+    zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+    return energy_db, zcr, frame_length
+
+
+def detect_speech_segments(
+    audio: np.ndarray,
+    sampling_rate: int,
+    energy_margin_db: float = 12.0,
+    min_energy_dbfs: float = -55.0,
+    pad_ms: int = 200,
+    min_silence_ms: int = 500,
+    min_speech_ms: int = 250,
+    speech_headroom_db: float = 25.0,
+) -> list[tuple[int, int]]:
+    """Return speech regions as (start_sample, end_sample) pairs in ascending order."""
+    energy_db, zcr, frame_length = frame_features(audio, sampling_rate)
+    if energy_db.size == 0:
+        return []
+
+    noise_floor = float(np.percentile(energy_db, 10))
+    ceiling = float(np.percentile(energy_db, 90)) - speech_headroom_db
+    # min_energy_dbfs keeps faint noise over digital silence out, unless the whole clip is quieter than that.
+    threshold = min(max(noise_floor + energy_margin_db, min(min_energy_dbfs, ceiling)), ceiling)
+    speech = (energy_db > threshold) | (
+        (energy_db > threshold - FRICATIVE_ENERGY_SLACK_DB) & (zcr > FRICATIVE_ZCR)
+    )
+    if not speech.any():
+        return []
+
+    pad_frames = pad_ms // FRAME_MS
+    if pad_frames > 0:
+        kernel = np.ones(2 * pad_frames + 1, dtype=np.int32)
+        speech = np.convolve(speech.astype(np.int32), kernel, mode="same") > 0
+
+    edges = np.diff(np.concatenate(([0], speech.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    min_gap_frames = min_silence_ms // FRAME_MS
+    merged: list[list[int]] = []
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        if merged and start - merged[-1][1] < min_gap_frames:
+            merged[-1][1] = end
+        else:
+            merged.append([start, end])
+
+    min_speech_frames = max(1, min_speech_ms // FRAME_MS)
+    total_samples = len(audio)
+    return [
+        (start * frame_length, min(end * frame_length, total_samples))
+        for start, end in merged
+        if end - start >= min_speech_frames
+    ]
+
+
+def speech_ratio(segments: list[tuple[int, int]], total_samples: int) -> float:
+    if total_samples <= 0:
+        return 0.0
+    return sum(end - start for start, end in segments) / total_samples
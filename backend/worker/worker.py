@@ -1,17 +1,36 @@
+import gc
+import hashlib
 import json
+import multiprocessing
+import multiprocessing.connection
 import os
+import queue
+import signal
+import subprocess
 import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from decimal import Decimal
 from typing import Any
 from urllib.parse import unquote_plus
 
 import boto3
-from transformers import pipeline
+import numpy as np
+from botocore.exceptions import ClientError
+
+from vad import detect_speech_segments
 
 
 AWS_REGION = os.getenv("AWS_REGION", os.getenv("DEFAULT_AWS_REGION", "us-east-1"))
 TRANSCRIPTION_QUEUE_URL = os.getenv("TRANSCRIPTION_QUEUE_URL", "")
+# Optional fast lane for small uploads (audio-fast/ keys); polled FAST_LANE_WEIGHT times per bulk poll.
+FAST_TRANSCRIPTION_QUEUE_URL = os.getenv("FAST_TRANSCRIPTION_QUEUE_URL", "")
+FAST_LANE_WEIGHT = max(1, int(os.getenv("FAST_LANE_WEIGHT", "3")))
 NOTIFICATION_QUEUE_URL = os.getenv("NOTIFICATION_QUEUE_URL", "")
 AUDIO_BUCKET_NAME = os.getenv("AUDIO_BUCKET_NAME", "")
 TRANSCRIPT_BUCKET_NAME = os.getenv("TRANSCRIPT_BUCKET_NAME", "")
@@ -19,7 +38,83 @@ JOBS_TABLE_NAME = os.getenv("JOBS_TABLE_NAME", "")
 
 WHISPER_MODEL_LOCAL_PATH = os.getenv("WHISPER_MODEL_LOCAL_PATH", "/models/whisper-model")
 WHISPER_MODEL_ID = os.getenv("WHISPER_MODEL_ID", "openai/whisper-tiny")
+WHISPER_BACKENDS = ("torch", "torch-int8", "onnx")
+WHISPER_BACKEND = os.getenv("WHISPER_BACKEND", "torch").strip().lower()
+WHISPER_ONNX_LOCAL_PATH = os.getenv("WHISPER_ONNX_LOCAL_PATH", "/models/whisper-onnx")
+# Per-language checkpoints, e.g. "en=openai/whisper-tiny.en,de=openai/whisper-base"; must match the image build.
+WHISPER_MODEL_ROUTES = {
+    language.strip().lower(): model_id.strip()
+    for language, _, model_id in (entry.partition("=") for entry in os.getenv("WHISPER_MODEL_ROUTES", "").split(","))
+    if language.strip() and model_id.strip()
+}
+WHISPER_MODELS_DIR = os.getenv("WHISPER_MODELS_DIR", "/models/routes")
+# Loaded pipelines are kept LRU within this budget (estimated from weight size).
+WHISPER_MODEL_POOL_MB = float(os.getenv("WHISPER_MODEL_POOL_MB", "1024"))
+# Pass the job's language to the decoder instead of auto-detecting it.
+WHISPER_FORCE_LANGUAGE = os.getenv("WHISPER_FORCE_LANGUAGE", "true").strip().lower() in {"1", "true", "yes"}
+# Seconds of silence run through the model before polling starts; 0 skips warm-up.
+WORKER_WARMUP_SECONDS = float(os.getenv("WORKER_WARMUP_SECONDS", "1"))
 POLL_WAIT_SECONDS = int(os.getenv("POLL_WAIT_SECONDS", "20"))
+# Short lease on received messages, kept alive by a heartbeat while a job is being worked on.
+VISIBILITY_TIMEOUT_SECONDS = int(os.getenv("VISIBILITY_TIMEOUT_SECONDS", "120"))
+VISIBILITY_HEARTBEAT_SECONDS = int(os.getenv("VISIBILITY_HEARTBEAT_SECONDS", "40"))
+# SQS rejects extensions past 12h from the original receive.
+MAX_MESSAGE_HOLD_SECONDS = min(int(os.getenv("MAX_MESSAGE_HOLD_SECONDS", "21600")), 43200)
+# Failed jobs become visible again after this delay instead of waiting out the lease.
+FAILED_JOB_RETRY_DELAY_SECONDS = int(os.getenv("FAILED_JOB_RETRY_DELAY_SECONDS", "30"))
+# SQS caps a single receive at 10 messages; >1 enables batched inference.
+RECEIVE_MAX_MESSAGES = max(1, min(int(os.getenv("RECEIVE_MAX_MESSAGES", "1")), 10))
+WORKER_BATCH_SIZE = max(1, int(os.getenv("WORKER_BATCH_SIZE", "4")))
+# Long-form audio is split into overlapping windows; 0 disables chunking.
+WHISPER_CHUNK_LENGTH_S = float(os.getenv("WHISPER_CHUNK_LENGTH_S", "30"))
+WHISPER_STRIDE_LENGTH_S = float(os.getenv("WHISPER_STRIDE_LENGTH_S", "5"))
+# "stream" decodes S3 bytes straight into memory via ffmpeg; "tempfile" downloads to disk first.
+WORKER_INGEST_MODE = os.getenv("WORKER_INGEST_MODE", "stream").strip().lower()
+S3_STREAM_CHUNK_BYTES = int(os.getenv("S3_STREAM_CHUNK_BYTES", str(1024 * 1024)))
+# ffmpeg is killed if a decode runs longer than this (malformed uploads can hang it); 0 disables.
+FFMPEG_DECODE_TIMEOUT_SECONDS = float(os.getenv("FFMPEG_DECODE_TIMEOUT_SECONDS", "900"))
+# Scheduler: threads for S3/DynamoDB/SQS work and the ceiling on messages held locally.
+WORKER_IO_THREADS = max(1, int(os.getenv("WORKER_IO_THREADS", "4")))
+WORKER_MAX_IN_FLIGHT = max(1, int(os.getenv("WORKER_MAX_IN_FLIGHT", "20")))
+# Decoded PCM (float32 16 kHz mono, ~230 MB per audio hour) the scheduler may hold for jobs waiting on
+# the model; receiving pauses above it. One job is always admitted, however large.
+WORKER_PREFETCH_AUDIO_MB = float(os.getenv("WORKER_PREFETCH_AUDIO_MB", "768"))
+# Until a job is decoded its PCM size is guessed from the upload size; low-bitrate speech MP3/OGG expands ~8x.
+WORKER_DECODE_EXPANSION = float(os.getenv("WORKER_DECODE_EXPANSION", "8"))
+# >1 forks that many model processes fed by one shared SQS receiver.
+WORKER_PROCESSES = max(1, int(os.getenv("WORKER_PROCESSES", "1")))
+# torch intra-op threads per model process; 0 splits the task's vCPUs evenly.
+WORKER_THREADS_PER_PROCESS = int(os.getenv("WORKER_THREADS_PER_PROCESS", "0"))
+# A crashed model process is respawned after 1s, 2s, 4s ... (capped); after this many crashes in a row
+# without finishing a job the supervisor exits non-zero so ECS replaces the task.
+WORKER_RESPAWN_BACKOFF_SECONDS = float(os.getenv("WORKER_RESPAWN_BACKOFF_SECONDS", "1"))
+WORKER_RESPAWN_BACKOFF_MAX_SECONDS = float(os.getenv("WORKER_RESPAWN_BACKOFF_MAX_SECONDS", "60"))
+WORKER_MAX_CONSECUTIVE_CRASHES = max(1, int(os.getenv("WORKER_MAX_CONSECUTIVE_CRASHES", "5")))
+# Initial guess of model seconds per job, refined from observed batches.
+WORKER_JOB_SECONDS_ESTIMATE = float(os.getenv("WORKER_JOB_SECONDS_ESTIMATE", "60"))
+
+SAMPLING_RATE = 16000
+# MP4 containers usually keep their index at the end and cannot be decoded from a pipe.
+UNSTREAMABLE_EXTENSIONS = {".m4a", ".mp4"}
+
+# Silence / non-speech is cut out before inference by an energy + zero-crossing VAD. Off by default: a
+# mis-tuned VAD silently drops words, so enable it after checking benchmark_vad.py on your own uploads.
+VAD_ENABLED = os.getenv("VAD_ENABLED", "false").strip().lower() in {"1", "true", "yes"}
+VAD_ENERGY_MARGIN_DB = float(os.getenv("VAD_ENERGY_MARGIN_DB", "12"))
+# Frames within this many dB of the clip's loud level always count as speech (quiet, pause-free recordings).
+VAD_SPEECH_HEADROOM_DB = float(os.getenv("VAD_SPEECH_HEADROOM_DB", "25"))
+VAD_PAD_MS = int(os.getenv("VAD_PAD_MS", "200"))
+VAD_MIN_SILENCE_MS = int(os.getenv("VAD_MIN_SILENCE_MS", "500"))
+
+# Transcripts are cached in the transcript bucket by audio sha256 + model + language.
+TRANSCRIPT_CACHE_ENABLED = os.getenv("TRANSCRIPT_CACHE_ENABLED", "true").strip().lower() in {"1", "true", "yes"}
+TRANSCRIPT_CACHE_PREFIX = os.getenv("TRANSCRIPT_CACHE_PREFIX", "cache/").strip()
+# Bump to stop serving every cached transcript after a change the key cannot see (e.g. post-processing code).
+TRANSCRIPT_CACHE_VERSION = os.getenv("TRANSCRIPT_CACHE_VERSION", "1").strip()
+
+# Per-job stage timings are logged as one JSON line that doubles as CloudWatch Embedded Metric Format.
+WORKER_METRICS_EMF = os.getenv("WORKER_METRICS_EMF", "true").strip().lower() in {"1", "true", "yes"}
+WORKER_METRICS_NAMESPACE = os.getenv("WORKER_METRICS_NAMESPACE", "AudioTranscription/Worker").strip()
 
 sqs = boto3.client("sqs", region_name=AWS_REGION)
 s3 = boto3.client("s3", region_name=AWS_REGION)
@@ -42,6 +137,8 @@ def assert_required_env() -> None:
     missing = [k for k, v in required.items() if not v]
     if missing:
         raise RuntimeError(f"Missing required environment variables: {', '.join(missing)}")
+    if 0 < VISIBILITY_TIMEOUT_SECONDS <= VISIBILITY_HEARTBEAT_SECONDS:
+        raise RuntimeError("VISIBILITY_HEARTBEAT_SECONDS must be shorter than VISIBILITY_TIMEOUT_SECONDS")
 
 
 def parse_s3_event_from_sqs(message_body: str) -> dict[str, Any]:
@@ -50,13 +147,14 @@ def parse_s3_event_from_sqs(message_body: str) -> dict[str, Any]:
     return {
         "bucket": record["s3"]["bucket"]["name"],
         "key": unquote_plus(record["s3"]["object"]["key"]),
+        "size": int(record["s3"]["object"].get("size", 0)),
     }
 
 
 def extract_identity_from_key(key: str) -> tuple[str, str]:
-    # Expected: audio/{clerk_user_id}/{job_id}/original.ext
+    # Expected: audio/{clerk_user_id}/{job_id}/original.ext (audio-fast/... for the fast lane)
     parts = key.split("/")
-    if len(parts) < 4 or parts[0] != "audio":
+    if len(parts) < 4 or parts[0] not in {"audio", "audio-fast"}:
         raise ValueError(f"Unexpected audio key format: {key}")
     return parts[1], parts[2]
 
@@ -67,7 +165,9 @@ def update_job_status(
     status: str,
     transcript_key: str | None = None,
     error_message: str | None = None,
-) -> None:
+    transcript_json_key: str | None = None,
+    timings: dict[str, float] | None = None,
+) -> dict[str, Any]:
     expression = "SET #status = :status, #updated_at = :updated_at"
     names = {"#status": "status", "#updated_at": "updated_at"}
     values: dict[str, Any] = {
@@ -82,17 +182,30 @@ def update_job_status(
         values[":s3_transcript_key"] = transcript_key
         values[":completed_at"] = now_iso()
 
+    if transcript_json_key:
+        expression += ", #s3_transcript_json_key = :s3_transcript_json_key"
+        names["#s3_transcript_json_key"] = "s3_transcript_json_key"
+        values[":s3_transcript_json_key"] = transcript_json_key
+
     if error_message:
         expression += ", #error_message = :error_message"
         names["#error_message"] = "error_message"
         values[":error_message"] = error_message[:1000]
 
-    jobs_table.update_item(
+    if timings:
+        # The DynamoDB resource API rejects floats.
+        expression += ", #timings = :timings"
+        names["#timings"] = "timings"
+        values[":timings"] = {name: Decimal(str(value)) for name, value in timings.items()}
+
+    response = jobs_table.update_item(
         Key={"clerk_user_id": clerk_user_id, "job_id": job_id},
         UpdateExpression=expression,
         ExpressionAttributeNames=names,
         ExpressionAttributeValues=values,
+        ReturnValues="ALL_NEW",
     )
+    return response.get("Attributes", {})
 
 
 def notify(clerk_user_id: str, job_id: str, status: str, transcript_key: str | None = None) -> None:
@@ -106,76 +219,1516 @@ def notify(clerk_user_id: str, job_id: str, status: str, transcript_key: str | N
     sqs.send_message(QueueUrl=NOTIFICATION_QUEUE_URL, MessageBody=json.dumps(payload))
 
 
-def build_transcriber():
-    model_source = WHISPER_MODEL_LOCAL_PATH if os.path.exists(WHISPER_MODEL_LOCAL_PATH) else WHISPER_MODEL_ID
-    print(f"Loading transcription model from: {model_source}")
-    return pipeline(
-        task="automatic-speech-recognition",
-        model=model_source,
-        device=-1,  # CPU
+class StartupTimer:
+    """Collects per-phase startup durations and prints them as one JSON log line."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        phase_started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round(self.phases.get(name, 0.0) + time.perf_counter() - phase_started, 3)
+
+    def report(self, **extra: Any) -> None:
+        payload = {
+            "event": "worker_startup",
+            "backend": WHISPER_BACKEND,
+            **{f"{name}_seconds": seconds for name, seconds in self.phases.items()},
+            "total_seconds": round(time.perf_counter() - self.started, 3),
+            **extra,
+        }
+        print(json.dumps(payload))
+
+
+def is_english_only(model_id: str) -> bool:
+    return model_id.endswith(".en")
+
+
+def route_model_id(language: str) -> str:
+    model_id = WHISPER_MODEL_ROUTES.get(language, WHISPER_MODEL_ID)
+    # A misrouted ".en" checkpoint would silently translate other languages into English.
+    if is_english_only(model_id) and language != "en":
+        return WHISPER_MODEL_ID
+    return model_id
+
+
+def model_paths(model_id: str) -> tuple[str, str]:
+    """Baked weights directory and ONNX export directory for a model id."""
+    if model_id == WHISPER_MODEL_ID:
+        return WHISPER_MODEL_LOCAL_PATH, WHISPER_ONNX_LOCAL_PATH
+    local_path = os.path.join(WHISPER_MODELS_DIR, model_id.replace("/", "--"))
+    return local_path, f"{local_path}-onnx"
+
+
+def build_transcriber(startup: StartupTimer | None = None, model_id: str = WHISPER_MODEL_ID):
+    if WHISPER_BACKEND not in WHISPER_BACKENDS:
+        raise RuntimeError(
+            f"Unsupported WHISPER_BACKEND: {WHISPER_BACKEND} (expected one of {', '.join(WHISPER_BACKENDS)})"
+        )
+    startup = startup or StartupTimer()
+    local_path, onnx_path = model_paths(model_id)
+    model_source = local_path if os.path.exists(local_path) else model_id
+    print(f"Loading transcription model from: {model_source} (backend={WHISPER_BACKEND})")
+
+    # transformers/torch dominate cold start, so they are imported here rather than at module load.
+    with startup.phase("import"):
+        from transformers import AutoProcessor, pipeline
+
+    # Baked weights are safetensors (see prepare_model.py), which load memory-mapped.
+    load_kwargs: dict[str, Any] = {"low_cpu_mem_usage": True}
+    if model_source == local_path:
+        load_kwargs["use_safetensors"] = True
+
+    with startup.phase("model_load"):
+        if WHISPER_BACKEND == "torch":
+            return pipeline(
+                task="automatic-speech-recognition",
+                model=model_source,
+                device=-1,  # CPU
+                model_kwargs=load_kwargs,
+            )
+
+        processor = AutoProcessor.from_pretrained(model_source)
+        if WHISPER_BACKEND == "torch-int8":
+            import torch
+            from transformers import AutoModelForSpeechSeq2Seq
+
+            model = AutoModelForSpeechSeq2Seq.from_pretrained(model_source, **load_kwargs)
+            # Dynamic int8 quantization of the Linear layers, which dominate Whisper CPU time.
+            model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        else:
+            # Exported at image build time; see Dockerfile.
+            from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+
+            if not os.path.exists(onnx_path):
+                raise RuntimeError(f"ONNX model not found at {onnx_path}; build the image with WHISPER_BACKEND=onnx")
+            model = ORTModelForSpeechSeq2Seq.from_pretrained(onnx_path)
+
+        return pipeline(
+            task="automatic-speech-recognition",
+            model=model,
+            tokenizer=processor.tokenizer,
+            feature_extractor=processor.feature_extractor,
+            device=-1,  # CPU
+        )
+
+
+def warm_up_transcriber(transcriber, startup: StartupTimer) -> None:
+    # First inference pays for lazy kernel/graph init; do it before taking real jobs.
+    if WORKER_WARMUP_SECONDS <= 0:
+        return
+    with startup.phase("warmup"):
+        silence = np.zeros(int(WORKER_WARMUP_SECONDS * SAMPLING_RATE), dtype=np.float32)
+        transcriber({"raw": silence, "sampling_rate": SAMPLING_RATE}, **transcribe_options())
+
+
+def estimate_model_mb(model_id: str, transcriber) -> float:
+    # Baked weight files are a close (for int8, generous) bound on resident size.
+    local_path, onnx_path = model_paths(model_id)
+    weights_dir = onnx_path if WHISPER_BACKEND == "onnx" else local_path
+    if os.path.isdir(weights_dir):
+        total = sum(
+            entry.stat().st_size
+            for entry in os.scandir(weights_dir)
+            if entry.is_file() and entry.name.endswith((".safetensors", ".bin", ".onnx", ".onnx_data"))
+        )
+        if total:
+            return total / (1024 * 1024)
+    model = getattr(transcriber, "model", None)
+    try:
+        return sum(p.numel() * p.element_size() for p in model.parameters()) / (1024 * 1024)
+    except Exception:
+        return 0.0
+
+
+class ModelPool:
+    """
+    Loaded Whisper pipelines keyed by model id, evicted least-recently-used.
+
+    The default model is loaded up front; routed models (WHISPER_MODEL_ROUTES)
+    are loaded on first use. Once the estimated size of the pool exceeds
+    `WHISPER_MODEL_POOL_MB`, idle models are dropped, oldest first. The model
+    just requested is never evicted, so a single oversized model still runs.
+    """
+
+    def __init__(self, budget_mb: float, thread_count: int = 0, **report_extra: Any) -> None:
+        self.budget_mb = budget_mb
+        self.thread_count = thread_count
+        self.report_extra = report_extra
+        self.models: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self.unavailable: set[str] = set()
+
+    def get(self, model_id: str):
+        if model_id in self.models:
+            self.models.move_to_end(model_id)
+            return self.models[model_id][0]
+
+        startup = StartupTimer()
+        if self.thread_count > 0 and not self.models:
+            with startup.phase("import"):
+                configure_torch_threads(self.thread_count)
+        transcriber = build_transcriber(startup, model_id)
+        warm_up_transcriber(transcriber, startup)
+        size_mb = estimate_model_mb(model_id, transcriber)
+        self.models[model_id] = (transcriber, size_mb)
+        self._evict()
+        startup.report(
+            model=model_id,
+            model_mb=round(size_mb, 1),
+            pool_models=len(self.models),
+            pool_mb=round(self.resident_mb(), 1),
+            **self.report_extra,
+        )
+        return transcriber
+
+    def resolve(self, model_id: str) -> tuple[str, Any]:
+        """Return (model_id, pipeline), falling back to the default model if a routed one cannot load."""
+        if model_id != WHISPER_MODEL_ID and model_id not in self.unavailable:
+            try:
+                return model_id, self.get(model_id)
+            except Exception as exc:
+                # Usually a route that was not baked into the image; do not retry it every batch.
+                print(f"Could not load routed model {model_id}, using {WHISPER_MODEL_ID}: {exc}")
+                self.unavailable.add(model_id)
+        return WHISPER_MODEL_ID, self.get(WHISPER_MODEL_ID)
+
+    def resident_mb(self) -> float:
+        return sum(size_mb for _, size_mb in self.models.values())
+
+    def _evict(self) -> None:
+        while len(self.models) > 1 and self.resident_mb() > self.budget_mb:
+            evicted, _ = self.models.popitem(last=False)
+            print(f"Evicted model {evicted} from pool (budget={self.budget_mb:.0f}MB)")
+        gc.collect()
+
+
+def load_model_pool(thread_count: int = 0, **report_extra: Any) -> ModelPool:
+    models = ModelPool(WHISPER_MODEL_POOL_MB, thread_count, **report_extra)
+    models.get(WHISPER_MODEL_ID)
+    return models
+
+
+class VisibilityHeartbeat:
+    """
+    Extend the visibility timeout of every message the worker holds.
+
+    Messages are received with a short lease; a background thread re-arms it
+    every `VISIBILITY_HEARTBEAT_SECONDS` until the job is finished, so long files
+    are never handed to a second worker and crashed tasks release messages fast.
+    """
+
+    def __init__(self, interval_seconds: int, extension_seconds: int, max_hold_seconds: int) -> None:
+        self.interval_seconds = interval_seconds
+        self.extension_seconds = extension_seconds
+        self.max_hold_seconds = max_hold_seconds
+        # receipt handle -> (first tracked at, queue url)
+        self._handles: dict[str, tuple[float, str]] = {}
+        self._lock = threading.Lock()
+        # Held across a whole beat, so release() never lands between a snapshot and its extension.
+        self._send_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        # Set in model processes: leases belong to the supervisor, so release() is handed to it.
+        self.delegate = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval_seconds > 0
+
+    def track(self, receipt_handle: str, queue_url: str = TRANSCRIPTION_QUEUE_URL) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._handles.setdefault(receipt_handle, (time.monotonic(), queue_url))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="visibility-heartbeat", daemon=True)
+                self._thread.start()
+
+    def untrack(self, receipt_handle: str) -> None:
+        with self._lock:
+            self._handles.pop(receipt_handle, None)
+
+    def release(self, receipt_handle: str, queue_url: str, visibility_timeout: int) -> None:
+        """Stop extending a message and set its visibility; a running beat cannot override it afterwards."""
+        if self.delegate is not None:
+            self.delegate(receipt_handle, queue_url, visibility_timeout)
+            return
+        with self._send_lock:
+            self.untrack(receipt_handle)
+            sqs.change_message_visibility(
+                QueueUrl=queue_url,
+                ReceiptHandle=receipt_handle,
+                VisibilityTimeout=visibility_timeout,
+            )
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval_seconds)
+            try:
+                self.beat()
+            except Exception as exc:
+                print(f"Visibility heartbeat failed: {exc}")
+
+    def beat(self) -> None:
+        with self._send_lock:
+            self._beat()
+
+    def _beat(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            expired = [h for h, (since, _) in self._handles.items() if now - since >= self.max_hold_seconds]
+            for handle in expired:
+                del self._handles[handle]
+            by_queue: dict[str, list[str]] = {}
+            for handle, (_, queue_url) in self._handles.items():
+                by_queue.setdefault(queue_url, []).append(handle)
+        if expired:
+            print(f"Stopped extending {len(expired)} message(s) held longer than {self.max_hold_seconds}s")
+
+        for queue_url, handles in by_queue.items():
+            # ChangeMessageVisibilityBatch accepts at most 10 entries per call.
+            for start in range(0, len(handles), 10):
+                entries = [
+                    {"Id": str(i), "ReceiptHandle": handle, "VisibilityTimeout": self.extension_seconds}
+                    for i, handle in enumerate(handles[start : start + 10])
+                ]
+                response = sqs.change_message_visibility_batch(QueueUrl=queue_url, Entries=entries)
+                for failure in response.get("Failed", []):
+                    # Usually a message deleted between snapshot and call; nothing to extend.
+                    print(f"Visibility extension failed: {failure.get('Code')} {failure.get('Message', '')}")
+
+
+visibility_heartbeat = VisibilityHeartbeat(
+    interval_seconds=VISIBILITY_HEARTBEAT_SECONDS,
+    extension_seconds=VISIBILITY_TIMEOUT_SECONDS,
+    max_hold_seconds=MAX_MESSAGE_HOLD_SECONDS,
+)
+
+
+@dataclass
+class TranscriptionJob:
+    receipt_handle: str
+    message_body: str
+    queue_url: str = TRANSCRIPTION_QUEUE_URL
+    clerk_user_id: str = "unknown"
+    job_id: str = "unknown"
+    local_file: str | None = None
+    audio: np.ndarray | None = None
+    language: str = ""
+    # Routed model for the job's language; cache lookups use it.
+    model_id: str = WHISPER_MODEL_ID
+    # Model that actually produced the transcript (the default one if the route could not load).
+    inference_model_id: str = ""
+    content_sha256: str = ""
+    inference_seconds: float = 0.0
+    # Stage name -> seconds (plus a few rates/sizes), see record_stage / emit_job_timings.
+    timings: dict[str, float] = field(default_factory=dict)
+    received_at: float = 0.0
+    sent_at: float = 0.0
+    # Speech regions in samples; None means the whole file goes to the model.
+    speech_segments: list[tuple[int, int]] | None = None
+    # Decoded bytes counted against the scheduler's prefetch budget until the job finishes.
+    prefetch_bytes: int = 0
+
+
+@contextmanager
+def job_stage(job: TranscriptionJob, name: str):
+    stage_started = time.perf_counter()
+    try:
+        yield
+    finally:
+        key = f"{name}_s"
+        job.timings[key] = round(job.timings.get(key, 0.0) + time.perf_counter() - stage_started, 3)
+
+
+# Subset of job_timings fields published as CloudWatch metrics, with their EMF units.
+JOB_METRICS = {
+    "queue_wait_s": "Seconds",
+    "download_s": "Seconds",
+    "download_bytes_per_s": "Bytes/Second",
+    "audio_s": "Seconds",
+    "inference_s": "Seconds",
+    "rtf": "None",
+    "upload_s": "Seconds",
+    "total_s": "Seconds",
+}
+
+
+def job_lane(job: TranscriptionJob) -> str:
+    return "fast" if FAST_TRANSCRIPTION_QUEUE_URL and job.queue_url == FAST_TRANSCRIPTION_QUEUE_URL else "bulk"
+
+
+def finalize_job_timings(job: TranscriptionJob) -> dict[str, float]:
+    """Add figures derived from the recorded stages: queue wait, throughput, real-time factor."""
+    timings = job.timings
+    now = time.time()
+    if job.sent_at and job.received_at:
+        # SentTimestamp is when S3 enqueued the upload event.
+        timings["queue_wait_s"] = round(max(job.received_at - job.sent_at, 0.0), 3)
+        timings["end_to_end_s"] = round(now - job.sent_at, 3)
+    if job.received_at:
+        timings["total_s"] = round(now - job.received_at, 3)
+    if timings.get("audio_bytes") and timings.get("download_s"):
+        timings["download_bytes_per_s"] = round(timings["audio_bytes"] / timings["download_s"])
+    if timings.get("audio_s") and timings.get("inference_s"):
+        timings["rtf"] = round(timings["inference_s"] / timings["audio_s"], 4)
+    return timings
+
+
+def emit_job_timings(job: TranscriptionJob, status: str) -> None:
+    timings = finalize_job_timings(job)
+    payload: dict[str, Any] = {
+        "event": "job_timings",
+        "job_id": job.job_id,
+        "status": status,
+        "lane": job_lane(job),
+        "model": job.inference_model_id or job.model_id,
+        "backend": WHISPER_BACKEND,
+        **timings,
+    }
+    if WORKER_METRICS_EMF:
+        payload["_aws"] = {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": WORKER_METRICS_NAMESPACE,
+                    "Dimensions": [["lane"]],
+                    "Metrics": [{"Name": name, "Unit": unit} for name, unit in JOB_METRICS.items() if name in timings],
+                }
+            ],
+        }
+    print(json.dumps(payload))
+
+
+def stream_decode_s3_audio(bucket: str, key: str, digest=None) -> np.ndarray:
+    """Pipe an S3 object through ffmpeg into a mono 16 kHz float32 buffer."""
+    s3_object = s3.get_object(Bucket=bucket, Key=key)
+    process = subprocess.Popen(
+        [
+            "ffmpeg", "-nostdin", "-loglevel", "error",
+            "-i", "pipe:0",
+            "-ac", "1", "-ar", str(SAMPLING_RATE), "-f", "f32le",
+            "pipe:1",
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
     )
+    feed_errors: list[Exception] = []
+    stderr_chunks: list[bytes] = []
+
+    def feed_stdin() -> None:
+        try:
+            for chunk in s3_object["Body"].iter_chunks(S3_STREAM_CHUNK_BYTES):
+                if digest is not None:
+                    digest.update(chunk)
+                process.stdin.write(chunk)
+        except BrokenPipeError:
+            pass  # ffmpeg exited early; its return code carries the error.
+        except Exception as exc:
+            feed_errors.append(exc)
+        finally:
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+
+    feeder = threading.Thread(target=feed_stdin, daemon=True)
+    stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True)
+    timed_out = threading.Event()
+
+    def kill_on_deadline() -> None:
+        timed_out.set()
+        process.kill()
+
+    # The stdout read below blocks, so the deadline is enforced from a timer thread.
+    watchdog = None
+    if FFMPEG_DECODE_TIMEOUT_SECONDS > 0:
+        watchdog = threading.Timer(FFMPEG_DECODE_TIMEOUT_SECONDS, kill_on_deadline)
+    feeder.start()
+    stderr_reader.start()
+    pcm = bytearray()
+    try:
+        if watchdog is not None:
+            watchdog.start()
+        while chunk := process.stdout.read(S3_STREAM_CHUNK_BYTES):
+            pcm.extend(chunk)
+        process.wait()
+    finally:
+        if watchdog is not None:
+            watchdog.cancel()
+        if process.poll() is None:
+            process.kill()
+        process.wait()
+        feeder.join(timeout=1)
+        if feeder.is_alive():
+            # Stuck on a slow S3 read after ffmpeg is gone; closing the body unblocks it.
+            s3_object["Body"].close()
+            feeder.join(timeout=5)
+        stderr_reader.join(timeout=5)
+
+    if timed_out.is_set():
+        raise RuntimeError(f"ffmpeg decode timed out after {FFMPEG_DECODE_TIMEOUT_SECONDS:g}s for s3://{bucket}/{key}")
+    if feed_errors:
+        raise RuntimeError(f"S3 stream failed for s3://{bucket}/{key}: {feed_errors[0]}")
+    if process.returncode != 0:
+        stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"ffmpeg decode failed for s3://{bucket}/{key}: {stderr[:500]}")
+    if not pcm:
+        raise RuntimeError(f"Decoded audio is empty for s3://{bucket}/{key}")
+    return np.frombuffer(pcm, dtype=np.float32)
 
 
-def process_message(message: dict[str, Any], transcriber) -> None:
-    receipt_handle = message["ReceiptHandle"]
-    message_body = message["Body"]
-    clerk_user_id = "unknown"
-    job_id = "unknown"
-    local_file = None
+def decode_audio_file(path: str) -> np.ndarray:
     try:
-        s3_event = parse_s3_event_from_sqs(message_body)
-        clerk_user_id, job_id = extract_identity_from_key(s3_event["key"])
-        update_job_status(clerk_user_id, job_id, "PROCESSING")
+        result = subprocess.run(
+            [
+                "ffmpeg", "-nostdin", "-loglevel", "error",
+                "-i", path,
+                "-ac", "1", "-ar", str(SAMPLING_RATE), "-f", "f32le",
+                "pipe:1",
+            ],
+            capture_output=True,
+            # subprocess.run kills and reaps ffmpeg when the timeout expires.
+            timeout=FFMPEG_DECODE_TIMEOUT_SECONDS or None,
+        )
+    except subprocess.TimeoutExpired as exc:
+        raise RuntimeError(f"ffmpeg decode timed out after {FFMPEG_DECODE_TIMEOUT_SECONDS:g}s for {path}") from exc
+    if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"ffmpeg decode failed for {path}: {stderr[:500]}")
+    if not result.stdout:
+        raise RuntimeError(f"Decoded audio is empty for {path}")
+    return np.frombuffer(result.stdout, dtype=np.float32)
+
+
+def hash_file(path: str, digest) -> None:
+    with open(path, "rb") as f:
+        while chunk := f.read(S3_STREAM_CHUNK_BYTES):
+            digest.update(chunk)
+
+
+def download_job_audio(job: TranscriptionJob) -> None:
+    s3_event = parse_s3_event_from_sqs(job.message_body)
+    job.clerk_user_id, job.job_id = extract_identity_from_key(s3_event["key"])
+    with job_stage(job, "db_claim"):
+        job_item = update_job_status(job.clerk_user_id, job.job_id, "PROCESSING")
+    job.language = str(job_item.get("language", "")).strip().lower()
+    job.model_id = route_model_id(job.language)
+    job.timings["audio_bytes"] = s3_event["size"]
+
+    digest = hashlib.sha256()
+    extension = os.path.splitext(s3_event["key"])[1].lower()
+    if WORKER_INGEST_MODE == "stream" and extension not in UNSTREAMABLE_EXTENSIONS:
+        # Download and decode overlap in the pipe, so they are timed as one stage.
+        with job_stage(job, "download"):
+            job.audio = stream_decode_s3_audio(s3_event["bucket"], s3_event["key"], digest)
+        job.content_sha256 = digest.hexdigest()
+        job.timings["audio_s"] = round(len(job.audio) / SAMPLING_RATE, 3)
+        return
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=extension or ".audio") as tmp:
+        job.local_file = tmp.name
+
+    # download_file uses parallel ranged GETs; hashing the fresh file reads it back from page cache.
+    with job_stage(job, "download"):
+        s3.download_file(s3_event["bucket"], s3_event["key"], job.local_file)
+    with job_stage(job, "hash"):
+        hash_file(job.local_file, digest)
+    job.content_sha256 = digest.hexdigest()
+    if VAD_ENABLED:
+        # VAD needs PCM in memory; the file is still removed in cleanup_job.
+        with job_stage(job, "decode"):
+            job.audio = decode_audio_file(job.local_file)
+        job.timings["audio_s"] = round(len(job.audio) / SAMPLING_RATE, 3)
+
+
+def detect_job_speech(job: TranscriptionJob) -> None:
+    if not VAD_ENABLED or job.audio is None:
+        return
+    with job_stage(job, "vad"):
+        job.speech_segments = detect_speech_segments(
+            job.audio,
+            SAMPLING_RATE,
+            energy_margin_db=VAD_ENERGY_MARGIN_DB,
+            pad_ms=VAD_PAD_MS,
+            min_silence_ms=VAD_MIN_SILENCE_MS,
+            speech_headroom_db=VAD_SPEECH_HEADROOM_DB,
+        )
+
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".audio") as tmp:
-            local_file = tmp.name
+def job_inputs(job: TranscriptionJob) -> list[Any]:
+    # The pipeline consumes these dicts, so build fresh ones per call.
+    if job.audio is None:
+        return [job.local_file]
+    if job.speech_segments is None:
+        return [{"raw": job.audio, "sampling_rate": SAMPLING_RATE}]
+    return [{"raw": job.audio[start:end], "sampling_rate": SAMPLING_RATE} for start, end in job.speech_segments]
 
-        s3.download_file(s3_event["bucket"], s3_event["key"], local_file)
-        result = transcriber(local_file)
-        transcript_text = result["text"].strip() if isinstance(result, dict) else str(result)
 
-        transcript_key = f"transcripts/{clerk_user_id}/{job_id}/transcript.txt"
+def output_segments(output: Any, offset_seconds: float, end_seconds: float) -> list[dict[str, Any]]:
+    """Turn one pipeline output into absolute-time segments (timestamps are relative to the input)."""
+    if not isinstance(output, dict):
+        text = str(output).strip()
+        return [{"start": offset_seconds, "end": end_seconds, "text": text}] if text else []
+
+    chunks = output.get("chunks") or [{"timestamp": (0.0, None), "text": output.get("text", "")}]
+    segments = []
+    for chunk in chunks:
+        text = str(chunk.get("text", "")).strip()
+        if not text:
+            continue
+        chunk_start, chunk_end = chunk.get("timestamp") or (0.0, None)
+        start = offset_seconds + (chunk_start or 0.0)
+        end = offset_seconds + chunk_end if chunk_end is not None else end_seconds
+        segments.append({"start": round(start, 2), "end": round(min(end, end_seconds), 2), "text": text})
+    return segments
+
+
+def combine_job_outputs(job: TranscriptionJob, outputs: list[Any]) -> dict[str, Any]:
+    duration = round(len(job.audio) / SAMPLING_RATE, 2) if job.audio is not None else None
+    if job.speech_segments is None:
+        regions = [(0.0, duration if duration is not None else float("inf"))]
+    else:
+        regions = [(start / SAMPLING_RATE, end / SAMPLING_RATE) for start, end in job.speech_segments]
+
+    segments: list[dict[str, Any]] = []
+    for (region_start, region_end), output in zip(regions, outputs):
+        segments.extend(output_segments(output, region_start, region_end))
+    for segment in segments:
+        if segment["end"] == float("inf"):
+            segment["end"] = segment["start"]
+        # The HF pipeline exposes no token scores; kept in the schema for backends that do.
+        segment["confidence"] = None
+
+    return {
+        "text": " ".join(segment["text"] for segment in segments),
+        "duration": duration,
+        "segments": segments,
+    }
+
+
+class TranscriptCacheStats:
+    """Process-wide cache counters, logged as JSON after every lookup."""
+
+    def __init__(self) -> None:
+        self.lookups = 0
+        self.hits = 0
+        self.inference_seconds_saved = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, job: TranscriptionJob, hit: bool, lookup_seconds: float, seconds_saved: float = 0.0) -> None:
+        with self._lock:
+            self.lookups += 1
+            if hit:
+                self.hits += 1
+                self.inference_seconds_saved += seconds_saved
+            payload = {
+                "event": "transcript_cache",
+                "job_id": job.job_id,
+                "hit": hit,
+                "lookup_ms": round(lookup_seconds * 1000, 1),
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "hit_ratio": round(self.hits / self.lookups, 4),
+                "inference_seconds_saved": round(self.inference_seconds_saved, 2),
+            }
+        print(json.dumps(payload))
+
+
+transcript_cache_stats = TranscriptCacheStats()
+
+
+def transcript_key_for(job: TranscriptionJob, extension: str = "txt") -> str:
+    return f"transcripts/{job.clerk_user_id}/{job.job_id}/transcript.{extension}"
+
+
+def transcript_cache_settings() -> str:
+    """
+    Short digest of the worker settings that change a transcript of the same audio, model and language.
+
+    VAD, chunking and forced-language options are included, so changing any of them starts a fresh cache
+    instead of serving transcripts produced under the old settings. Batch size, threads and ingest mode
+    only change speed and are left out. TRANSCRIPT_CACHE_VERSION covers everything else.
+    """
+    settings = {
+        "version": TRANSCRIPT_CACHE_VERSION,
+        "chunk_length_s": WHISPER_CHUNK_LENGTH_S,
+        "stride_length_s": WHISPER_STRIDE_LENGTH_S,
+        "force_language": WHISPER_FORCE_LANGUAGE,
+        "vad": [VAD_ENERGY_MARGIN_DB, VAD_SPEECH_HEADROOM_DB, VAD_PAD_MS, VAD_MIN_SILENCE_MS] if VAD_ENABLED else None,
+    }
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+def transcript_cache_key(job: TranscriptionJob, model_id: str) -> str:
+    model = model_id.replace("/", "--")
+    language = job.language or "auto"
+    settings = transcript_cache_settings()
+    return f"{TRANSCRIPT_CACHE_PREFIX}{model}/{WHISPER_BACKEND}/{language}/{settings}/{job.content_sha256}.json"
+
+
+def build_transcript_artifact(job: TranscriptionJob, result: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "version": 1,
+        "job_id": job.job_id,
+        "language": job.language or None,
+        "model": job.inference_model_id or job.model_id,
+        "backend": WHISPER_BACKEND,
+        "duration": result.get("duration"),
+        "text": result.get("text", "").strip(),
+        "segments": result.get("segments", []),
+    }
+
+
+def write_transcripts(job: TranscriptionJob, artifact: dict[str, Any]) -> tuple[str, str]:
+    """Write the structured artifact plus the plain-text copy older consumers read."""
+    json_key = transcript_key_for(job, "json")
+    transcript_key = transcript_key_for(job)
+    with job_stage(job, "upload"):
+        s3.put_object(
+            Bucket=TRANSCRIPT_BUCKET_NAME,
+            Key=json_key,
+            Body=json.dumps(artifact, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+            ContentType="application/json",
+        )
         s3.put_object(
             Bucket=TRANSCRIPT_BUCKET_NAME,
             Key=transcript_key,
-            Body=transcript_text.encode("utf-8"),
+            Body=artifact["text"].encode("utf-8"),
             ContentType="text/plain; charset=utf-8",
         )
+    return transcript_key, json_key
+
+
+def publish_transcript(job: TranscriptionJob, transcript_key: str, transcript_json_key: str) -> None:
+    # The item gets timings up to this write; the log line below also covers the write itself.
+    with job_stage(job, "db_complete"):
+        update_job_status(
+            job.clerk_user_id,
+            job.job_id,
+            "COMPLETED",
+            transcript_key=transcript_key,
+            transcript_json_key=transcript_json_key,
+            timings=finalize_job_timings(job),
+        )
+    with job_stage(job, "notify"):
+        notify(job.clerk_user_id, job.job_id, "COMPLETED", transcript_key=transcript_key)
+
+    with job_stage(job, "sqs_delete"):
+        sqs.delete_message(QueueUrl=job.queue_url, ReceiptHandle=job.receipt_handle)
+    emit_job_timings(job, "COMPLETED")
+
+
+def read_cached_transcript(cache_key: str) -> tuple[dict[str, Any], float] | None:
+    """The cached artifact and the inference seconds it saved, or None when there is no entry."""
+    try:
+        cached = s3.get_object(Bucket=TRANSCRIPT_BUCKET_NAME, Key=cache_key)
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") in {"404", "NoSuchKey", "NotFound"}:
+            return None
+        raise
+    artifact = json.loads(cached["Body"].read())
+    if not isinstance(artifact, dict) or not isinstance(artifact.get("text"), str) or not isinstance(
+        artifact.get("segments"), list
+    ):
+        raise ValueError("cached transcript is missing text/segments")
+    return artifact, float(cached.get("Metadata", {}).get("inference-seconds", "0") or 0)
+
+
+def complete_from_cache(job: TranscriptionJob) -> bool:
+    """
+    Finish the job from a cached transcript of identical audio; False on a miss.
+
+    Any failure (transport error, truncated or malformed entry, failed write) also counts as a miss, so the
+    job falls back to inference. A bad entry under the routed model's key is then overwritten by store_in_cache.
+    """
+    if not TRANSCRIPT_CACHE_ENABLED or not job.content_sha256:
+        return False
+
+    cache_key = transcript_cache_key(job, job.model_id)
+    started = time.perf_counter()
+    try:
+        cached = read_cached_transcript(cache_key)
+        lookup_seconds = time.perf_counter() - started
+        job.timings["cache_lookup_s"] = round(lookup_seconds, 3)
+        if cached is None:
+            transcript_cache_stats.record(job, hit=False, lookup_seconds=lookup_seconds)
+            return False
+        artifact, seconds_saved = cached
+        artifact["job_id"] = job.job_id
+        publish_transcript(job, *write_transcripts(job, artifact))
+    except Exception as exc:
+        print(f"Transcript cache unusable for job={job.job_id}, running inference instead: key={cache_key} error={exc}")
+        lookup_seconds = time.perf_counter() - started
+        job.timings["cache_lookup_s"] = round(lookup_seconds, 3)
+        transcript_cache_stats.record(job, hit=False, lookup_seconds=lookup_seconds)
+        return False
+    transcript_cache_stats.record(job, hit=True, lookup_seconds=lookup_seconds, seconds_saved=seconds_saved)
+    return True
+
+
+def store_in_cache(job: TranscriptionJob, artifact: dict[str, Any]) -> None:
+    # Keyed by the model that produced the transcript: after a fallback, the routed model's key must stay
+    # empty so its own output is cached once that model loads.
+    if not TRANSCRIPT_CACHE_ENABLED or not job.content_sha256 or not job.inference_model_id:
+        return
+    try:
+        s3.put_object(
+            Bucket=TRANSCRIPT_BUCKET_NAME,
+            Key=transcript_cache_key(job, job.inference_model_id),
+            Body=json.dumps(artifact, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+            ContentType="application/json",
+            Metadata={"inference-seconds": f"{job.inference_seconds:.3f}"},
+        )
+    except Exception as exc:
+        # A cache write failure must never fail the job itself.
+        print(f"Transcript cache store failed for job={job.job_id}: {exc}")
+
+
+def complete_job(job: TranscriptionJob, result: dict[str, Any]) -> None:
+    artifact = build_transcript_artifact(job, result)
+    transcript_key, transcript_json_key = write_transcripts(job, artifact)
+    with job_stage(job, "cache_store"):
+        store_in_cache(job, artifact)
+
+    publish_transcript(job, transcript_key, transcript_json_key)
+
+
+def fail_job(job: TranscriptionJob, exc: Exception) -> None:
+    print(f"Job failed: user={job.clerk_user_id}, job={job.job_id}, error={exc}")
+    update_job_status(
+        job.clerk_user_id, job.job_id, "FAILED", error_message=str(exc), timings=finalize_job_timings(job)
+    )
+    notify(job.clerk_user_id, job.job_id, "FAILED")
+    emit_job_timings(job, "FAILED")
+    # Do not delete message so SQS retry/DLQ flow can work; just shorten the wait for it.
+    try:
+        visibility_heartbeat.release(job.receipt_handle, job.queue_url, FAILED_JOB_RETRY_DELAY_SECONDS)
+    except Exception as visibility_exc:
+        print(f"Could not shorten visibility for failed job={job.job_id}: {visibility_exc}")
+
+
+def new_job(message: dict[str, Any]) -> TranscriptionJob:
+    queue_url = message.get("QueueUrl", TRANSCRIPTION_QUEUE_URL)
+    visibility_heartbeat.track(message["ReceiptHandle"], queue_url)
+    sent_timestamp_ms = int(message.get("Attributes", {}).get("SentTimestamp", 0))
+    return TranscriptionJob(
+        receipt_handle=message["ReceiptHandle"],
+        message_body=message["Body"],
+        queue_url=queue_url,
+        received_at=message.get("ReceivedAt", time.time()),
+        sent_at=sent_timestamp_ms / 1000,
+    )
+
+
+def cleanup_job(job: TranscriptionJob) -> None:
+    visibility_heartbeat.untrack(job.receipt_handle)
+    job.audio = None
+    if job.local_file and os.path.exists(job.local_file):
+        os.remove(job.local_file)
+
 
-        update_job_status(clerk_user_id, job_id, "COMPLETED", transcript_key=transcript_key)
-        notify(clerk_user_id, job_id, "COMPLETED", transcript_key=transcript_key)
+def forced_language(model_id: str, language: str) -> str:
+    """Whisper language code to force for this model, or "" to let the model detect it."""
+    if not WHISPER_FORCE_LANGUAGE or not language or is_english_only(model_id):
+        # ".en" checkpoints have no language token and reject the argument.
+        return ""
+    from transformers.models.whisper.tokenization_whisper import LANGUAGES, TO_LANGUAGE_CODE
 
-        sqs.delete_message(QueueUrl=TRANSCRIPTION_QUEUE_URL, ReceiptHandle=receipt_handle)
+    if language in LANGUAGES:
+        return language
+    return TO_LANGUAGE_CODE.get(language, "")
+
+
+def transcribe_options(model_id: str = WHISPER_MODEL_ID, language: str = "") -> dict[str, Any]:
+    # Chunks of every file in the call share one batch, so batch_size applies to windows.
+    # Segment-level timestamps feed the structured transcript (JSON/SRT/VTT).
+    options: dict[str, Any] = {"batch_size": WORKER_BATCH_SIZE, "return_timestamps": True}
+    if WHISPER_CHUNK_LENGTH_S > 0:
+        options["chunk_length_s"] = WHISPER_CHUNK_LENGTH_S
+        options["stride_length_s"] = WHISPER_STRIDE_LENGTH_S
+    # Skips the language-detection pass and keeps short clips from being misdetected.
+    decoder_language = forced_language(model_id, language)
+    if decoder_language:
+        options["generate_kwargs"] = {"language": decoder_language, "task": "transcribe"}
+    return options
+
+
+def call_transcriber(transcriber, inputs: list[Any], options: dict[str, Any]) -> list[Any]:
+    if not inputs:
+        return []
+    if len(inputs) == 1:
+        return [transcriber(inputs[0], **options)]
+    return list(transcriber(inputs, **options))
+
+
+def run_inference(jobs: list[TranscriptionJob], transcriber, options: dict[str, Any]) -> list[Any]:
+    # Speech segments of every job go through the model as one flat batch.
+    per_job_inputs = [job_inputs(job) for job in jobs]
+    try:
+        outputs = call_transcriber(transcriber, [item for inputs in per_job_inputs for item in inputs], options)
+        results: list[Any] = []
+        offset = 0
+        for job, inputs in zip(jobs, per_job_inputs):
+            results.append(combine_job_outputs(job, outputs[offset : offset + len(inputs)]))
+            offset += len(inputs)
+        return results
+    except Exception as exc:
+        if len(jobs) == 1:
+            raise
+        # One undecodable file must not fail the whole batch; retry each job alone.
+        print(f"Batch inference failed for {len(jobs)} jobs, retrying individually: {exc}")
+        results = []
+        for job in jobs:
+            try:
+                results.append(combine_job_outputs(job, call_transcriber(transcriber, job_inputs(job), options)))
+            except Exception as job_exc:
+                results.append(job_exc)
+        return results
+
+
+def transcribe_jobs(jobs: list[TranscriptionJob], models: ModelPool) -> list[Any]:
+    # Decoder language and model are per call, so jobs are batched per (model, language).
+    groups: dict[tuple[str, str], list[int]] = {}
+    for index, job in enumerate(jobs):
+        groups.setdefault((job.model_id, job.language), []).append(index)
+
+    results: list[Any] = [None] * len(jobs)
+    for (model_id, language), indexes in groups.items():
+        group = [jobs[index] for index in indexes]
+        started = time.perf_counter()
+        try:
+            model_id, transcriber = models.resolve(model_id)
+            for job in group:
+                job.inference_model_id = model_id
+            group_results = run_inference(group, transcriber, transcribe_options(model_id, language))
+        except Exception as exc:
+            group_results = [exc] * len(group)
+        per_job_seconds = (time.perf_counter() - started) / len(group)
+        for index, job, result in zip(indexes, group, group_results):
+            job.inference_seconds = per_job_seconds
+            job.timings["inference_s"] = round(per_job_seconds, 3)
+            results[index] = result
+    return results
+
+
+def ingest_job(job: TranscriptionJob) -> bool:
+    """Download the job's audio; returns False when a cached transcript already finished it."""
+    if job.received_at:
+        # Time spent waiting for an I/O thread (or a model process) after the receive.
+        job.timings["local_wait_s"] = round(max(time.time() - job.received_at, 0.0), 3)
+    download_job_audio(job)
+    if complete_from_cache(job):
+        cleanup_job(job)
+        return False
+    detect_job_speech(job)
+    return True
+
+
+def finish_job(job: TranscriptionJob, result: Any) -> None:
+    try:
+        if isinstance(result, Exception):
+            raise result
+        complete_job(job, result)
     except Exception as exc:
-        print(f"Job failed: user={clerk_user_id}, job={job_id}, error={exc}")
-        update_job_status(clerk_user_id, job_id, "FAILED", error_message=str(exc))
-        notify(clerk_user_id, job_id, "FAILED")
-        # Do not delete message so SQS retry/DLQ flow can work.
+        fail_job(job, exc)
     finally:
-        if local_file and os.path.exists(local_file):
-            os.remove(local_file)
+        cleanup_job(job)
 
 
-def main() -> None:
-    assert_required_env()
-    transcriber = build_transcriber()
-    print("Worker started. Polling transcription queue...")
+def prepare_jobs(messages: list[dict[str, Any]]) -> list[TranscriptionJob]:
+    jobs: list[TranscriptionJob] = []
+    for message in messages:
+        job = new_job(message)
+        try:
+            if not ingest_job(job):
+                continue
+        except Exception as exc:
+            fail_job(job, exc)
+            cleanup_job(job)
+            continue
+        jobs.append(job)
+    return jobs
+
+
+def run_jobs(jobs: list[TranscriptionJob], models: ModelPool) -> None:
+    if not jobs:
+        return
+    try:
+        results = transcribe_jobs(jobs, models)
+    except Exception as exc:
+        results = [exc] * len(jobs)
+    for job, result in zip(jobs, results):
+        finish_job(job, result)
+
+
+def process_messages(messages: list[dict[str, Any]], models: ModelPool) -> None:
+    run_jobs(prepare_jobs(messages), models)
+
+
+def process_message(message: dict[str, Any], models: ModelPool) -> None:
+    process_messages([message], models)
+
+
+class LaneReceiver:
+    """
+    Receive from the fast and bulk transcription queues with weighted fairness.
+
+    Lanes are picked by smooth weighted round-robin (fast gets `FAST_LANE_WEIGHT`
+    turns per bulk turn) with a zero-wait poll, falling through to the other
+    lane when the picked one is empty, so neither lane starves under load.
+    When both are empty the receiver long-polls the fast lane: a new small file
+    is picked up at once and a bulk file waits at most one poll.
+    """
+
+    def __init__(self) -> None:
+        self.lanes: list[tuple[str, str, int]] = [("bulk", TRANSCRIPTION_QUEUE_URL, 1)]
+        if FAST_TRANSCRIPTION_QUEUE_URL:
+            self.lanes.insert(0, ("fast", FAST_TRANSCRIPTION_QUEUE_URL, FAST_LANE_WEIGHT))
+        self.current = {name: 0 for name, _, _ in self.lanes}
+
+    def _lane_order(self) -> list[tuple[str, str, int]]:
+        total = sum(weight for _, _, weight in self.lanes)
+        for name, _, weight in self.lanes:
+            self.current[name] += weight
+        picked = max(self.lanes, key=lambda lane: self.current[lane[0]])
+        self.current[picked[0]] -= total
+        return [picked] + [lane for lane in self.lanes if lane is not picked]
 
-    while True:
+    def _receive(self, queue_url: str, max_messages: int, wait_seconds: int) -> list[dict[str, Any]]:
         response = sqs.receive_message(
-            QueueUrl=TRANSCRIPTION_QUEUE_URL,
-            MaxNumberOfMessages=1,
-            WaitTimeSeconds=POLL_WAIT_SECONDS,
-            VisibilityTimeout=900,
+            QueueUrl=queue_url,
+            MaxNumberOfMessages=max_messages,
+            WaitTimeSeconds=wait_seconds,
+            VisibilityTimeout=VISIBILITY_TIMEOUT_SECONDS,
+            AttributeNames=["SentTimestamp"],
         )
+        received_at = time.time()
         messages = response.get("Messages", [])
-        if not messages:
-            continue
+        for message in messages:
+            # Receipt handles are only valid on their own queue; keep the queue with the message.
+            message["QueueUrl"] = queue_url
+            message["ReceivedAt"] = received_at
+        return messages
+
+    def receive(self, max_messages: int) -> list[dict[str, Any]]:
+        if len(self.lanes) == 1:
+            return self._receive(self.lanes[0][1], max_messages, POLL_WAIT_SECONDS)
+        for _, queue_url, _ in self._lane_order():
+            messages = self._receive(queue_url, max_messages, 0)
+            if messages:
+                return messages
+        return self._receive(self.lanes[0][1], max_messages, POLL_WAIT_SECONDS)
+
+
+class JobScheduler:
+    """
+    Three-stage worker loop.
+
+    A receiver thread polls SQS, an I/O pool downloads audio and later uploads
+    transcripts / updates DynamoDB, and the model runs on the calling thread so
+    it is never blocked on the network. The receiver only asks for as many
+    messages as the worker can finish inside the visibility timeout, based on a
+    running estimate of model seconds per job, and stops prefetching once the
+    decoded audio it holds reaches WORKER_PREFETCH_AUDIO_MB. On SIGTERM only the
+    batch already in the model finishes; every other message it holds is made
+    visible again so another task picks it up.
+    """
+
+    def __init__(self, models: ModelPool) -> None:
+        self.models = models
+        self.ready_jobs: queue.Queue[TranscriptionJob] = queue.Queue(maxsize=WORKER_MAX_IN_FLIGHT)
+        self.io_pool = ThreadPoolExecutor(max_workers=WORKER_IO_THREADS, thread_name_prefix="io")
+        self.capacity = threading.Condition()
+        self.in_flight = 0
+        # Decoded PCM held by in-flight jobs (estimated for jobs not yet decoded).
+        self.audio_bytes = 0
+        self.seconds_per_job = WORKER_JOB_SECONDS_ESTIMATE
+        self.stop_event = threading.Event()
+        self.receiver = LaneReceiver()
+
+    def max_in_flight(self) -> int:
+        # Leave 20% headroom so the last queued job still finishes before its message reappears.
+        # With the heartbeat on, leases are renewed, so the bound is the longest we agree to hold one.
+        lease_seconds = MAX_MESSAGE_HOLD_SECONDS if visibility_heartbeat.enabled else VISIBILITY_TIMEOUT_SECONDS
+        budget_seconds = lease_seconds * 0.8
+        fits = int(budget_seconds // max(self.seconds_per_job, 0.1))
+        return max(1, min(WORKER_MAX_IN_FLIGHT, fits))
+
+    def _acquire_capacity(self) -> int:
+        budget_bytes = WORKER_PREFETCH_AUDIO_MB * 1024 * 1024
+        with self.capacity:
+            while not self.stop_event.is_set():
+                free = self.max_in_flight() - self.in_flight
+                if free > 0 and (self.in_flight == 0 or self.audio_bytes < budget_bytes):
+                    return min(free, RECEIVE_MAX_MESSAGES)
+                self.capacity.wait(timeout=1)
+            return 0
+
+    def _release_capacity(self, audio_bytes: int = 0) -> None:
+        with self.capacity:
+            self.in_flight -= 1
+            self.audio_bytes -= audio_bytes
+            self.capacity.notify_all()
+
+    def _adjust_audio_bytes(self, delta: int) -> None:
+        with self.capacity:
+            self.audio_bytes += delta
+            self.capacity.notify_all()
+
+    @staticmethod
+    def _estimate_audio_bytes(message: dict[str, Any]) -> int:
+        try:
+            upload_bytes = parse_s3_event_from_sqs(message["Body"])["size"]
+        except Exception:
+            return 0  # Unparseable messages fail in ingest without decoding anything.
+        return int(upload_bytes * WORKER_DECODE_EXPANSION)
+
+    def _observe_batch(self, elapsed_seconds: float, job_count: int) -> None:
+        per_job = elapsed_seconds / max(job_count, 1)
+        with self.capacity:
+            self.seconds_per_job = 0.8 * self.seconds_per_job + 0.2 * per_job
+
+    def receive_loop(self) -> None:
+        while not self.stop_event.is_set():
+            max_messages = self._acquire_capacity()
+            if not max_messages:
+                return
+            try:
+                messages = self.receiver.receive(max_messages)
+            except Exception as exc:
+                print(f"Receive failed, retrying: {exc}")
+                time.sleep(1)
+                continue
+
+            if self.stop_event.is_set():
+                # A long poll that outlived the stop request; nobody here will start these.
+                self._release_messages(messages)
+                return
+
+            estimates = [self._estimate_audio_bytes(message) for message in messages]
+            with self.capacity:
+                self.in_flight += len(messages)
+                self.audio_bytes += sum(estimates)
+            for message, estimate in zip(messages, estimates):
+                visibility_heartbeat.track(message["ReceiptHandle"], message["QueueUrl"])
+                self.io_pool.submit(self._prepare, message, estimate)
+
+    def _release_messages(self, messages: list[dict[str, Any]]) -> None:
+        for message in messages:
+            try:
+                visibility_heartbeat.release(message["ReceiptHandle"], message["QueueUrl"], 0)
+            except Exception as exc:
+                print(f"Could not release message on shutdown: {exc}")
+        if messages:
+            print(f"Released {len(messages)} message(s) back to the queue (unstarted on shutdown)")
+
+    def _release_jobs(self, jobs: list[TranscriptionJob]) -> None:
+        for job in jobs:
+            try:
+                visibility_heartbeat.release(job.receipt_handle, job.queue_url, 0)
+            except Exception as exc:
+                print(f"Could not release message for job={job.job_id} on shutdown: {exc}")
+            finally:
+                cleanup_job(job)
+                self._release_capacity(job.prefetch_bytes)
+        if jobs:
+            print(f"Released {len(jobs)} message(s) back to the queue (unstarted on shutdown)")
+
+    def _prepare(self, message: dict[str, Any], estimated_bytes: int = 0) -> None:
+        job = new_job(message)
+        if self.stop_event.is_set():
+            job.prefetch_bytes = estimated_bytes
+            self._release_jobs([job])
+            return
+        try:
+            needs_inference = ingest_job(job)
+        except Exception as exc:
+            try:
+                fail_job(job, exc)
+            except Exception as fail_exc:
+                print(f"Could not record failure: user={job.clerk_user_id}, job={job.job_id}, error={fail_exc}")
+            finally:
+                cleanup_job(job)
+                self._release_capacity(estimated_bytes)
+            return
+        if not needs_inference:
+            self._release_capacity(estimated_bytes)
+            return
+        # Swap the estimate for the real buffer size (0 when tempfile mode leaves the audio on disk).
+        job.prefetch_bytes = job.audio.nbytes if job.audio is not None else 0
+        self._adjust_audio_bytes(job.prefetch_bytes - estimated_bytes)
+        if self.stop_event.is_set():
+            self._release_jobs([job])
+            return
+        self.ready_jobs.put(job)
+
+    def _finish(self, job: TranscriptionJob, result: Any) -> None:
+        try:
+            finish_job(job, result)
+        except Exception as exc:
+            print(f"Could not record failure: user={job.clerk_user_id}, job={job.job_id}, error={exc}")
+        finally:
+            self._release_capacity(job.prefetch_bytes)
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        with self.capacity:
+            self.capacity.notify_all()
+
+    def _drained(self) -> bool:
+        with self.capacity:
+            return self.in_flight == 0
+
+    def _next_batch(self) -> list[TranscriptionJob]:
+        try:
+            jobs = [self.ready_jobs.get(timeout=1)]
+        except queue.Empty:
+            return []
+        while len(jobs) < RECEIVE_MAX_MESSAGES:
+            try:
+                jobs.append(self.ready_jobs.get_nowait())
+            except queue.Empty:
+                break
+        return jobs
+
+    def run(self) -> None:
+        receiver = threading.Thread(target=self.receive_loop, name="receiver", daemon=True)
+        receiver.start()
+        while True:
+            jobs = self._next_batch()
+            if not jobs:
+                # The receiver may still be inside a long poll; wait for it before declaring drained.
+                if self.stop_event.is_set() and not receiver.is_alive() and self._drained():
+                    break
+                continue
+            if self.stop_event.is_set():
+                self._release_jobs(jobs)
+                continue
+            started = time.monotonic()
+            try:
+                results = transcribe_jobs(jobs, self.models)
+            except Exception as exc:
+                results = [exc] * len(jobs)
+            self._observe_batch(time.monotonic() - started, len(jobs))
+            for job, result in zip(jobs, results):
+                self.io_pool.submit(self._finish, job, result)
+        self.io_pool.shutdown(wait=True)
+        print("Worker finished its last batch and released the rest; exiting.")
+
+
+def default_threads_per_process(process_count: int) -> int:
+    if WORKER_THREADS_PER_PROCESS > 0:
+        return WORKER_THREADS_PER_PROCESS
+    vcpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    return max(1, vcpus // process_count)
+
+
+def configure_torch_threads(thread_count: int) -> None:
+    import torch
+
+    torch.set_num_threads(thread_count)
+
+
+def model_process_main(index: int, task_queue, done_conn) -> None:
+    # The supervisor owns signals and message leases; this process only runs jobs it is handed.
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    visibility_heartbeat.interval_seconds = 0
+    # A failed job's retry delay is applied by the supervisor, after its heartbeat stops extending the message.
+    visibility_heartbeat.delegate = lambda handle, queue_url, timeout: done_conn.send(
+        ("release", handle, queue_url, timeout)
+    )
+
+    thread_count = default_threads_per_process(WORKER_PROCESSES)
+    models = load_model_pool(thread_count, process_index=index, torch_threads=thread_count)
+    print(f"Model process {index} ready (torch_threads={thread_count})")
+
+    stopping = False
+    while not stopping:
+        message = task_queue.get()
+        if message is None:
+            break
+        batch = [message]
+        while len(batch) < RECEIVE_MAX_MESSAGES:
+            try:
+                next_message = task_queue.get_nowait()
+            except queue.Empty:
+                break
+            if next_message is None:
+                stopping = True
+                break
+            batch.append(next_message)
+
+        try:
+            process_messages(batch, models)
+        except Exception as exc:
+            print(f"Model process {index} batch failed: {exc}")
+        for finished in batch:
+            done_conn.send(("done", finished["ReceiptHandle"]))
+    print(f"Model process {index} exiting")
+
+
+class ProcessSupervisor:
+    """
+    Multi-process worker mode.
+
+    One receiver in the parent process polls SQS, renews message leases and
+    hands messages to `WORKER_PROCESSES` model processes, each running its own
+    pipeline with a fixed torch thread count. Every process has its own task
+    queue and result pipe, so the supervisor knows which messages a process
+    holds: if one dies (OOM kill, segfault) its messages are made visible again
+    at once and the process is respawned with exponential backoff. A slot that
+    keeps crashing without finishing a job (a model that cannot load) stops the
+    supervisor, and main() exits non-zero. On SIGTERM the supervisor stops
+    receiving, releases messages nobody has started, and waits for the model
+    processes to finish the jobs they already hold.
+    """
+
+    def __init__(self, process_count: int) -> None:
+        self.context = multiprocessing.get_context("spawn")
+        self.process_count = process_count
+        # One batch queued per process keeps every model busy without hoarding messages.
+        self.max_in_flight = min(WORKER_MAX_IN_FLIGHT, process_count * RECEIVE_MAX_MESSAGES * 2)
+        self.processes: list[Any] = [None] * process_count
+        self.task_queues: list[Any] = [None] * process_count
+        self.done_readers: list[Any] = [None] * process_count
+        # Per process: receipt handle -> message, for everything handed to it and not reported done.
+        self.assigned: list[dict[str, dict[str, Any]]] = [{} for _ in range(process_count)]
+        # Per process: crashes since it last finished a job, and when a crashed slot is started again.
+        self.crashes = [0] * process_count
+        self.respawn_at: list[float | None] = [None] * process_count
+        self.crash_looping = False
+        self.capacity = threading.Condition()
+        self.in_flight = 0
+        self.stop_event = threading.Event()
+        self.receiver = LaneReceiver()
 
+    def stop(self) -> None:
+        self.stop_event.set()
+        with self.capacity:
+            self.capacity.notify_all()
+
+    def _spawn(self, index: int) -> None:
+        task_queue = self.context.Queue()
+        reader, writer = self.context.Pipe(duplex=False)
+        process = self.context.Process(
+            target=model_process_main,
+            args=(index, task_queue, writer),
+            name=f"model-{index}",
+        )
+        process.start()
+        # The child now holds the only write end, so its exit shows up as EOF on the reader.
+        writer.close()
+        self.processes[index] = process
+        self.task_queues[index] = task_queue
+        self.done_readers[index] = reader
+
+    def _release_capacity(self, count: int = 1) -> None:
+        with self.capacity:
+            self.in_flight -= count
+            self.capacity.notify_all()
+
+    def _release_messages(self, messages: list[dict[str, Any]], reason: str) -> None:
         for message in messages:
-            process_message(message, transcriber)
+            try:
+                visibility_heartbeat.release(message["ReceiptHandle"], message["QueueUrl"], 0)
+            except Exception as exc:
+                print(f"Could not release message ({reason}): {exc}")
+        if messages:
+            self._release_capacity(len(messages))
+            print(f"Released {len(messages)} message(s) back to the queue ({reason})")
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        with self.capacity:
+            live = [i for i in range(self.process_count) if self.done_readers[i] is not None]
+            if live:
+                index = min(live, key=lambda i: len(self.assigned[i]))
+                self.assigned[index][message["ReceiptHandle"]] = message
+                task_queue = self.task_queues[index]
+        if not live:
+            self._release_messages([message], "no model process running")
+            return
+        task_queue.put(message)
+
+    def _handle_result(self, index: int, result: tuple) -> None:
+        if result[0] == "release":
+            _, receipt_handle, queue_url, visibility_timeout = result
+            try:
+                visibility_heartbeat.release(receipt_handle, queue_url, visibility_timeout)
+            except Exception as exc:
+                print(f"Could not set retry delay for a failed message: {exc}")
+            return
+        receipt_handle = result[1]
+        visibility_heartbeat.untrack(receipt_handle)
+        with self.capacity:
+            self.crashes[index] = 0
+            finished = self.assigned[index].pop(receipt_handle, None)
+        if finished is not None:
+            self._release_capacity()
+
+    def _handle_exit(self, index: int) -> None:
+        process = self.processes[index]
+        process.join(timeout=5)
+        self.done_readers[index].close()
+        delay, crashes = 0.0, 0
+        with self.capacity:
+            orphaned = list(self.assigned[index].values())
+            self.assigned[index] = {}
+            # Cleared under the lock, so _dispatch never queues for the dead process after this point.
+            self.done_readers[index] = None
+            crashed = not self.stop_event.is_set()
+            if crashed:
+                self.crashes[index] += 1
+                crashes = self.crashes[index]
+                if crashes < WORKER_MAX_CONSECUTIVE_CRASHES:
+                    delay = min(WORKER_RESPAWN_BACKOFF_SECONDS * 2 ** (crashes - 1), WORKER_RESPAWN_BACKOFF_MAX_SECONDS)
+                    self.respawn_at[index] = time.monotonic() + delay
+        if process.exitcode != 0 or orphaned:
+            print(f"Model process {index} exited with code {process.exitcode} holding {len(orphaned)} message(s)")
+        # Visible again now instead of after the heartbeat's maximum hold.
+        self._release_messages(orphaned, f"model process {index} exited")
+        if not crashed:
+            return
+        if crashes >= WORKER_MAX_CONSECUTIVE_CRASHES:
+            print(f"Model process {index} crashed {crashes} times without finishing a job; stopping the worker")
+            self.crash_looping = True
+            self.stop()
+        else:
+            print(f"Respawning model process {index} in {delay:.0f}s (crash {crashes} of {WORKER_MAX_CONSECUTIVE_CRASHES})")
+
+    def _respawn_due(self) -> None:
+        now = time.monotonic()
+        with self.capacity:
+            for index, respawn_at in enumerate(self.respawn_at):
+                if respawn_at is None or respawn_at > now or self.stop_event.is_set():
+                    continue
+                self.respawn_at[index] = None
+                self._spawn(index)
+                print(f"Respawned model process {index}")
+                self.capacity.notify_all()
 
-        time.sleep(0.2)
+    def _collect_done(self) -> None:
+        while True:
+            self._respawn_due()
+            with self.capacity:
+                readers = {reader: index for index, reader in enumerate(self.done_readers) if reader is not None}
+                pending = any(respawn_at is not None for respawn_at in self.respawn_at)
+            if not readers:
+                if not pending or self.stop_event.is_set():
+                    return
+                time.sleep(0.5)
+                continue
+            for reader in multiprocessing.connection.wait(list(readers), timeout=1):
+                index = readers[reader]
+                try:
+                    result = reader.recv()
+                except (EOFError, OSError):
+                    self._handle_exit(index)
+                    continue
+                self._handle_result(index, result)
+
+    def _acquire_capacity(self) -> int:
+        with self.capacity:
+            while not self.stop_event.is_set():
+                free = self.max_in_flight - self.in_flight
+                # With every slot waiting out a respawn backoff, received messages could only be bounced back.
+                if free > 0 and any(reader is not None for reader in self.done_readers):
+                    return min(free, 10)
+                self.capacity.wait(timeout=1)
+            return 0
+
+    def _release_unstarted(self) -> None:
+        unstarted = []
+        for index, task_queue in enumerate(self.task_queues):
+            while True:
+                try:
+                    message = task_queue.get_nowait()
+                except queue.Empty:
+                    break
+                with self.capacity:
+                    held = self.assigned[index].pop(message["ReceiptHandle"], None)
+                # Left in a dead process's queue: _handle_exit already released it.
+                if held is not None:
+                    unstarted.append(message)
+        self._release_messages(unstarted, "unstarted on shutdown")
+
+    def run(self) -> None:
+        for index in range(self.process_count):
+            self._spawn(index)
+        collector = threading.Thread(target=self._collect_done, name="done-collector", daemon=True)
+        collector.start()
+
+        while not self.stop_event.is_set():
+            max_messages = self._acquire_capacity()
+            if not max_messages:
+                break
+            try:
+                messages = self.receiver.receive(max_messages)
+            except Exception as exc:
+                print(f"Receive failed, retrying: {exc}")
+                time.sleep(1)
+                continue
+
+            with self.capacity:
+                self.in_flight += len(messages)
+            for message in messages:
+                visibility_heartbeat.track(message["ReceiptHandle"], message["QueueUrl"])
+                self._dispatch(message)
+
+        print("Shutdown requested; draining model processes...")
+        self._release_unstarted()
+        with self.capacity:
+            live = [(process, task_queue) for process, task_queue in zip(self.processes, self.task_queues)]
+        for _, task_queue in live:
+            task_queue.put(None)
+        for process, _ in live:
+            process.join()
+        collector.join()
+        print("Worker drained in-flight jobs; exiting.")
+
+
+def install_shutdown_handler(stop) -> None:
+    def handle_signal(signum, frame) -> None:  # noqa: ARG001
+        print(f"Received signal {signum}; finishing in-flight jobs before exit")
+        stop()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+
+def main() -> None:
+    assert_required_env()
+    if WORKER_PROCESSES > 1:
+        print(
+            f"Worker supervisor started with {WORKER_PROCESSES} model processes "
+            f"(torch_threads={default_threads_per_process(WORKER_PROCESSES)}, max_messages={RECEIVE_MAX_MESSAGES})"
+        )
+        supervisor = ProcessSupervisor(WORKER_PROCESSES)
+        install_shutdown_handler(supervisor.stop)
+        supervisor.run()
+        if supervisor.crash_looping:
+            raise SystemExit(1)
+        return
+
+    models = load_model_pool(WORKER_THREADS_PER_PROCESS)
+    print(
+        "Worker started. Polling transcription queue "
+        f"(max_messages={RECEIVE_MAX_MESSAGES}, batch_size={WORKER_BATCH_SIZE}, "
+        f"chunk_length_s={WHISPER_CHUNK_LENGTH_S}, stride_length_s={WHISPER_STRIDE_LENGTH_S}, "
+        f"ingest_mode={WORKER_INGEST_MODE}, io_threads={WORKER_IO_THREADS}, "
+        f"max_in_flight={WORKER_MAX_IN_FLIGHT}, visibility_timeout={VISIBILITY_TIMEOUT_SECONDS}s, "
+        f"heartbeat={VISIBILITY_HEARTBEAT_SECONDS}s, fast_lane={'on' if FAST_TRANSCRIPTION_QUEUE_URL else 'off'}, "
+        f"model_routes={WHISPER_MODEL_ROUTES or 'none'})..."
+    )
+    scheduler = JobScheduler(models)
+    install_shutdown_handler(scheduler.stop)
+    scheduler.run()
 
 
 if __name__ == "__main__":
@@ -16,6 +16,8 @@ provider "aws" {
 locals {
   users_table_name = "audiotrans-${var.environment}-users"
   jobs_table_name  = "audiotrans-${var.environment}-jobs"
+  # Lets list_jobs read a user's jobs newest first, one page at a time.
+  jobs_created_at_index_name = "clerk_user_id-created_at-index"
 
   common_tags = {
     Project     = "audio-transcription"
@@ -63,6 +65,18 @@ resource "aws_dynamodb_table" "jobs" {
     type = "S"
   }
 
+  attribute {
+    name = "created_at"
+    type = "S"
+  }
+
+  global_secondary_index {
+    name            = local.jobs_created_at_index_name
+    hash_key        = "clerk_user_id"
+    range_key       = "created_at"
+    projection_type = "ALL"
+  }
+
   point_in_time_recovery {
     enabled = true
   }
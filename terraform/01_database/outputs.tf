@@ -18,6 +18,11 @@ output "jobs_table_arn" {
   value       = aws_dynamodb_table.jobs.arn
 }
 
+output "jobs_created_at_index_name" {
+  description = "Jobs GSI (clerk_user_id, created_at) used for paginated job lists."
+  value       = local.jobs_created_at_index_name
+}
+
 output "next_step_note" {
   description = "MVP next step after database module is applied."
   value       = "Database module applied. Essential next step: set USERS_TABLE_NAME and JOBS_TABLE_NAME in .env from terraform outputs. Then run terraform in terraform/02_queues to create transcription/notification queues and DLQs."
@@ -16,6 +16,8 @@ provider "aws" {
 locals {
   transcription_dlq_name = "audiotrans-${var.environment}-transcription-dlq"
   transcription_name     = "audiotrans-${var.environment}-transcription-queue"
+  fast_lane_dlq_name     = "audiotrans-${var.environment}-transcription-fast-dlq"
+  fast_lane_name         = "audiotrans-${var.environment}-transcription-fast-queue"
   notification_dlq_name  = "audiotrans-${var.environment}-notification-dlq"
   notification_name      = "audiotrans-${var.environment}-notification-queue"
 
@@ -58,6 +60,39 @@ resource "aws_sqs_queue_redrive_allow_policy" "transcription_dlq_allow" {
   })
 }
 
+# Fast lane: small uploads (API key prefix audio-fast/) so they never queue behind bulk files.
+resource "aws_sqs_queue" "transcription_fast_dlq" {
+  name                      = local.fast_lane_dlq_name
+  message_retention_seconds = var.dlq_message_retention_seconds
+  sqs_managed_sse_enabled   = true
+
+  tags = local.common_tags
+}
+
+resource "aws_sqs_queue" "transcription_fast" {
+  name                       = local.fast_lane_name
+  visibility_timeout_seconds = var.transcription_visibility_timeout_seconds
+  message_retention_seconds  = var.main_queue_message_retention_seconds
+  receive_wait_time_seconds  = var.receive_wait_time_seconds
+  sqs_managed_sse_enabled    = true
+
+  redrive_policy = jsonencode({
+    deadLetterTargetArn = aws_sqs_queue.transcription_fast_dlq.arn
+    maxReceiveCount     = var.transcription_max_receive_count
+  })
+
+  tags = local.common_tags
+}
+
+resource "aws_sqs_queue_redrive_allow_policy" "transcription_fast_dlq_allow" {
+  queue_url = aws_sqs_queue.transcription_fast_dlq.id
+
+  redrive_allow_policy = jsonencode({
+    redrivePermission = "byQueue"
+    sourceQueueArns   = [aws_sqs_queue.transcription_fast.arn]
+  })
+}
+
 resource "aws_sqs_queue" "notification_dlq" {
   name                      = local.notification_dlq_name
   message_retention_seconds = var.dlq_message_retention_seconds
@@ -23,6 +23,21 @@ output "transcription_dlq_arn" {
   value       = aws_sqs_queue.transcription_dlq.arn
 }
 
+output "transcription_fast_queue_url" {
+  description = "Fast-lane transcription queue URL (small uploads)."
+  value       = aws_sqs_queue.transcription_fast.id
+}
+
+output "transcription_fast_queue_arn" {
+  description = "Fast-lane transcription queue ARN (small uploads)."
+  value       = aws_sqs_queue.transcription_fast.arn
+}
+
+output "transcription_fast_dlq_arn" {
+  description = "Fast-lane transcription dead-letter queue ARN."
+  value       = aws_sqs_queue.transcription_fast_dlq.arn
+}
+
 output "notification_queue_name" {
   description = "Notification queue name."
   value       = aws_sqs_queue.notification.name
@@ -55,5 +70,5 @@ output "next_step_note" {
 
 output "env_update_note" {
   description = "Environment variables to update after queues apply."
-  value       = "Add to .env -> TRANSCRIPTION_QUEUE_URL=<transcription_queue_url>, NOTIFICATION_QUEUE_URL=<notification_queue_url>"
+  value       = "Add to .env -> TRANSCRIPTION_QUEUE_URL=<transcription_queue_url>, FAST_TRANSCRIPTION_QUEUE_URL=<transcription_fast_queue_url>, NOTIFICATION_QUEUE_URL=<notification_queue_url>"
 }
@@ -26,7 +26,7 @@ data "aws_iam_policy_document" "transcription_queue_from_s3" {
     }
 
     actions   = ["sqs:SendMessage"]
-    resources = [var.transcription_queue_arn]
+    resources = [var.transcription_queue_arn, var.transcription_fast_queue_arn]
 
     condition {
       test     = "ArnLike"
@@ -133,6 +133,11 @@ resource "aws_sqs_queue_policy" "transcription_from_s3" {
   policy    = data.aws_iam_policy_document.transcription_queue_from_s3.json
 }
 
+resource "aws_sqs_queue_policy" "transcription_fast_from_s3" {
+  queue_url = var.transcription_fast_queue_url
+  policy    = data.aws_iam_policy_document.transcription_queue_from_s3.json
+}
+
 resource "aws_s3_bucket_notification" "audio_to_transcription_queue" {
   bucket = aws_s3_bucket.audio.id
 
@@ -143,5 +148,13 @@ resource "aws_s3_bucket_notification" "audio_to_transcription_queue" {
     filter_prefix = "audio/"
   }
 
-  depends_on = [aws_sqs_queue_policy.transcription_from_s3]
+  # Small uploads are keyed under audio-fast/ by the API; "audio/" does not overlap it.
+  queue {
+    id            = "audio-fast-object-created"
+    queue_arn     = var.transcription_fast_queue_arn
+    events        = ["s3:ObjectCreated:*"]
+    filter_prefix = "audio-fast/"
+  }
+
+  depends_on = [aws_sqs_queue_policy.transcription_from_s3, aws_sqs_queue_policy.transcription_fast_from_s3]
 }
@@ -20,6 +20,16 @@ variable "transcription_queue_url" {
   type        = string
 }
 
+variable "transcription_fast_queue_arn" {
+  description = "ARN of the fast-lane transcription queue from terraform/02_queues output."
+  type        = string
+}
+
+variable "transcription_fast_queue_url" {
+  description = "URL of the fast-lane transcription queue from terraform/02_queues output."
+  type        = string
+}
+
 variable "audio_expiration_days" {
   description = "Days to retain uploaded audio objects before expiration."
   type        = number
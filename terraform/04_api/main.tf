@@ -49,7 +49,8 @@ data "aws_iam_policy_document" "api_lambda_access" {
     ]
     resources = [
       var.users_table_arn,
-      var.jobs_table_arn
+      var.jobs_table_arn,
+      "${var.jobs_table_arn}/index/*"
     ]
   }
 
@@ -106,16 +107,25 @@ resource "aws_lambda_function" "api" {
   memory_size      = var.lambda_memory_mb
 
   environment {
-    variables = {
-      USERS_TABLE_NAME          = var.users_table_name
-      JOBS_TABLE_NAME           = var.jobs_table_name
-      AUDIO_BUCKET_NAME         = var.audio_bucket_name
-      TRANSCRIPT_BUCKET_NAME    = var.transcript_bucket_name
-      CLERK_JWKS_URL            = var.clerk_jwks_url
-      PRESIGNED_EXPIRES_SECONDS = tostring(var.presigned_expires_seconds)
-      MAX_FILE_SIZE_BYTES       = tostring(var.max_file_size_bytes)
-      CORS_ALLOW_ORIGINS        = join(",", var.cors_allow_origins)
-    }
+    variables = merge({
+      USERS_TABLE_NAME           = var.users_table_name
+      JOBS_TABLE_NAME            = var.jobs_table_name
+      JOBS_CREATED_AT_INDEX_NAME = var.jobs_created_at_index_name
+      AUDIO_BUCKET_NAME          = var.audio_bucket_name
+      TRANSCRIPT_BUCKET_NAME     = var.transcript_bucket_name
+      CLERK_JWKS_URL             = var.clerk_jwks_url
+      PRESIGNED_EXPIRES_SECONDS  = tostring(var.presigned_expires_seconds)
+      MAX_FILE_SIZE_BYTES        = tostring(var.max_file_size_bytes)
+      FAST_LANE_MAX_BYTES        = tostring(var.fast_lane_max_bytes)
+      JOB_BATCH_MAX_FILES        = tostring(var.job_batch_max_files)
+      JOB_CACHE_TTL_SECONDS      = tostring(var.job_cache_ttl_seconds)
+      JOB_WAIT_MAX_SECONDS       = tostring(var.job_wait_max_seconds)
+      TRANSCRIPT_URL_TTL_SECONDS = tostring(var.transcript_url_ttl_seconds)
+      USER_CACHE_TTL_SECONDS     = tostring(var.user_cache_ttl_seconds)
+      CLERK_JWKS_TTL_SECONDS     = tostring(var.clerk_jwks_ttl_seconds)
+      API_METRICS_EMF            = tostring(var.api_metrics_emf)
+      CORS_ALLOW_ORIGINS         = join(",", var.cors_allow_origins)
+    }, var.cold_start_profile ? { PYTHONPROFILEIMPORTTIME = "1" } : {})
   }
 
   tags = local.common_tags
@@ -20,6 +20,12 @@ variable "jobs_table_name" {
   type        = string
 }
 
+variable "jobs_created_at_index_name" {
+  description = "Jobs GSI name from terraform/01_database output. Empty lists jobs from the base table."
+  type        = string
+  default     = "clerk_user_id-created_at-index"
+}
+
 variable "users_table_arn" {
   description = "Users table ARN from terraform/01_database output."
   type        = string
@@ -73,6 +79,12 @@ variable "lambda_memory_mb" {
   default     = 512
 }
 
+variable "cold_start_profile" {
+  description = "Log per-module import times (PYTHONPROFILEIMPORTTIME) on every cold start. For profiling only."
+  type        = bool
+  default     = false
+}
+
 variable "presigned_expires_seconds" {
   description = "Presigned upload expiration time in seconds."
   type        = number
@@ -85,6 +97,54 @@ variable "max_file_size_bytes" {
   default     = 104857600
 }
 
+variable "fast_lane_max_bytes" {
+  description = "Uploads up to this size are keyed under audio-fast/ and go to the fast-lane queue. 0 disables the fast lane. Set it (e.g. 10485760) only after 05_workers has transcription_fast_queue_url, or small uploads are never processed."
+  type        = number
+  default     = 0
+}
+
+variable "user_cache_ttl_seconds" {
+  description = "Seconds the API remembers a user it has written, skipping the users-table write on create_job. 0 disables."
+  type        = number
+  default     = 300
+}
+
+variable "clerk_jwks_ttl_seconds" {
+  description = "Seconds the API reuses Clerk signing keys before re-fetching the JWKS in the background. Unknown key ids are fetched at once."
+  type        = number
+  default     = 3600
+}
+
+variable "api_metrics_emf" {
+  description = "Publish per-request auth time (auth_ms) as CloudWatch EMF metrics in the AudioTranscription/Api namespace."
+  type        = bool
+  default     = true
+}
+
+variable "transcript_url_ttl_seconds" {
+  description = "Lifetime of presigned transcript links returned by ?delivery=redirect (and for transcripts over 4 MB)."
+  type        = number
+  default     = 300
+}
+
+variable "job_wait_max_seconds" {
+  description = "Longest hold for GET /api/jobs/{job_id}/wait. Keep it below the 30s API Gateway integration timeout and lambda_timeout_seconds."
+  type        = number
+  default     = 25
+}
+
+variable "job_batch_max_files" {
+  description = "Most files accepted by one POST /api/jobs:batch call."
+  type        = number
+  default     = 500
+}
+
+variable "job_cache_ttl_seconds" {
+  description = "Seconds a job status read is served from the Lambda's in-process cache. 0 disables the cache."
+  type        = number
+  default     = 2
+}
+
 variable "cors_allow_origins" {
   description = "Allowed origins for HTTP API CORS."
   type        = list(string)
@@ -44,9 +44,10 @@ data "aws_iam_policy_document" "worker_task_policy" {
     actions = [
       "sqs:ReceiveMessage",
       "sqs:DeleteMessage",
+      "sqs:ChangeMessageVisibility",
       "sqs:GetQueueAttributes"
     ]
-    resources = [var.transcription_queue_arn]
+    resources = compact([var.transcription_queue_arn, var.transcription_fast_queue_arn])
   }
 
   statement {
@@ -71,6 +72,21 @@ data "aws_iam_policy_document" "worker_task_policy" {
     ]
   }
 
+  statement {
+    sid    = "TranscriptCacheLookup"
+    effect = "Allow"
+    actions = [
+      "s3:ListBucket"
+    ]
+    resources = [var.transcript_bucket_arn]
+
+    condition {
+      test     = "StringLike"
+      variable = "s3:prefix"
+      values   = ["cache/*"]
+    }
+  }
+
   statement {
     sid    = "JobsTableReadWrite"
     effect = "Allow"
@@ -186,13 +202,37 @@ resource "aws_ecs_task_definition" "transcription" {
       environment = [
         { name = "AWS_REGION", value = var.aws_region },
         { name = "TRANSCRIPTION_QUEUE_URL", value = var.transcription_queue_url },
+        { name = "FAST_TRANSCRIPTION_QUEUE_URL", value = var.transcription_fast_queue_url },
+        { name = "FAST_LANE_WEIGHT", value = tostring(var.fast_lane_weight) },
         { name = "NOTIFICATION_QUEUE_URL", value = var.notification_queue_url },
         { name = "AUDIO_BUCKET_NAME", value = var.audio_bucket_name },
         { name = "TRANSCRIPT_BUCKET_NAME", value = var.transcript_bucket_name },
         { name = "JOBS_TABLE_NAME", value = var.jobs_table_name },
         { name = "WHISPER_MODEL_ID", value = var.whisper_model_id },
-        { name = "POLL_WAIT_SECONDS", value = local.effective_poll_wait_sec }
+        { name = "WHISPER_MODEL_ROUTES", value = var.whisper_model_routes },
+        { name = "WHISPER_MODEL_POOL_MB", value = tostring(var.whisper_model_pool_mb) },
+        { name = "WHISPER_FORCE_LANGUAGE", value = tostring(var.whisper_force_language) },
+        { name = "POLL_WAIT_SECONDS", value = local.effective_poll_wait_sec },
+        { name = "RECEIVE_MAX_MESSAGES", value = tostring(var.receive_max_messages) },
+        { name = "WORKER_BATCH_SIZE", value = tostring(var.worker_batch_size) },
+        { name = "WHISPER_CHUNK_LENGTH_S", value = tostring(var.whisper_chunk_length_s) },
+        { name = "WHISPER_STRIDE_LENGTH_S", value = tostring(var.whisper_stride_length_s) },
+        { name = "WORKER_INGEST_MODE", value = var.worker_ingest_mode },
+        { name = "FFMPEG_DECODE_TIMEOUT_SECONDS", value = tostring(var.ffmpeg_decode_timeout_seconds) },
+        { name = "WORKER_IO_THREADS", value = tostring(var.worker_io_threads) },
+        { name = "WORKER_MAX_IN_FLIGHT", value = tostring(var.worker_max_in_flight) },
+        { name = "WORKER_PREFETCH_AUDIO_MB", value = tostring(var.worker_prefetch_audio_mb) },
+        { name = "VISIBILITY_TIMEOUT_SECONDS", value = tostring(var.visibility_timeout_seconds) },
+        { name = "VISIBILITY_HEARTBEAT_SECONDS", value = tostring(var.visibility_heartbeat_seconds) },
+        { name = "FAILED_JOB_RETRY_DELAY_SECONDS", value = tostring(var.failed_job_retry_delay_seconds) },
+        { name = "WORKER_PROCESSES", value = tostring(var.worker_processes) },
+        { name = "WORKER_MAX_CONSECUTIVE_CRASHES", value = tostring(var.worker_max_consecutive_crashes) },
+        { name = "WORKER_THREADS_PER_PROCESS", value = tostring(var.worker_threads_per_process) },
+        { name = "TRANSCRIPT_CACHE_ENABLED", value = tostring(var.transcript_cache_enabled) },
+        { name = "VAD_ENABLED", value = tostring(var.vad_enabled) },
+        { name = "WORKER_METRICS_EMF", value = tostring(var.worker_metrics_emf) }
       ]
+      stopTimeout = var.worker_stop_timeout_seconds
       logConfiguration = {
         logDriver = "awslogs"
         options = {
@@ -20,6 +20,24 @@ variable "transcription_queue_arn" {
   type        = string
 }
 
+variable "transcription_fast_queue_url" {
+  description = "Fast-lane transcription queue URL from terraform/02_queues. Empty polls only the bulk queue."
+  type        = string
+  default     = ""
+}
+
+variable "transcription_fast_queue_arn" {
+  description = "Fast-lane transcription queue ARN from terraform/02_queues."
+  type        = string
+  default     = ""
+}
+
+variable "fast_lane_weight" {
+  description = "Fast-lane polls per bulk-lane poll while both queues have messages."
+  type        = number
+  default     = 3
+}
+
 variable "notification_queue_url" {
   description = "Notification queue URL from terraform/02_queues."
   type        = string
@@ -72,12 +90,149 @@ variable "whisper_model_id" {
   default     = "openai/whisper-tiny"
 }
 
+variable "whisper_model_routes" {
+  description = "Per-language models as \"lang=model_id,...\" (e.g. \"en=openai/whisper-tiny.en\"). Must match the WHISPER_MODEL_ROUTES the image was built with."
+  type        = string
+  default     = ""
+}
+
+variable "whisper_model_pool_mb" {
+  description = "Memory budget in MiB for loaded Whisper models per model process; least recently used models are evicted beyond it."
+  type        = number
+  default     = 1024
+}
+
+variable "whisper_force_language" {
+  description = "Pass the job language to the decoder instead of auto-detecting it."
+  type        = bool
+  default     = true
+}
+
 variable "poll_wait_seconds" {
   description = "SQS long polling wait time for the worker."
   type        = number
   default     = 20
 }
 
+variable "receive_max_messages" {
+  description = "Messages fetched per SQS receive (1-10). Values above 1 enable batched inference."
+  type        = number
+  default     = 1
+}
+
+variable "worker_batch_size" {
+  description = "Batch size passed to the Whisper pipeline when several messages are processed together."
+  type        = number
+  default     = 4
+}
+
+variable "whisper_chunk_length_s" {
+  description = "Window length in seconds for chunked long-form transcription. 0 disables chunking."
+  type        = number
+  default     = 30
+}
+
+variable "whisper_stride_length_s" {
+  description = "Overlap in seconds on each side of a chunk used to stitch windows together."
+  type        = number
+  default     = 5
+}
+
+variable "worker_ingest_mode" {
+  description = "Audio ingest path: stream (S3 -> ffmpeg -> memory) or tempfile (download to disk first)."
+  type        = string
+  default     = "stream"
+
+  validation {
+    condition     = contains(["stream", "tempfile"], var.worker_ingest_mode)
+    error_message = "worker_ingest_mode must be stream or tempfile."
+  }
+}
+
+variable "ffmpeg_decode_timeout_seconds" {
+  description = "Seconds before a hung ffmpeg decode is killed and the job fails (malformed uploads). 0 disables."
+  type        = number
+  default     = 900
+}
+
+variable "worker_io_threads" {
+  description = "Threads used for S3 downloads/uploads, DynamoDB updates and SQS deletes."
+  type        = number
+  default     = 4
+}
+
+variable "worker_max_in_flight" {
+  description = "Upper bound on messages a task holds locally (received but not yet finished)."
+  type        = number
+  default     = 20
+}
+
+variable "worker_prefetch_audio_mb" {
+  description = "Decoded audio (MB of float32 PCM, ~230 MB per audio hour) a task may hold for jobs waiting on the model. Keep well below task_memory minus the model pool."
+  type        = number
+  default     = 768
+}
+
+variable "visibility_timeout_seconds" {
+  description = "Lease taken on each received message; renewed by the worker heartbeat while the job runs."
+  type        = number
+  default     = 120
+}
+
+variable "visibility_heartbeat_seconds" {
+  description = "How often the worker extends leases on held messages. Must be below visibility_timeout_seconds; 0 disables."
+  type        = number
+  default     = 40
+}
+
+variable "failed_job_retry_delay_seconds" {
+  description = "Delay before a failed job's message becomes visible again for retry."
+  type        = number
+  default     = 30
+}
+
+variable "worker_processes" {
+  description = "Model processes per task sharing one SQS receiver. 1 keeps the single-process scheduler."
+  type        = number
+  default     = 1
+}
+
+variable "worker_max_consecutive_crashes" {
+  description = "With worker_processes > 1: crashes in a row (no job finished) after which a model process slot stops the task so ECS replaces it. Respawns back off 1s, 2s, 4s ... up to 60s until then."
+  type        = number
+  default     = 5
+}
+
+variable "worker_threads_per_process" {
+  description = "torch intra-op threads per model process. 0 splits the task's vCPUs evenly across processes."
+  type        = number
+  default     = 0
+}
+
+variable "worker_stop_timeout_seconds" {
+  description = "Seconds ECS waits after SIGTERM for the worker to drain in-flight jobs (Fargate max 120)."
+  type        = number
+  default     = 120
+}
+
+variable "transcript_cache_enabled" {
+  description = "Reuse transcripts of byte-identical audio (same model and language) from the transcript bucket cache/ prefix."
+  type        = bool
+  default     = true
+}
+
+variable "vad_enabled" {
+  description = "Run the energy/zero-crossing VAD pre-pass and transcribe only speech regions. Off by default; validate with benchmark_vad.py first."
+  type        = bool
+  default     = false
+}
+
+variable "worker_metrics_emf" {
+  description = "Publish per-job stage timings as CloudWatch metrics (Embedded Metric Format in the job_timings log line)."
+  type        = bool
+  default     = true
+}
+
 variable "desired_count" {
   description = "ECS service desired task count."
   type        = number